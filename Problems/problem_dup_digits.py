@@ -68,9 +68,10 @@ def target_function(N: int) -> int:
     return result + has_repeated(N)
 
 
-def random_input() -> Tuple[int]:
+def random_input(rng: random.Random | None = None) -> Tuple[int]:
+    rng = rng or random
     lo, hi = INPUT_SPEC["args"][0]["value_range"]
-    return (random.randint(lo, hi),)
+    return (rng.randint(lo, hi),)
 
 
 def decode_individual(individual_genome):
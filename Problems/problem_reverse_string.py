@@ -36,11 +36,12 @@ def target_function(s: str) -> str:
     return s[::-1]
 
 
-def random_input() -> Tuple[str]:
+def random_input(rng: random.Random | None = None) -> Tuple[str]:
     """Generate a random ASCII string (letters/digits/punct/space) within the specified length."""
-    length = random.randint(*INPUT_SPEC["args"][0]["length_range"])
+    rng = rng or random
+    length = rng.randint(*INPUT_SPEC["args"][0]["length_range"])
     chars = string.ascii_letters + string.digits + string.punctuation + " "
-    generated = "".join(random.choice(chars) for _ in range(length))
+    generated = "".join(rng.choice(chars) for _ in range(length))
     return (generated,)
 
 
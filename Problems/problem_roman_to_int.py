@@ -95,9 +95,10 @@ def _int_to_roman(num: int) -> str:
     return "".join(roman_num)
 
 
-def random_input() -> Tuple[str]:
+def random_input(rng: random.Random | None = None) -> Tuple[str]:
+    rng = rng or random
     # Keep in standard Roman range
-    value = random.randint(1, 3999)
+    value = rng.randint(1, 3999)
     return (_int_to_roman(value),)
 
 
@@ -67,20 +67,21 @@ def target_function(nums: List[int], target: int) -> int:
     return -1
 
 
-def random_input() -> Tuple[List[int], int]:
-    length = random.randint(*INPUT_SPEC["args"][0]["length_range"])
+def random_input(rng: random.Random | None = None) -> Tuple[List[int], int]:
+    rng = rng or random
+    length = rng.randint(*INPUT_SPEC["args"][0]["length_range"])
     lo, hi = INPUT_SPEC["args"][0]["value_range"]
-    base = sorted(random.randint(lo, hi) for _ in range(length))
+    base = sorted(rng.randint(lo, hi) for _ in range(length))
 
     # Rotate by a random pivot
     if length > 1:
-        pivot = random.randint(0, length - 1)
+        pivot = rng.randint(0, length - 1)
         nums = base[pivot:] + base[:pivot]
     else:
         nums = base
 
     lo_t, hi_t = INPUT_SPEC["args"][1]["value_range"]
-    target = random.randint(lo_t, hi_t)
+    target = rng.randint(lo_t, hi_t)
     return nums, target
 
 
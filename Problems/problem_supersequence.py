@@ -70,11 +70,13 @@ def target_function(str1: str, str2: str) -> str:
     return "".join(ans) + str1[i:] + str2[j:]
 
 
-def random_input() -> Tuple[str, str]:
+def random_input(rng: random.Random | None = None) -> Tuple[str, str]:
+    rng = rng or random
+
     def rand_str(length_range):
-        length = random.randint(*length_range)
+        length = rng.randint(*length_range)
         alphabet = string.ascii_letters + string.digits + string.punctuation + " "
-        return "".join(random.choice(alphabet) for _ in range(length))
+        return "".join(rng.choice(alphabet) for _ in range(length))
 
     s1 = rand_str(INPUT_SPEC["args"][0]["length_range"])
     s2 = rand_str(INPUT_SPEC["args"][1]["length_range"])
@@ -64,20 +64,23 @@ def target_function(nums: List[int], target: int) -> List[int]:
     return []
 
 
-def random_input() -> Tuple[List[int], int]:
+def random_input(rng: random.Random | None = None) -> Tuple[List[int], int]:
     """
     Generate a single random input consistent with INPUT_SPEC.
 
     Used for:
     - initializing GA population
     - random baseline
+
+    ``rng`` is the run's random.Random (default: the global random module).
     """
-    nums_len = random.randint(*INPUT_SPEC["args"][0]["length_range"])
+    rng = rng or random
+    nums_len = rng.randint(*INPUT_SPEC["args"][0]["length_range"])
     lo, hi = INPUT_SPEC["args"][0]["value_range"]
-    nums = [random.randint(lo, hi) for _ in range(nums_len)]
+    nums = [rng.randint(lo, hi) for _ in range(nums_len)]
 
     lo_t, hi_t = INPUT_SPEC["args"][1]["value_range"]
-    target = random.randint(lo_t, hi_t)
+    target = rng.randint(lo_t, hi_t)
 
     return nums, target
 
@@ -4,32 +4,33 @@ from typing import Any, Dict
 import importlib
 import random
 
-try:
-    import numpy as np
-except Exception:  # pragma: no cover - numpy optional
-    np = None
-
 from mutation.mutpy_runner import run_mutation_tests
 from config import RANDOM_BASELINE_NUM_TESTS, BASELINE_INCLUDE_BASE_TESTS
 
 
-def run_random_baseline(problem_module_name: str, seed: int | None = None) -> Dict[str, Any]:
-    """Generate RANDOM_BASELINE_NUM_TESTS inputs, score them, and return mutation stats."""
-    if seed is not None:
-        random.seed(seed)
-        if np is not None:
-            try:
-                np.random.seed(seed)
-            except Exception:
-                pass
+def run_random_baseline(
+    problem_module_name: str,
+    seed: int | None = None,
+    num_tests: int | None = None,
+) -> Dict[str, Any]:
+    """
+    Generate ``num_tests`` (default RANDOM_BASELINE_NUM_TESTS) inputs, score them, and return mutation stats.
+
+    Pass a GA run's ``evaluation_budget["inputs"]`` as ``num_tests`` to compare
+    the two at equal cost. Inputs come from a stream seeded with ``seed``
+    (fresh entropy when None); the global RNG is not touched.
+    """
+    num_tests = num_tests or RANDOM_BASELINE_NUM_TESTS
+    rng = random.Random(seed)
     problem_module = importlib.import_module(problem_module_name)
 
-    test_inputs = [problem_module.random_input()
-                   for _ in range(RANDOM_BASELINE_NUM_TESTS)]
+    test_inputs = [problem_module.random_input(rng)
+                   for _ in range(num_tests)]
 
     result = run_mutation_tests(problem_module_name, test_inputs, use_base_tests=BASELINE_INCLUDE_BASE_TESTS)
-    # Short-circuit on timeout to avoid stalling the whole run.
-    if result.get("error") == "timeout":
+    # Short-circuit on timeout to avoid stalling the whole run; a partial
+    # result (scored over the mutants that finished) is kept as is.
+    if result.get("error") == "timeout" and not result.get("partial"):
         return {
             "mutation_score": 0.0,
             "killed": 0,
@@ -38,5 +39,5 @@ def run_random_baseline(problem_module_name: str, seed: int | None = None) -> Di
             "num_tests": len(test_inputs),
             "error": "timeout",
         }
-    result["num_tests"] = RANDOM_BASELINE_NUM_TESTS
+    result["num_tests"] = num_tests
     return result
@@ -6,19 +6,56 @@ NUM_GENERATIONS = 20
 CROSSOVER_RATE = 0.8
 MUTATION_RATE = 0.25
 TOURNAMENT_SIZE = 4
+ELITISM_COUNT = 0             # Best individuals carried unchanged into the next generation (0 = none, the classic GA)
+REUSE_PARENT_FITNESS = True   # Elites and offspring identical to a parent keep its fitness instead of being re-scored
+SEARCH_MODE = "ga"            # "ga" (scalar mutation-score fitness) or "mosa" (per-mutant archive search, ga/mosa.py)
+ISLAND_COUNT = 1              # >1 splits the population over island processes with migration (ga/islands.py)
+ISLAND_MIGRATION_INTERVAL = 3 # Generations between migrations
+ISLAND_MIGRANTS = 2           # Best individuals each island sends to the next one (ring) per migration
+
+# Stopping rules (ga/stopping.py), checked after every generation; all off by default, None disables a rule
+STOP_MAX_SCORE = None             # Best exact fitness at which further search is pointless (e.g. 1.0)
+STOP_STAGNATION_GENERATIONS = None  # Stop after this many generations without a better best fitness
+STOP_DEADLINE_SECONDS = None      # Wall-clock limit per GA run
+STOP_MAX_EVALUATIONS = None       # Cap on suites actually scored per run (cache hits and inherited fitness are free)
 
 # Experiment overrides (short runs to iterate quickly)
 EXPERIMENT_POPULATION_SIZE = 20
 EXPERIMENT_NUM_GENERATIONS = 10
+EXPERIMENT_JOBS = 1  # GA runs / random baselines run_all_experiments runs at once (process pool); main.py --jobs overrides
 
 # Mutation testing configuration
 MAX_RIP_HOPS = 9  # Ignore; leftover example in case you need general constants
 
-MUTATION_TOOL = "mutpy"       # or 'custom', if you roll your own mutator
+MUTATION_TOOL = "mutpy"       # or 'custom' for the native in-process AST engine (mutation/ast_engine.py)
 MUTATION_TIMEOUT_SECONDS = 15 # Slightly higher to reduce timeouts on harder problems
+EVALUATION_JOBS = 1           # Worker processes for population evaluation (1 = serial); main.py --jobs overrides
+BATCH_EVALUATION = True       # Score a whole generation with one scorer invocation (run_mutation_tests_batch)
+COVERAGE_PRUNING = True       # Skip (mutant, test) pairs whose test never reaches the mutated line (mutation/coverage.py)
+TEST_PRIORITIZATION = True    # Run each mutant's pending tests likely killers first and stop at the first kill
+KILL_STATS_PATH = "mutation/mutants_cache/kill_stats.sqlite3"  # Kill history that orders those tests; None keeps it in memory
+MUTANT_LINE_BUDGET = True     # Stop a mutant run after a line-event budget calibrated on the original (killed by timeout); wall clock is a backstop
+MUTANT_LINE_BUDGET_FACTOR = 10   # Budget = this many times the original's line events on the same input...
+MUTANT_LINE_BUDGET_MIN = 1000    # ...but never fewer than this
+MUTANT_SCHEMATA = True        # Native ('custom') mutants run from one meta-function; switching mutants is an int assignment
+MUTANT_REDUCTION = True       # Drop stillborn/TCE-equivalent/duplicate mutants once per problem (mutation/reduction.py)
+MUTANT_REDUCTION_CORPUS_SIZE = 500  # Random inputs used to flag likely-equivalent mutants
+MUTANT_REDUCTION_SEED = 0           # Seed for that corpus (kept separate from GA seeds)
+MUTANT_REDUCTION_DROP_LIKELY_EQUIVALENT = False  # Also drop flagged mutants (random testing cannot prove equivalence)
+MUTANT_CACHE_ENABLED = True   # Generate mutants once per problem source/operator set and reuse them from MUTANTS_CACHE_DIR
+MUTATION_WORKER_POOL = True   # Score cached mutants on warm long-lived workers instead of a fresh process per call
+MUTATION_WORKERS = 1          # Warm workers per evaluating process
+MUTATION_WORKER_MAX_TASKS = 500  # Recycle a worker after this many tasks
+MUTATION_ASYNC_CONCURRENCY = 4   # Max concurrent scorer subprocesses (threads for 'custom') for mutation.async_runner
+MUTATION_WORKSPACE_DIR = None    # Where per-process MutPy harness workspaces live; None = /dev/shm if writable, else temp dir
+
+# Post-run suite minimization (mutation/minimization.py): smallest subset of evaluated inputs with the same kills
+SUITE_MINIMIZATION = True
+SUITE_MINIMIZATION_EXACT_NODES = 100_000  # Branch-and-bound node budget after the greedy cover
 
 # Experiment settings
 RANDOM_BASELINE_NUM_TESTS = 10  # Number of random tests to generate for baseline
+RANDOM_BASELINE_EQUAL_COST = False  # Give the baseline as many random inputs as the GA runs scored on average instead
 NUM_RUNS_PER_PROBLEM = 2         # Repeats to average out randomness in GA
 
 # Paths (you can expand these later if needed)
@@ -26,6 +63,10 @@ RESULTS_DIR = "experiments/results"
 RESULTS_RUN_ID = None  # Set to a string to override auto timestamp per run
 MUTANTS_CACHE_DIR = "mutation/mutants_cache"
 
+# Checkpoints (ga/checkpoint.py): experiment batches save progress under <run_dir>/checkpoints; main.py --resume continues
+CHECKPOINT_INTERVAL = 1  # Generations between GA checkpoints within a run (0 = only between runs)
+JOB_HISTORY_PATH = "mutation/mutants_cache/job_history.sqlite3"  # Wall time per experiment job, for ordering; None = off
+
 # Reproducibility (set to None to sample a fresh seed each run; the chosen seed is recorded in results)
 GLOBAL_RANDOM_SEED = None
 
@@ -34,6 +75,19 @@ GA_INCLUDE_BASE_TESTS = False  # When False, GA fitness is scored only on the in
 INDIVIDUAL_SUITE_SIZE = 3      # How many test inputs a single individual encodes (1 = current behavior)
 BASELINE_INCLUDE_BASE_TESTS = True  # Random baseline still keeps BASE_TESTS for comparison
 
+# Fitness cache: skip re-scoring suites already seen (same suite, problem source and scorer settings)
+FITNESS_CACHE_ENABLED = True
+FITNESS_CACHE_MAX_ENTRIES = 4096  # In-memory LRU size per run
+FITNESS_CACHE_PATH = "mutation/mutants_cache/fitness_cache.sqlite3"  # Shared on-disk tier (WAL); None disables it
+
+# Sampled GA fitness (ga/sampling.py): score suites on a stratified mutant sample, growing it as needed
+FITNESS_SAMPLING = False             # Off = every evaluation uses the full mutant set
+FITNESS_SAMPLE_FRACTION = 0.25       # Initial share of mutants in the sample
+FITNESS_SAMPLE_MIN = 8               # Never sample fewer mutants than this
+FITNESS_SAMPLE_GROWTH = 2.0          # Sample fraction multiplier when rankings get too close to call
+FITNESS_SAMPLE_CLOSE_LIMIT = 0.5     # Grow when more than this share of score pairs have overlapping CIs
+FITNESS_SAMPLE_Z = 1.96              # Confidence level of the intervals (1.96 ~ 95%)
+
 # Problem-specific budget overrides (helps tame long-running problems)
 # Keys are problem module paths; values can set population_size and/or num_generations.
 PROBLEM_BUDGET_OVERRIDES = {
@@ -0,0 +1,120 @@
+"""
+Wall-time history of experiment jobs, for ordering and predicting batches.
+
+Every finished job adds its wall time to a small SQLite table (JOB_HISTORY_PATH)
+keyed by problem, scorer (mutpy_runner.scorer_signature) and budget. A job's
+expected time is the mean of its exact key; failing that, the problem's mean
+time per unit of budget (GA individuals, or baseline tests) under the same
+scorer and job kind, scaled to its budget. The scheduler starts the longest
+expected jobs first and simulates the schedule to predict when the batch
+ends. Times only affect order, never results.
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+import heapq
+import os
+import sqlite3
+
+from config import JOB_HISTORY_PATH
+
+
+class JobHistory:
+    """Mean wall time per (problem, scorer, job kind, budget size)."""
+
+    def __init__(self, db_path: Optional[str] = JOB_HISTORY_PATH):
+        self.db_path = db_path
+        # (problem, scorer, kind, size) -> [total seconds, runs]
+        self.times: Dict[Tuple[str, str, str, int], List[float]] = {}
+        self._conn: Optional[sqlite3.Connection] = None
+        self._load()
+
+    def _db(self) -> Optional[sqlite3.Connection]:
+        """Open the SQLite store; None when disabled or unavailable."""
+        if not self.db_path:
+            return None
+        if self._conn is not None:
+            return self._conn
+        try:
+            directory = os.path.dirname(self.db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS job_times (problem TEXT NOT NULL, scorer TEXT NOT NULL, "
+                "kind TEXT NOT NULL, size INTEGER NOT NULL, seconds REAL NOT NULL, runs INTEGER NOT NULL, "
+                "PRIMARY KEY (problem, scorer, kind, size))"
+            )
+            conn.commit()
+        except sqlite3.Error:
+            self.db_path = None
+            return None
+        self._conn = conn
+        return conn
+
+    def _load(self) -> None:
+        conn = self._db()
+        if conn is None:
+            return
+        try:
+            rows = conn.execute("SELECT problem, scorer, kind, size, seconds, runs FROM job_times").fetchall()
+        except sqlite3.Error:
+            return
+        for problem, scorer, kind, size, seconds, runs in rows:
+            self.times[(problem, scorer, kind, size)] = [seconds, runs]
+
+    def estimate(self, problem: str, scorer: str, kind: str, size: int) -> Optional[float]:
+        """Expected seconds for a job, or None without history for its problem, scorer and kind."""
+        exact = self.times.get((problem, scorer, kind, size))
+        if exact is not None:
+            return exact[0] / exact[1]
+        similar = [
+            (seconds, runs * key[3]) for key, (seconds, runs) in self.times.items()
+            if key[:3] == (problem, scorer, kind) and key[3] > 0
+        ]
+        units = sum(u for _, u in similar)
+        if not units:
+            return None
+        return sum(s for s, _ in similar) / units * size
+
+    def record(self, problem: str, scorer: str, kind: str, size: int, seconds: float) -> None:
+        entry = self.times.setdefault((problem, scorer, kind, size), [0.0, 0])
+        entry[0] += seconds
+        entry[1] += 1
+        conn = self._db()
+        if conn is None:
+            return
+        try:
+            conn.execute(
+                "INSERT INTO job_times (problem, scorer, kind, size, seconds, runs) VALUES (?, ?, ?, ?, ?, 1) "
+                "ON CONFLICT (problem, scorer, kind, size) DO UPDATE SET "
+                "seconds = seconds + excluded.seconds, runs = runs + 1",
+                (problem, scorer, kind, size, seconds),
+            )
+            conn.commit()
+        except sqlite3.Error:
+            pass
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+        self._conn = None
+
+
+def longest_first(estimates: Sequence[Optional[float]]) -> List[int]:
+    """
+    Indices in longest-expected-first order.
+
+    Jobs without history go first: they may be the longest, and running them
+    early means the next batch knows. Ties keep their original order.
+    """
+    return sorted(range(len(estimates)), key=lambda i: (estimates[i] is not None, -(estimates[i] or 0.0)))
+
+
+def predicted_makespan(durations: Sequence[float], workers: int) -> float:
+    """Finish time of ``durations`` started in order, each on the first free of ``workers``."""
+    free_at = [0.0] * max(1, workers)
+    for duration in durations:
+        start = heapq.heappop(free_at)
+        heapq.heappush(free_at, start + duration)
+    return max(free_at)
@@ -6,12 +6,17 @@ Produces:
 - Data for later visualization.
 """
 
-from typing import List, Dict, Any
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any, Dict, List, Optional, Tuple
+import contextlib
 import json
 import os
 import random
+import shutil
+import tempfile
+import time
 from statistics import mean
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from config import (
     RESULTS_DIR,
@@ -20,10 +25,22 @@ from config import (
     NUM_RUNS_PER_PROBLEM,
     EXPERIMENT_NUM_GENERATIONS,
     EXPERIMENT_POPULATION_SIZE,
+    EXPERIMENT_JOBS,
+    JOB_HISTORY_PATH,
     PROBLEM_BUDGET_OVERRIDES,
+    RANDOM_BASELINE_EQUAL_COST,
+    RANDOM_BASELINE_NUM_TESTS,
+    ISLAND_COUNT,
+    SEARCH_MODE,
+    SUITE_MINIMIZATION,
 )
+from ga import checkpoint as checkpoints
 from ga.engine import run_ga_for_problem
+from ga.rng import derive_seed
 from baselines.random_testing import run_random_baseline
+from mutation.minimization import minimize_suite
+from mutation.mutpy_runner import mutant_reduction_report, scorer_signature
+from experiments.job_history import JobHistory, longest_first, predicted_makespan
 
 
 PROBLEMS = [
@@ -40,96 +57,330 @@ def ensure_results_dir(run_dir: str):
     os.makedirs(run_dir, exist_ok=True)
 
 
-def run_all_experiments():
-    # Base seed for this batch (recorded in seeds.txt); per-run seeds derive from this.
-    base_seed = GLOBAL_RANDOM_SEED if GLOBAL_RANDOM_SEED is not None else random.randint(0, 1_000_000)
-    random.seed(base_seed)
+def write_json_atomic(path: str, data: Any) -> None:
+    """Write JSON to a temp file next to ``path`` and move it into place, so readers never see half a file."""
+    fd, tmp_path = tempfile.mkstemp(prefix=".tmp_", suffix=".json", dir=os.path.dirname(path) or ".")
     try:
-        import numpy as np
-        np.random.seed(base_seed)
-    except Exception:
-        pass
-    run_tag = RESULTS_RUN_ID or datetime.now().strftime("%Y%m%d_%H%M%S")
-    run_dir = os.path.join(RESULTS_DIR, run_tag)
-    ensure_results_dir(run_dir)
-    seeds_used = []
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def write_minimized_suite(run_dir: str, problem: str, evaluated_inputs: List[Any]) -> Dict[str, Any] | None:
+    """
+    Minimize every input the GA runs evaluated (plus BASE_TESTS) and save it as <problem>_minimized_suite.json.
+
+    Inputs are stored as repr strings (ast.literal_eval restores them). Returns
+    the summary entry, or None when the scorer has no per-mutant kill data.
+    """
+    result = minimize_suite(problem, evaluated_inputs)
+    if result is None:
+        return None
+    path = os.path.join(run_dir, f"{problem.replace('.', '_')}_minimized_suite.json")
+    write_json_atomic(path, {"problem": problem, **result, "inputs": [repr(t) for t in result["inputs"]]})
+    return {key: value for key, value in result.items() if key not in ("inputs", "killed_ids")} | {"path": path}
 
-    for problem in PROBLEMS:
-        print(f"Running experiments for {problem}...")
-        ga_scores = []
-        random_scores = []
-        ga_runs = []
 
-        # Run GA multiple times to get average behavior
+def experiment_jobs(base_seed: int) -> List[Dict[str, Any]]:
+    """
+    Every GA run and random baseline of the batch, in serial order, each with its own seed.
+
+    Seeds are derived from ``base_seed`` and the job's name (see ga.rng), so a
+    job's seed does not depend on which jobs ran before it, where, or which
+    other problems the batch has.
+    """
+    jobs = []
+    for problem in PROBLEMS:
+        override = PROBLEM_BUDGET_OVERRIDES.get(problem, {})
         for i in range(NUM_RUNS_PER_PROBLEM):
-            run_seed = random.randint(0, 1_000_000)
-            seeds_used.append({"problem": problem, "run_index": i, "seed": run_seed})
-            random.seed(run_seed)
-            try:
-                import numpy as np
-                np.random.seed(run_seed)
-            except Exception:
-                pass
-            override = PROBLEM_BUDGET_OVERRIDES.get(problem, {})
-            pop = override.get("population_size", EXPERIMENT_POPULATION_SIZE)
-            gens = override.get("num_generations", EXPERIMENT_NUM_GENERATIONS)
-            ga_result = run_ga_for_problem(
-                problem,
-                population_size=pop,
-                num_generations=gens,
-                seed=run_seed,
-            )
-            ga_scores.append(ga_result["best_fitness"])
-            ga_runs.append(
-                {
-                    "best_fitness": ga_result["best_fitness"],
-                    "fitness_history": ga_result["fitness_history"],
-                    "avg_fitness_history": ga_result["avg_fitness_history"],
-                }
-            )
-
-        # Single (or multiple) runs for random baseline
-        random_seed = random.randint(0, 1_000_000)
-        seeds_used.append({"problem": problem, "random_seed": random_seed})
-        random.seed(random_seed)
-        try:
-            import numpy as np
-            np.random.seed(random_seed)
-        except Exception:
-            pass
-        random_result = run_random_baseline(problem, seed=random_seed)
-        random_scores.append(random_result["mutation_score"])
-
-        summary = {
-            "problem": problem,
-            "ga_best_scores": ga_scores,
-            "ga_best_score_mean": mean(ga_scores),
-            "ga_runs": ga_runs,
-            "random_scores": random_scores,
-            "random_score_mean": mean(random_scores),
-            "random_details": random_result,
-            "config": {
-                "population_size": EXPERIMENT_POPULATION_SIZE,
-                "num_generations": EXPERIMENT_NUM_GENERATIONS,
-                "num_runs": NUM_RUNS_PER_PROBLEM,
-                "results_run_id": run_tag,
-                "base_seed": base_seed,
-            },
-        }
-
-        out_path = os.path.join(run_dir, f"{problem.replace('.', '_')}_summary.json")
-        with open(out_path, "w") as f:
-            json.dump(summary, f, indent=2)
-
-        print(f"Saved summary to {out_path}")
+            jobs.append({
+                "kind": "ga",
+                "problem": problem,
+                "run_index": i,
+                "seed": derive_seed(base_seed, problem, "run", i),
+                "population_size": override.get("population_size", EXPERIMENT_POPULATION_SIZE),
+                "num_generations": override.get("num_generations", EXPERIMENT_NUM_GENERATIONS),
+            })
+        jobs.append({"kind": "random", "problem": problem, "seed": derive_seed(base_seed, problem, "random")})
+    return jobs
+
+
+def _job_key(job: Dict[str, Any]) -> Dict[str, Any]:
+    """What identifies a job's checkpointed result (num_tests is derived from other jobs' results)."""
+    return {key: value for key, value in job.items() if key != "num_tests"}
+
+
+def _job_name(job: Dict[str, Any]) -> str:
+    suffix = f"run{job['run_index']}" if job["kind"] == "ga" else "random"
+    return f"{job['problem'].replace('.', '_')}_{suffix}"
+
+
+def run_job(
+    job: Dict[str, Any],
+    checkpoint_dir: str,
+    evaluation_jobs: int | None = None,
+    islands: int | None = None,
+    search: str | None = None,
+) -> Dict[str, Any]:
+    """Run one experiment job (in this process, a scheduler worker or a thread) from its own seed."""
+    if job["kind"] == "random":
+        return run_random_baseline(job["problem"], seed=job["seed"], num_tests=job.get("num_tests"))
+    ga_result = run_ga_for_problem(
+        job["problem"],
+        population_size=job["population_size"],
+        num_generations=job["num_generations"],
+        seed=job["seed"],
+        jobs=evaluation_jobs,
+        islands=islands,
+        search=search,
+        checkpoint=os.path.join(checkpoint_dir, f"{_job_name(job)}.pkl"),
+    )
+    return {
+        "best_fitness": ga_result["best_fitness"],
+        "fitness_history": ga_result["fitness_history"],
+        "avg_fitness_history": ga_result["avg_fitness_history"],
+        "fitness_cache": ga_result.get("fitness_cache"),
+        "fitness_sampling": ga_result.get("fitness_sampling"),
+        "best_fitness_estimate": ga_result.get("best_fitness_estimate"),
+        "mutant_execution": ga_result.get("mutant_execution"),
+        "fitness_reuse": ga_result.get("fitness_reuse"),
+        "islands": ga_result.get("islands"),
+        "search": ga_result.get("search", "ga"),
+        "evaluations": ga_result.get("evaluations"),
+        "evaluation_budget": ga_result.get("evaluation_budget"),
+        "stopping": ga_result.get("stopping"),
+        "evaluated_inputs": ga_result.get("evaluated_inputs", []),
+    }
+
+
+def timed_run_job(job: Dict[str, Any], checkpoint_dir: str, *args) -> Tuple[Dict[str, Any], Optional[float]]:
+    """run_job plus its wall time; None when a GA run resumed from a checkpoint (its time would be partial)."""
+    resumed = job["kind"] == "ga" and os.path.exists(os.path.join(checkpoint_dir, f"{_job_name(job)}.pkl"))
+    started = time.monotonic()
+    result = run_job(job, checkpoint_dir, *args)
+    return result, None if resumed else time.monotonic() - started
+
+
+def job_cost_key(job: Dict[str, Any], search: str | None = None, islands: int | None = None) -> Tuple[str, int]:
+    """(kind, size) a job's wall time is recorded under: search mode and islands for GA runs, budget as size."""
+    if job["kind"] == "random":
+        return "random", job.get("num_tests") or RANDOM_BASELINE_NUM_TESTS
+    islands = islands or ISLAND_COUNT
+    kind = f"ga:{search or SEARCH_MODE}" + (f":islands={islands}" if islands > 1 else "")
+    return kind, job["population_size"] * job["num_generations"]
+
+
+def _format_seconds(seconds: float) -> str:
+    minutes, secs = divmod(int(round(seconds)), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{secs:02d}"
+
+
+@contextlib.contextmanager
+def _job_pool(experiment_jobs_count: int):
+    if experiment_jobs_count <= 1:
+        yield None
+        return
+    with ProcessPoolExecutor(max_workers=experiment_jobs_count) as pool:
+        yield pool
+
+
+def _checkpoint_dir(run_dir: str) -> str:
+    return os.path.join(run_dir, "checkpoints")
+
+
+def _batch_key() -> Dict[str, Any]:
+    """What a batch checkpoint must match to be resumed with the current config."""
+    return {
+        "problems": PROBLEMS,
+        "num_runs": NUM_RUNS_PER_PROBLEM,
+        "population_size": EXPERIMENT_POPULATION_SIZE,
+        "num_generations": EXPERIMENT_NUM_GENERATIONS,
+    }
+
+
+def write_summary(run_dir: str, problem: str, ga_runs: List[Dict[str, Any]], random_result: Dict[str, Any],
+                  run_tag: str, base_seed: int) -> str:
+    """Write <problem>_summary.json from the problem's GA runs (in run order) and random baseline."""
+    ga_scores = [run["best_fitness"] for run in ga_runs]
+    random_scores = [random_result["mutation_score"]]
+    summary = {
+        "problem": problem,
+        "ga_best_scores": ga_scores,
+        "ga_best_score_mean": mean(ga_scores),
+        "ga_runs": [{k: v for k, v in run.items() if k != "evaluated_inputs"} for run in ga_runs],
+        "random_scores": random_scores,
+        "random_score_mean": mean(random_scores),
+        "random_details": random_result,
+        "mutant_reduction": mutant_reduction_report(problem),
+        "config": {
+            "population_size": EXPERIMENT_POPULATION_SIZE,
+            "num_generations": EXPERIMENT_NUM_GENERATIONS,
+            "num_runs": NUM_RUNS_PER_PROBLEM,
+            "results_run_id": run_tag,
+            "base_seed": base_seed,
+        },
+    }
+    if SUITE_MINIMIZATION:
+        evaluated_inputs = [test_input for run in ga_runs for test_input in run["evaluated_inputs"]]
+        summary["minimized_suite"] = write_minimized_suite(run_dir, problem, evaluated_inputs)
+    out_path = os.path.join(run_dir, f"{problem.replace('.', '_')}_summary.json")
+    write_json_atomic(out_path, summary)
+    return out_path
+
+
+def run_all_experiments(
+    jobs: int | None = None,
+    islands: int | None = None,
+    search: str | None = None,
+    resume: str | None = None,
+):
+    """
+    Run GA + random baseline for every problem.
+
+    Each GA run and random baseline is a job with a seed derived up front
+    from the batch seed (see experiment_jobs). ``jobs`` (default
+    EXPERIMENT_JOBS) jobs run at once on a process pool; summaries are
+    assembled in run order and written atomically as each problem completes,
+    so the files match a serial batch whatever the completion order. Jobs
+    are dispatched longest expected wall time first, from the times earlier
+    batches recorded (see experiments.job_history), and the predicted batch
+    time is printed up front. ``islands`` and ``search`` are passed to
+    run_ga_for_problem.
+
+    Finished jobs are checkpointed under <run_dir>/checkpoints, and a GA run in
+    progress every CHECKPOINT_INTERVAL generations. ``resume`` is the run
+    directory of an interrupted batch; only its unfinished jobs run again (GA
+    runs from their last saved generation).
+    """
+    if resume is not None:
+        run_dir = resume
+        saved = checkpoints.load(os.path.join(_checkpoint_dir(run_dir), "batch.pkl"), _batch_key())
+        if saved is None:
+            raise FileNotFoundError(f"No batch checkpoint to resume in {run_dir}")
+        base_seed, run_tag = saved["base_seed"], saved["run_tag"]
+    else:
+        # Base seed for this batch (recorded in seeds.txt); per-job seeds derive from this.
+        base_seed = GLOBAL_RANDOM_SEED if GLOBAL_RANDOM_SEED is not None else random.randint(0, 1_000_000)
+        run_tag = RESULTS_RUN_ID or datetime.now().strftime("%Y%m%d_%H%M%S")
+        run_dir = os.path.join(RESULTS_DIR, run_tag)
+        ensure_results_dir(run_dir)
+        # A fresh batch never resumes another batch's jobs.
+        shutil.rmtree(_checkpoint_dir(run_dir), ignore_errors=True)
+    checkpoint_dir = _checkpoint_dir(run_dir)
+    checkpoints.save(
+        os.path.join(checkpoint_dir, "batch.pkl"), _batch_key(), {"base_seed": base_seed, "run_tag": run_tag}
+    )
+
+    all_jobs = experiment_jobs(base_seed)
+    results: Dict[str, Dict[str, Any]] = {}
+    for job in all_jobs:
+        done = checkpoints.load(os.path.join(checkpoint_dir, f"{_job_name(job)}.done.pkl"), _job_key(job))
+        if done is not None:
+            results[_job_name(job)] = done
+    if resume is not None:
+        print(f"Resuming {run_dir}: {len(results)} of {len(all_jobs)} jobs already done")
+
+    by_problem = {problem: [job for job in all_jobs if job["problem"] == problem] for problem in PROBLEMS}
+    ga_done = {problem: False for problem in PROBLEMS}
+
+    workers = jobs or EXPERIMENT_JOBS
+    history = JobHistory(JOB_HISTORY_PATH)
+    scorer = scorer_signature()
+
+    def estimate(job: Dict[str, Any]) -> Optional[float]:
+        return history.estimate(job["problem"], scorer, *job_cost_key(job, search, islands))
+
+    pending = [job for job in all_jobs if _job_name(job) not in results]
+    estimates = [estimate(job) for job in pending]
+    known = [e for e in estimates if e is not None]
+    if known:
+        # Jobs without history are assumed average.
+        durations = [e if e is not None else mean(known) for e in estimates]
+        order = longest_first(estimates) if workers > 1 else range(len(pending))
+        makespan = predicted_makespan([durations[i] for i in order], workers)
+        finish_at = (datetime.now() + timedelta(seconds=makespan)).strftime("%H:%M:%S")
+        print(
+            f"Predicted batch time: {_format_seconds(makespan)} (done around {finish_at}); "
+            f"{len(estimates) - len(known)} of {len(pending)} jobs without history"
+        )
+
+    with _job_pool(workers) as pool:
+        futures: Dict[Any, Dict[str, Any]] = {}
+
+        def submit(job: Dict[str, Any]) -> None:
+            if _job_name(job) in results:
+                finish(job, results[_job_name(job)])
+            elif pool is None:
+                finish(job, *timed_run_job(job, checkpoint_dir, None, islands, search))
+            else:
+                futures[pool.submit(timed_run_job, job, checkpoint_dir, None, islands, search)] = job
+
+        def finish(job: Dict[str, Any], result: Dict[str, Any], seconds: Optional[float] = None) -> None:
+            name = _job_name(job)
+            if name not in results:
+                checkpoints.save(os.path.join(checkpoint_dir, f"{name}.done.pkl"), _job_key(job), result)
+                checkpoints.remove(os.path.join(checkpoint_dir, f"{name}.pkl"))
+                results[name] = result
+            if seconds is not None:
+                history.record(job["problem"], scorer, *job_cost_key(job, search, islands), seconds)
+            problem = job["problem"]
+            ga_jobs, random_job = by_problem[problem][:-1], by_problem[problem][-1]
+            if job["kind"] == "ga" and not ga_done[problem] and all(_job_name(j) in results for j in ga_jobs):
+                ga_done[problem] = True
+                if RANDOM_BASELINE_EQUAL_COST:
+                    # Equal cost: as many random inputs as a GA run scored on average, so it waits for them.
+                    scored = [results[_job_name(j)]["evaluation_budget"]["inputs"] for j in ga_jobs
+                              if results[_job_name(j)].get("evaluation_budget")]
+                    random_job["num_tests"] = round(mean(scored)) if scored else None
+                    submit(random_job)
+            if all(_job_name(j) in results for j in by_problem[problem]):
+                out_path = write_summary(
+                    run_dir, problem, [results[_job_name(j)] for j in ga_jobs], results[_job_name(random_job)],
+                    run_tag, base_seed,
+                )
+                print(f"Saved summary to {out_path}")
+
+        initial = [job for job in all_jobs if not (job["kind"] == "random" and RANDOM_BASELINE_EQUAL_COST)]
+        if pool is None:
+            for problem in PROBLEMS:
+                print(f"Running experiments for {problem}...")
+                for job in initial:
+                    if job["problem"] == problem:
+                        submit(job)
+        else:
+            for job in initial:
+                if _job_name(job) in results:
+                    submit(job)
+            to_run = [job for job in initial if _job_name(job) not in results]
+            print(f"Running {len(to_run)} jobs on {workers} workers...")
+            # Longest expected first: the heaviest jobs must not start last.
+            for idx in longest_first([estimate(job) for job in to_run]):
+                submit(to_run[idx])
+        while futures:
+            finished, _ = wait(list(futures), return_when=FIRST_COMPLETED)
+            for future in finished:
+                finish(futures.pop(future), *future.result())
+    history.close()
 
     # Write seeds used for this batch
     seeds_path = os.path.join(run_dir, "seeds_used.txt")
     with open(seeds_path, "w") as sf:
         sf.write(f"base_seed={base_seed}\n")
-        for entry in seeds_used:
+        for job in all_jobs:
+            if job["kind"] == "ga":
+                entry = {"problem": job["problem"], "run_index": job["run_index"], "seed": job["seed"]}
+            else:
+                entry = {"problem": job["problem"], "random_seed": job["seed"]}
             sf.write(json.dumps(entry) + "\n")
     print(f"Recorded seeds to {seeds_path}")
+    shutil.rmtree(checkpoint_dir, ignore_errors=True)
 
 
 if __name__ == "__main__":
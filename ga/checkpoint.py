@@ -0,0 +1,54 @@
+"""
+Checkpoints for long GA runs and experiment batches.
+
+A checkpoint is a pickled dict written atomically (temp file + os.replace),
+so an interruption leaves either the previous checkpoint or the new one.
+GA checkpoints hold the loop state at the start of a generation: population,
+fitnesses, histories, best-so-far, counters, the fitness-cache LRU and the
+run's RNG state. Restoring them and continuing gives the same result
+as never stopping. Each checkpoint records the run it belongs to (``run``),
+and loading one written for another run raises ValueError.
+"""
+
+from typing import Any, Dict, Optional
+import os
+import pickle
+import tempfile
+
+FORMAT_VERSION = 2
+
+
+def save(path: str, run: Dict[str, Any], state: Dict[str, Any]) -> None:
+    """Atomically write ``state`` for ``run`` (the parameters that identify it) to ``path``."""
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix=".checkpoint_", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump({"version": FORMAT_VERSION, "run": run, "state": state}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def load(path: str, run: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """The state saved at ``path``, or None when there is none; ValueError if it belongs to another run."""
+    try:
+        with open(path, "rb") as f:
+            data = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    if data.get("version") != FORMAT_VERSION or data.get("run") != run:
+        raise ValueError(f"checkpoint {path} was written for a different run: {data.get('run')}")
+    return data["state"]
+
+
+def remove(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
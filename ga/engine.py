@@ -1,18 +1,40 @@
 """GA loop: initialize, evaluate, evolve population, and track best fitness."""
 
-from typing import Dict, Any, List, Tuple
+from typing import Any, Callable, Dict, List, Tuple
 import importlib
 import random
+import time
 
 from config import (
     POPULATION_SIZE,
     NUM_GENERATIONS,
     GLOBAL_RANDOM_SEED,
     PROBLEM_BUDGET_OVERRIDES,
+    FITNESS_CACHE_ENABLED,
+    FITNESS_CACHE_PATH,
+    FITNESS_SAMPLING,
+    ELITISM_COUNT,
+    REUSE_PARENT_FITNESS,
+    ISLAND_COUNT,
+    SEARCH_MODE,
+    CHECKPOINT_INTERVAL,
 )
+from mutation.mutpy_runner import execution_stats
+from . import checkpoint as checkpoints
 from .representation import population_init
 from .operators import tournament_selection, crossover, mutate
-from .evaluation import evaluate_population
+from .evaluation import evaluate_population, evaluation_pool, score_suite
+from .fitness_cache import FitnessCache
+from .sampling import FitnessSampler
+from .stopping import EvaluationBudget, SearchState, default_rules, should_stop
+
+
+def _inherited(child: Any, parents: List[Tuple[Any, int]], known: List[Tuple[float, Any]]):
+    """The (fitness, suite) of the parent ``child`` is an unchanged copy of, else None."""
+    for parent, idx in parents:
+        if child is parent or child == parent:
+            return known[idx]
+    return None
 
 
 def run_ga_for_problem(
@@ -20,70 +42,255 @@ def run_ga_for_problem(
     population_size: int | None = None,
     num_generations: int | None = None,
     seed: int | None = None,
+    jobs: int | None = None,
+    islands: int | None = None,
+    migrate: Callable | None = None,
+    search: str | None = None,
+    stopping: List[Any] | None = None,
+    checkpoint: str | None = None,
 ) -> Dict[str, Any]:
-    """Run the GA for a problem module and return best individual, fitness, and histories."""
-    # Seed RNGs: prefer per-run seed, else config seed (may be None).
+    """
+    Run the GA for a problem module and return best individual, fitness, and histories.
+
+    ``jobs`` > 1 scores each generation on a process pool (defaults to EVALUATION_JOBS);
+    results match the serial path for the same seed. With FITNESS_SAMPLING,
+    generations are scored on a growing mutant sample (see ga.sampling) and
+    the final best suite is re-scored on the full mutant set. ``mutant_execution``
+    reports how many tests each mutant run executed (scoring done in this process).
+
+    The ELITISM_COUNT best individuals are carried over unchanged each
+    generation. With REUSE_PARENT_FITNESS, elites and offspring identical to
+    a parent keep that parent's fitness instead of being re-scored (while the
+    mutant sample is unchanged); ``fitness_reuse`` counts them.
+
+    ``islands`` > 1 (default ISLAND_COUNT) splits the population over that many
+    island processes with periodic migration (see ga.islands). ``migrate`` is
+    the hook an island uses for that: called at the start of every generation
+    after the first as ``migrate(gen, population, fitnesses, suites)`` and
+    returning the (possibly updated) three lists.
+
+    ``search`` = "mosa" (default SEARCH_MODE) runs the per-mutant archive
+    search of ga.mosa instead, when a cached mutant set provides per-mutant
+    results; islands do not apply to it.
+
+    ``stopping`` lists the stopping rules (see ga.stopping; defaults to the
+    STOP_* rules in config). They are checked after each generation's stats
+    are recorded, and ``stopping`` in the result gives the rule that ended the
+    run (None if it used every generation). ``evaluations`` counts suites
+    scored (see ga.stopping); ``evaluation_budget`` adds the inputs in them.
+
+    ``checkpoint`` is a file the loop state is saved to every
+    CHECKPOINT_INTERVAL generations (see ga.checkpoint). If it already holds a
+    checkpoint of this run (same problem, budgets and seed), the run resumes
+    from it and returns what an uninterrupted run would, whatever the shared
+    fitness store gained meanwhile; ``mutant_execution`` then only counts the
+    work done after resuming, and ``shared_hits`` may differ. Island and MOSA runs are
+    not checkpointed.
+    """
+    # The run's own stream: per-run seed, else config seed (None = fresh entropy). The global RNG is never touched.
     effective_seed = seed if seed is not None else GLOBAL_RANDOM_SEED
-    if effective_seed is not None:
-        random.seed(effective_seed)
-        try:
-            import numpy as np
-            np.random.seed(effective_seed)
-        except Exception:
-            pass
+    rng = random.Random(effective_seed)
 
     # Allow experiments or problem-specific overrides to adjust budgets; fall back to config values.
     override = PROBLEM_BUDGET_OVERRIDES.get(problem_module_name, {})  # lets heavy problems run with smaller budgets
     population_size = population_size or override.get("population_size") or POPULATION_SIZE
     num_generations = num_generations or override.get("num_generations") or NUM_GENERATIONS
+    rules = default_rules() if stopping is None else stopping
+    if (search or SEARCH_MODE) == "mosa":
+        from .mosa import run_mosa
+
+        result = run_mosa(problem_module_name, population_size, num_generations, rules, rng)
+        if result is not None:
+            return result
+    islands = islands or ISLAND_COUNT
+    if islands > 1:
+        from .islands import run_islands
+
+        return run_islands(
+            problem_module_name, islands, population_size, num_generations, effective_seed, stopping=rules
+        )
 
     problem_module = importlib.import_module(problem_module_name)
     decode_fn = getattr(problem_module, "decode_individual")
 
+    # Seeds the suites' top-up inputs (see build_suite); an unseeded run draws one from its fresh stream.
+    suite_seed = effective_seed if effective_seed is not None else rng.getrandbits(32)
+
     # 1. Initialize population
-    population = population_init(problem_module, population_size)
+    population = population_init(problem_module, population_size, rng)
+
+    cache = FitnessCache(db_path=FITNESS_CACHE_PATH) if FITNESS_CACHE_ENABLED else None
+    execution_before = execution_stats(problem_module_name)
+    sampler = FitnessSampler(problem_module_name) if FITNESS_SAMPLING else None
+    budget = EvaluationBudget()
+    started = time.monotonic()
+    stop_reason = None
+    run = {
+        "problem": problem_module_name,
+        "population_size": population_size,
+        "num_generations": num_generations,
+        "seed": effective_seed,
+    }
+    saved = checkpoints.load(checkpoint, run) if checkpoint else None
+    with evaluation_pool(jobs) as pool:
+        if saved is None:
+            # 2. Evaluate initial population (repeated genomes are served from the fitness cache)
+            inputs_seen: Dict[str, Any] = {}
+            fitnesses = evaluate_population(
+                population, problem_module_name, decode_fn, cache, pool, sampler,
+                inputs_seen=inputs_seen, budget=budget, suite_seed=suite_seed,
+            )
+            scored_variant = sampler.variant() if sampler is not None else ""
+            reused, evaluated = 0, len(population)
+
+            best_individual = None
+            best_fitness = -1.0
+            best_suite = None
+            best_sampled = False
+            fitness_history = []
+            avg_fitness_history = []
+            best_history = []
+            start_gen = 0
+        else:
+            # Pick up at the start of the saved generation, exactly as the uninterrupted run did.
+            start_gen = saved["generation"]
+            population, fitnesses = saved["population"], saved["fitnesses"]
+            inputs_seen = saved["inputs_seen"]
+            scored_variant = saved["scored_variant"]
+            reused, evaluated = saved["reused"], saved["evaluated"]
+            best_individual, best_fitness = saved["best_individual"], saved["best_fitness"]
+            best_suite, best_sampled = saved["best_suite"], saved["best_sampled"]
+            fitness_history = saved["fitness_history"]
+            avg_fitness_history = saved["avg_fitness_history"]
+            best_history = saved["best_history"]
+            budget.suites, budget.inputs = saved["budget"]
+            started = time.monotonic() - saved["elapsed"]
+            if sampler is not None:
+                vars(sampler).update(saved["sampler"])
+            if cache is not None:
+                cache.hits, cache.misses, cache.shared_hits = saved["cache_counts"]
+                cache._lru.update(saved["cache_lru"])
+            rng.setstate(saved["rng"])
 
-    # 2. Evaluate initial population
-    fitnesses = evaluate_population(population, problem_module_name, decode_fn)
+        for gen in range(start_gen, num_generations):
+            if checkpoint and CHECKPOINT_INTERVAL > 0 and gen % CHECKPOINT_INTERVAL == 0 and (
+                gen > start_gen or saved is None
+            ):
+                checkpoints.save(checkpoint, run, {
+                    "generation": gen,
+                    "population": population,
+                    "fitnesses": fitnesses,
+                    "inputs_seen": inputs_seen,
+                    "scored_variant": scored_variant,
+                    "reused": reused,
+                    "evaluated": evaluated,
+                    "best_individual": best_individual,
+                    "best_fitness": best_fitness,
+                    "best_suite": best_suite,
+                    "best_sampled": best_sampled,
+                    "fitness_history": fitness_history,
+                    "avg_fitness_history": avg_fitness_history,
+                    "best_history": best_history,
+                    "budget": (budget.suites, budget.inputs),
+                    "elapsed": time.monotonic() - started,
+                    # The mutant set is reloaded from the mutant cache on resume.
+                    "sampler": {k: v for k, v in vars(sampler).items() if k != "mutant_set"} if sampler else None,
+                    "cache_counts": (cache.hits, cache.misses, cache.shared_hits) if cache is not None else None,
+                    "cache_lru": list(cache._lru.items()) if cache is not None else None,
+                    "rng": rng.getstate(),
+                })
+            if migrate is not None and gen > 0:
+                suites = sampler.last_suites if sampler is not None else [None] * len(population)
+                population, fitnesses, suites = migrate(gen, population, fitnesses, suites)
+                if sampler is not None:
+                    sampler.last_suites = suites
 
-    best_individual = None
-    best_fitness = -1.0
-    fitness_history = []
-    avg_fitness_history = []
+            # Track stats
+            gen_best_index = max(range(len(population)), key=lambda i: fitnesses[i])
+            gen_best_fitness = fitnesses[gen_best_index]
+            gen_avg_fitness = sum(fitnesses) / len(fitnesses)
 
-    for gen in range(num_generations):
-        # Track stats
-        gen_best_index = max(range(len(population)), key=lambda i: fitnesses[i])
-        gen_best_fitness = fitnesses[gen_best_index]
-        gen_avg_fitness = sum(fitnesses) / len(fitnesses)
+            fitness_history.append(gen_best_fitness)
+            avg_fitness_history.append(gen_avg_fitness)
 
-        fitness_history.append(gen_best_fitness)
-        avg_fitness_history.append(gen_avg_fitness)
+            if gen_best_fitness > best_fitness:
+                best_fitness = gen_best_fitness
+                best_individual = population[gen_best_index]
+                if sampler is not None:
+                    best_suite = sampler.last_suites[gen_best_index]
+                    best_sampled = sampler.active
 
-        if gen_best_fitness > best_fitness:
-            best_fitness = gen_best_fitness
-            best_individual = population[gen_best_index]
+            if sampler is not None:
+                # Scores too close to rank: the next generation gets a larger mutant sample.
+                sampler.update(gen, fitnesses)
+            best_history.append(best_fitness)
+            if gen == num_generations - 1:
+                # Offspring bred now would be scored but never recorded.
+                break
 
-        # 3. Create new population via selection + crossover + mutation
-        new_population = []
-        while len(new_population) < len(population):
-            parent1 = tournament_selection(population, fitnesses)
-            parent2 = tournament_selection(population, fitnesses)
+            # 3. Create new population: elites, then selection + crossover + mutation
+            reuse = REUSE_PARENT_FITNESS and (sampler is None or sampler.variant() == scored_variant)
+            elite_count = min(len(population), max(0, ELITISM_COUNT))
+            state = SearchState(
+                gen, best_history, not best_sampled, time.monotonic() - started, budget.suites,
+                len(population) - (elite_count if reuse else 0),
+            )
+            stop_reason = should_stop(rules, state)
+            if stop_reason is not None:
+                break
+            suites = sampler.last_suites if sampler is not None else [None] * len(population)
+            known = list(zip(fitnesses, suites))
+            index_of = {id(individual): idx for idx, individual in enumerate(population)}
+            elites = sorted(range(len(population)), key=lambda i: -fitnesses[i])[:elite_count]
+            new_population = [population[idx] for idx in elites]
+            inherited = [known[idx] if reuse else None for idx in elites]
+            while len(new_population) < len(population):
+                parent1 = tournament_selection(population, fitnesses, rng)
+                parent2 = tournament_selection(population, fitnesses, rng)
+                parents = [(parent1, index_of[id(parent1)]), (parent2, index_of[id(parent2)])]
 
-            child1, child2 = crossover(parent1, parent2, problem_module)
-            child1 = mutate(child1, problem_module)
-            child2 = mutate(child2, problem_module)
+                child1, child2 = crossover(parent1, parent2, problem_module, rng)
+                child1 = mutate(child1, problem_module, rng)
+                child2 = mutate(child2, problem_module, rng)
 
-            new_population.append(child1)
-            if len(new_population) < len(population):
-                new_population.append(child2)
+                for child in (child1, child2):
+                    if len(new_population) < len(population):
+                        new_population.append(child)
+                        inherited.append(_inherited(child, parents, known) if reuse else None)
 
-        population = new_population
-        fitnesses = evaluate_population(population, problem_module_name, decode_fn)
+            population = new_population
+            reused += sum(1 for entry in inherited if entry is not None)
+            evaluated += len(population)
+            scored_variant = sampler.variant() if sampler is not None else ""
+            fitnesses = evaluate_population(
+                population, problem_module_name, decode_fn, cache, pool, sampler, inherited, inputs_seen, budget,
+                suite_seed,
+            )
+        if migrate is not None and hasattr(migrate, "close"):
+            # Let the island waiting on this one's migrants go on alone.
+            migrate.close()
 
-    return {
+    result = {
         "best_individual": best_individual,
         "best_fitness": best_fitness,
         "fitness_history": fitness_history,
         "avg_fitness_history": avg_fitness_history,
+        "fitness_reuse": {"individuals": evaluated, "inherited": reused},
+        "evaluated_inputs": list(inputs_seen.values()),
+        "evaluations": budget.suites,
+        "evaluation_budget": budget.stats(),
+        "stopping": {"reason": stop_reason, "generations": len(fitness_history)},
     }
+    if sampler is not None:
+        if best_sampled and best_suite is not None:
+            # Sampled scores are estimates: report the best suite's exact score on every mutant.
+            result["best_fitness_estimate"] = best_fitness
+            result["best_fitness"] = score_suite(problem_module_name, best_suite)["mutation_score"]
+        result["fitness_sampling"] = sampler.stats()
+    execution = execution_stats(problem_module_name, since=execution_before)
+    if execution is not None:
+        result["mutant_execution"] = execution
+    if cache is not None:
+        result["fitness_cache"] = cache.stats()
+        cache.close()
+    return result
@@ -1,42 +1,226 @@
 """Fitness helpers: compute mutation-score fitness for individuals/suites."""
 
-from typing import Any, List
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+import atexit
+import contextlib
 import importlib
+import random
+import shutil
+import tempfile
 
-from mutation.mutpy_runner import run_mutation_tests
-from config import GA_INCLUDE_BASE_TESTS, INDIVIDUAL_SUITE_SIZE
+from mutation.kill_matrix import input_key
+from mutation.mutpy_runner import run_mutation_tests, run_mutation_tests_batch
+from config import GA_INCLUDE_BASE_TESTS, INDIVIDUAL_SUITE_SIZE, EVALUATION_JOBS, BATCH_EVALUATION
+from .fitness_cache import FitnessCache, fitness_key
+from .rng import derive_seed
+from .sampling import FitnessSampler
+from .stopping import EvaluationBudget
+
+
+def build_suite(problem_module, decoded_input: Any, seed: int = 0) -> List[Any]:
+    """
+    Turn a decoded genome into the small test suite that is scored for it.
+
+    Top-up inputs are drawn from a stream seeded by the run's ``seed`` and the
+    genome, so within a run a genome always gets the same suite and a cached
+    fitness belongs to it, while runs with different seeds draw different top-ups.
+    """
+    # Optional hook: problem module can provide suite_from_individual to build a small suite from a genome.
+    if hasattr(problem_module, "suite_from_individual"):
+        return problem_module.suite_from_individual(decoded_input)
+    suite_size = max(1, INDIVIDUAL_SUITE_SIZE)
+    test_inputs = [decoded_input]
+    rng = random.Random(derive_seed(seed, "suite", repr(decoded_input)))
+    while len(test_inputs) < suite_size:
+        # Top up the suite with extra random cases to give each individual more chances to kill mutants.
+        test_inputs.append(problem_module.random_input(rng))
+    return test_inputs
+
+
+def score_suite(
+    problem_module_name: str,
+    test_inputs: List[Any],
+    mutant_ids: Optional[List[int]] = None,
+) -> Dict[str, Any]:
+    """Score one GA suite (on a mutant sample if ``mutant_ids``); module-level so process-pool workers can run it."""
+    return run_mutation_tests(
+        problem_module_name, test_inputs, use_base_tests=GA_INCLUDE_BASE_TESTS, mutant_ids=mutant_ids
+    )
+
+
+def score_suites(
+    problem_module_name: str,
+    suites: List[List[Any]],
+    mutant_ids: Optional[List[int]] = None,
+) -> List[Dict[str, Any]]:
+    """Score several suites, in one scorer invocation when BATCH_EVALUATION is on."""
+    if BATCH_EVALUATION:
+        return run_mutation_tests_batch(
+            problem_module_name, suites, use_base_tests=GA_INCLUDE_BASE_TESTS, mutant_ids=mutant_ids
+        )
+    return [score_suite(problem_module_name, suite, mutant_ids) for suite in suites]
+
+
+def _chunks(items: List[Any], count: int) -> List[List[Any]]:
+    """Split items into at most ``count`` contiguous, nearly equal chunks."""
+    count = max(1, min(count, len(items)))
+    size, extra = divmod(len(items), count)
+    chunks, start = [], 0
+    for i in range(count):
+        end = start + size + (1 if i < extra else 0)
+        chunks.append(items[start:end])
+        start = end
+    return chunks
+
+
+def _init_worker() -> None:
+    """Give each pool worker its own temp directory for generated tests and payloads."""
+    worker_tmp = tempfile.mkdtemp(prefix="evobug_worker_")
+    tempfile.tempdir = worker_tmp
+    atexit.register(shutil.rmtree, worker_tmp, True)
+
+
+@contextlib.contextmanager
+def evaluation_pool(jobs: Optional[int] = None):
+    """Yield a process pool for parallel evaluation, or None when running serially."""
+    jobs = jobs or EVALUATION_JOBS
+    if jobs <= 1:
+        yield None
+        return
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker) as pool:
+        yield pool
 
 
 def evaluate_individual(
     individual: Any,
     problem_module_name: str,
     decode_fn,
+    cache: Optional[FitnessCache] = None,
+    sampler: Optional[FitnessSampler] = None,
+    suite_seed: int = 0,
 ) -> float:
-    """Decode a genome, build a small test suite, and return its mutation-score fitness."""
-    problem_module = importlib.import_module(problem_module_name)
-    decoded_input = decode_fn(individual)
-
-    # Optional hook: problem module can provide suite_from_individual to build a small suite from a genome.
-    if hasattr(problem_module, "suite_from_individual"):
-        test_inputs = problem_module.suite_from_individual(decoded_input)
-    else:
-        suite_size = max(1, INDIVIDUAL_SUITE_SIZE)
-        test_inputs = [decoded_input]
-        while len(test_inputs) < suite_size:
-            # Top up the suite with fresh random cases to give each individual more chances to kill mutants.
-            test_inputs.append(problem_module.random_input())
+    """
+    Decode a genome, build a small test suite, and return its mutation-score fitness.
 
-    result = run_mutation_tests(problem_module_name, test_inputs, use_base_tests=GA_INCLUDE_BASE_TESTS)
-    return result["mutation_score"]
+    With an active ``sampler`` the fitness is estimated on its mutant sample.
+    """
+    return evaluate_population(
+        [individual], problem_module_name, decode_fn, cache, sampler=sampler, suite_seed=suite_seed
+    )[0]
 
 
 def evaluate_population(
     population: List[Any],
     problem_module_name: str,
     decode_fn,
+    cache: Optional[FitnessCache] = None,
+    pool: Optional[Executor] = None,
+    sampler: Optional[FitnessSampler] = None,
+    inherited: Optional[List[Optional[Tuple[float, Optional[List[Any]]]]]] = None,
+    inputs_seen: Optional[Dict[str, Any]] = None,
+    budget: Optional[EvaluationBudget] = None,
+    suite_seed: int = 0,
 ) -> List[float]:
-    """Score every individual in the population."""
-    return [
-        evaluate_individual(individual, problem_module_name, decode_fn)
-        for individual in population
-    ]
+    """
+    Score every individual in the population.
+
+    Suites are built here (see build_suite; top-ups are seeded by
+    ``suite_seed``), whether scoring then runs serially or on ``pool``;
+    results come back in order, so a parallel run yields the
+    same fitnesses as the serial path. The fitness cache is keyed on the whole
+    suite that is scored. With an active
+    ``sampler`` fitnesses are estimates on its mutant sample, and the suites
+    are kept on ``sampler.last_suites`` so the GA can re-score one in full.
+
+    ``inherited`` gives, per individual, a (fitness, suite) pair already known
+    for an identical genome (an unchanged offspring or an elite), or None.
+    Those individuals are neither decoded nor scored. Identical genomes within
+    the population are scored once, with or without ``cache``.
+
+    ``inputs_seen`` collects every input of the suites built here, keyed by
+    input_key (for post-run suite minimization). ``budget`` is charged for
+    the suites actually scored, and for those the shared tier of ``cache``
+    served instead (see ga.fitness_cache).
+    """
+    problem_module = importlib.import_module(problem_module_name)
+    mutant_ids = sampler.ids if sampler is not None else None
+    variant = sampler.variant() if sampler is not None else ""
+    built_suites: List[Optional[List[Any]]] = []
+    fitnesses: List[Optional[float]] = [None] * len(population)
+    pending_keys: Dict[str, int] = {}
+    duplicates: List[tuple] = []
+    jobs: List[tuple] = []
+
+    for idx, individual in enumerate(population):
+        known = inherited[idx] if inherited is not None else None
+        if known is not None:
+            fitnesses[idx], suite = known
+            built_suites.append(suite)
+            continue
+        decoded_input = decode_fn(individual)
+        test_inputs = build_suite(problem_module, decoded_input, suite_seed)
+        built_suites.append(test_inputs)
+        if inputs_seen is not None:
+            for test_input in test_inputs:
+                inputs_seen.setdefault(input_key(test_input), test_input)
+        key = None
+        if cache is not None:
+            key = fitness_key(problem_module_name, test_inputs, variant)
+        dedupe_key = key if key is not None else repr(test_inputs)
+        if dedupe_key in pending_keys:
+            # Same genome earlier in this batch: reuse its score, as the serial cache would.
+            if cache is not None:
+                cache.hits += 1
+            duplicates.append((idx, pending_keys[dedupe_key]))
+            continue
+        stored = None
+        if cache is not None:
+            cached, shared = cache.lookup(key)
+            if cached is not None and not shared:
+                fitnesses[idx] = cached
+                continue
+            # A score from the shared store stands in for scoring it: charged and cached exactly as if scored here.
+            stored = cached
+        pending_keys[dedupe_key] = idx
+        jobs.append((idx, key, test_inputs, stored))
+
+    if budget is not None:
+        budget.charge([test_inputs for _, _, test_inputs, _ in jobs])
+    suites = [test_inputs for _, _, test_inputs, stored in jobs if stored is None]
+    if not suites:
+        results = []
+    elif pool is None:
+        results = score_suites(problem_module_name, suites, mutant_ids)
+    elif BATCH_EVALUATION:
+        # One batch per worker; chunks are contiguous so results stay in population order.
+        chunks = _chunks(suites, getattr(pool, "_max_workers", 1))
+        results = [
+            r
+            for chunk in pool.map(
+                score_suites, [problem_module_name] * len(chunks), chunks, [mutant_ids] * len(chunks)
+            )
+            for r in chunk
+        ]
+    else:
+        results = list(
+            pool.map(score_suite, [problem_module_name] * len(suites), suites, [mutant_ids] * len(suites))
+        )
+
+    scored = iter(results)
+    for idx, key, _, stored in jobs:
+        if stored is not None:
+            fitnesses[idx] = stored
+            cache.remember(key, stored)
+            continue
+        result = next(scored)
+        fitnesses[idx] = result["mutation_score"]
+        if cache is not None and "error" not in result:
+            cache.put(key, result["mutation_score"])
+    for idx, source_idx in duplicates:
+        fitnesses[idx] = fitnesses[source_idx]
+    if sampler is not None:
+        sampler.last_suites = built_suites
+        if sampler.active:
+            sampler.sampled_evaluations += len(jobs)
+    return fitnesses
@@ -0,0 +1,147 @@
+"""
+Fitness cache for GA evaluation.
+
+Keys combine the scored suite, the problem source hash and the scorer
+settings. Lookups go to a bounded in-memory LRU first, then to an on-disk
+SQLite store (WAL mode) that concurrent workers and later runs share.
+
+The LRU is the run's own view; the shared store only saves scoring work.
+A fitness found there (but not in the LRU) is a miss for this run, counted
+in ``shared_hits``, so a run's hit counts, and the evaluation budget charged
+for its misses (see ga.evaluation), do not depend on what other runs stored.
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+import hashlib
+import importlib
+import os
+import sqlite3
+
+from config import (
+    FITNESS_CACHE_MAX_ENTRIES,
+    FITNESS_CACHE_PATH,
+    GA_INCLUDE_BASE_TESTS,
+)
+from mutation.mutants import source_hash
+from mutation.mutpy_runner import scorer_signature
+
+
+def fitness_key(problem_module_name: str, suite: List[Any], variant: str = "") -> str:
+    """
+    Hash of (problem, problem source, scorer settings, GA suite settings, scored suite).
+
+    The key covers every input of the suite, not just the genome, so a hit is
+    always the score of exactly the suite about to be scored.
+
+    ``variant`` separates scores computed differently for the same input (e.g.
+    on a mutant sample, see ga.sampling).
+    """
+    problem_module = importlib.import_module(problem_module_name)
+    digest = hashlib.sha256()
+    for part in (
+        problem_module_name,
+        source_hash(problem_module),
+        scorer_signature(),
+        f"base_tests={int(GA_INCLUDE_BASE_TESTS)}",
+        repr(suite),
+        variant,
+    ):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class FitnessCache:
+    """Two-tier fitness cache: in-memory LRU in front of a shared SQLite table."""
+
+    def __init__(self, max_entries: int = FITNESS_CACHE_MAX_ENTRIES, db_path: Optional[str] = FITNESS_CACHE_PATH):
+        self.max_entries = max_entries
+        self.db_path = db_path
+        self.hits = 0
+        self.misses = 0
+        self.shared_hits = 0
+        self._lru: "OrderedDict[str, float]" = OrderedDict()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_pid: Optional[int] = None
+
+    def _db(self) -> Optional[sqlite3.Connection]:
+        """Open (or reopen after fork) the SQLite tier; None when disabled or unavailable."""
+        if not self.db_path:
+            return None
+        if self._conn is not None and self._conn_pid == os.getpid():
+            return self._conn
+        try:
+            directory = os.path.dirname(self.db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS fitness (key TEXT PRIMARY KEY, fitness REAL NOT NULL)")
+            conn.commit()
+        except sqlite3.Error:
+            self.db_path = None
+            return None
+        self._conn = conn
+        self._conn_pid = os.getpid()
+        return conn
+
+    def remember(self, key: str, fitness: float) -> None:
+        """Add a fitness to this run's LRU only (e.g. one the shared store already holds)."""
+        self._lru[key] = fitness
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.max_entries:
+            self._lru.popitem(last=False)
+
+    def get(self, key: str) -> Optional[float]:
+        return self.lookup(key)[0]
+
+    def lookup(self, key: str) -> Tuple[Optional[float], bool]:
+        """
+        (fitness or None, whether it came from the shared store).
+
+        A fitness from the shared store is a miss for this run and is not
+        added to the LRU; the caller does that with remember().
+        """
+        if key in self._lru:
+            self._lru.move_to_end(key)
+            self.hits += 1
+            return self._lru[key], False
+        self.misses += 1
+        conn = self._db()
+        if conn is not None:
+            try:
+                row = conn.execute("SELECT fitness FROM fitness WHERE key = ?", (key,)).fetchone()
+            except sqlite3.Error:
+                row = None
+            if row is not None:
+                self.shared_hits += 1
+                return row[0], True
+        return None, False
+
+    def put(self, key: str, fitness: float) -> None:
+        self.remember(key, fitness)
+        conn = self._db()
+        if conn is None:
+            return
+        try:
+            conn.execute("INSERT OR REPLACE INTO fitness (key, fitness) VALUES (?, ?)", (key, fitness))
+            conn.commit()
+        except sqlite3.Error:
+            pass
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "miss_rate": self.misses / lookups if lookups else 0.0,
+            "shared_hits": self.shared_hits,
+        }
+
+    def close(self) -> None:
+        if self._conn is not None and self._conn_pid == os.getpid():
+            self._conn.close()
+        self._conn = None
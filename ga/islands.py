@@ -0,0 +1,240 @@
+"""
+Island-model GA: sub-populations in separate processes with periodic migration.
+
+Each island runs ga.engine.run_ga_for_problem on its share of the population,
+seeded from its own stream derived from the run seed. Every
+ISLAND_MIGRATION_INTERVAL generations it sends copies of its ISLAND_MIGRANTS
+best individuals (with fitness and suite) to the next island of a ring over a
+multiprocessing queue, and replaces its worst individuals with the ones it
+receives. The exchange is synchronous (an island waits for its neighbour's
+migrants), so a run is reproducible for a seed. Batches carry their
+generation: if the neighbour's batch does not arrive in time, the island
+skips that migration (counted as ``missed``) and drops the batch when it
+turns up late, so later migrations still pair up generation by generation.
+An island that stops early sends None instead, and its neighbour goes on alone. Islands share the
+on-disk fitness cache and kill-stats stores; kill matrices stay per process.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+import itertools
+import multiprocessing
+import queue
+import random
+import time
+import traceback
+
+from config import (
+    ISLAND_MIGRANTS,
+    ISLAND_MIGRATION_INTERVAL,
+    MUTATION_TIMEOUT_SECONDS,
+    TOURNAMENT_SIZE,
+)
+from mutation.kill_matrix import input_key
+from .rng import derive_seed
+from .stopping import default_rules, split_rules
+
+
+def island_seeds(seed: Optional[int], count: int) -> List[int]:
+    """One 32-bit seed per island, derived from the run seed (drawn fresh when None)."""
+    if seed is None:
+        seed = random.randrange(2**32)
+    return [derive_seed(seed, "island", idx) for idx in range(count)]
+
+
+class Migration:
+    """The ``migrate`` hook of one island: swap best-for-worst with its ring neighbours."""
+
+    def __init__(self, inbox, outbox, interval: int, migrants: int, timeout: float):
+        self.inbox = inbox
+        self.outbox = outbox
+        self.interval = max(1, interval)
+        self.migrants = migrants
+        self.timeout = timeout
+        self.sent = 0
+        self.received = 0
+        self.missed = 0
+        self.neighbour_done = False
+
+    def __call__(self, gen: int, population: List[Any], fitnesses: List[float], suites: List[Any]):
+        if gen % self.interval or self.migrants <= 0:
+            return population, fitnesses, suites
+        order = sorted(range(len(population)), key=lambda i: -fitnesses[i])
+        outgoing = [(population[i], fitnesses[i], suites[i]) for i in order[:self.migrants]]
+        self.outbox.put((gen, outgoing))
+        self.sent += len(outgoing)
+        incoming = self._receive(gen)
+        if incoming is None:
+            return population, fitnesses, suites
+        population, fitnesses, suites = list(population), list(fitnesses), list(suites)
+        for slot, (individual, fitness, suite) in zip(reversed(order), incoming):
+            population[slot], fitnesses[slot], suites[slot] = individual, fitness, suite
+        self.received += len(incoming)
+        return population, fitnesses, suites
+
+    def _receive(self, gen: int) -> Optional[List[Any]]:
+        """The neighbour's migrants for ``gen``; None if it is done or they did not come in time."""
+        deadline = time.monotonic() + self.timeout
+        while not self.neighbour_done:
+            try:
+                batch = self.inbox.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                # Neighbour is slow or stuck: skip this migration; its batch is dropped when it arrives.
+                self.missed += 1
+                return None
+            if batch is None:
+                self.neighbour_done = True
+            elif batch[0] == gen:
+                return batch[1]
+            # Otherwise a batch for a migration this island already skipped.
+        return None
+
+    def close(self) -> None:
+        """Tell the next island that no more migrants are coming."""
+        self.outbox.put(None)
+
+
+def _island_main(idx: int, problem_module_name: str, population_size: int, num_generations: int, seed: int,
+                 migration: Migration, stopping: List[Any], results) -> None:
+    from .engine import run_ga_for_problem
+
+    try:
+        result = run_ga_for_problem(
+            problem_module_name, population_size, num_generations, seed, jobs=1, islands=1, migrate=migration,
+            stopping=stopping,
+        )
+        result["migrants"] = {"sent": migration.sent, "received": migration.received, "missed": migration.missed}
+        results.put((idx, "ok", result))
+    except Exception:  # noqa: BLE001 - report to the parent
+        results.put((idx, "error", traceback.format_exc()))
+
+
+def _wait_for_results(processes: List[multiprocessing.Process], results) -> Dict[int, Dict[str, Any]]:
+    collected: Dict[int, Dict[str, Any]] = {}
+    while len(collected) < len(processes):
+        try:
+            idx, status, payload = results.get(timeout=1)
+        except queue.Empty:
+            for idx, process in enumerate(processes):
+                if idx not in collected and process.exitcode not in (None, 0):
+                    raise RuntimeError(f"island {idx} exited with code {process.exitcode}")
+            continue
+        if status != "ok":
+            raise RuntimeError(f"island {idx} failed:\n{payload}")
+        collected[idx] = payload
+    return collected
+
+
+def _sum_counts(stats: List[Optional[Dict[str, Any]]], names: Tuple[str, ...]) -> Optional[Dict[str, Any]]:
+    stats = [s for s in stats if s]
+    if not stats:
+        return None
+    return {name: sum(s.get(name, 0) for s in stats) for name in names}
+
+
+def _merge(results: List[Dict[str, Any]], seeds: List[int], island_size: int) -> Dict[str, Any]:
+    best = max(results, key=lambda r: r["best_fitness"])  # ties go to the lowest island
+    # Islands that stopped early have shorter histories: each generation is over the islands still running.
+    per_generation = [
+        [value for value in values if value is not None]
+        for values in itertools.zip_longest(*(r["fitness_history"] for r in results))
+    ]
+    avg_per_generation = [
+        [value for value in values if value is not None]
+        for values in itertools.zip_longest(*(r["avg_fitness_history"] for r in results))
+    ]
+    merged: Dict[str, Any] = {
+        "best_individual": best["best_individual"],
+        "best_fitness": best["best_fitness"],
+        "fitness_history": [max(values) for values in per_generation],
+        "avg_fitness_history": [sum(values) / len(values) for values in avg_per_generation],
+        "fitness_reuse": _sum_counts([r.get("fitness_reuse") for r in results], ("individuals", "inherited")),
+        "evaluations": sum(r.get("evaluations", 0) for r in results),
+        "evaluation_budget": _sum_counts([r.get("evaluation_budget") for r in results], ("suites", "inputs")),
+        "stopping": {
+            "reason": best.get("stopping", {}).get("reason"),
+            "generations": max(len(r["fitness_history"]) for r in results),
+        },
+        "islands": [
+            {
+                "seed": seed,
+                "population_size": island_size,
+                "best_fitness": r["best_fitness"],
+                "fitness_history": r["fitness_history"],
+                "migrants": r["migrants"],
+                "stopping": r.get("stopping"),
+            }
+            for seed, r in zip(seeds, results)
+        ],
+    }
+    merged["evaluated_inputs"] = list(
+        {input_key(test_input): test_input for r in results for test_input in r.get("evaluated_inputs", ())}.values()
+    )
+    for name in ("best_fitness_estimate", "fitness_sampling"):
+        if name in best:
+            merged[name] = best[name]
+    cache = _sum_counts([r.get("fitness_cache") for r in results], ("hits", "misses"))
+    if cache is not None:
+        lookups = cache["hits"] + cache["misses"]
+        cache["hit_rate"] = cache["hits"] / lookups if lookups else 0.0
+        cache["miss_rate"] = cache["misses"] / lookups if lookups else 0.0
+        merged["fitness_cache"] = cache
+    execution = _sum_counts(
+        [r.get("mutant_execution") for r in results],
+        ("mutant_runs", "pending_tests", "executed_tests", "pruned_tests"),
+    )
+    if execution is not None:
+        runs = execution["mutant_runs"]
+        execution["tests_per_mutant"] = execution["executed_tests"] / runs if runs else 0.0
+        execution["pending_tests_per_mutant"] = execution["pending_tests"] / runs if runs else 0.0
+        merged["mutant_execution"] = execution
+    return merged
+
+
+def run_islands(
+    problem_module_name: str,
+    islands: int,
+    population_size: int,
+    num_generations: int,
+    seed: Optional[int] = None,
+    interval: int = ISLAND_MIGRATION_INTERVAL,
+    migrants: int = ISLAND_MIGRANTS,
+    stopping: Optional[List[Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Run ``islands`` GA processes sharing ``population_size`` and merge their results.
+
+    Each island gets ceil(population_size / islands) individuals (at least
+    TOURNAMENT_SIZE). The merged result has the run_ga_for_problem keys, with
+    histories taken over all islands per generation, plus per-island details
+    under ``islands``. Each island checks the ``stopping`` rules (default:
+    config) on its own, with an equal share of any evaluation cap.
+    """
+    island_size = max(TOURNAMENT_SIZE, -(-population_size // islands))
+    seeds = island_seeds(seed, islands)
+    # Long enough for a neighbour to score `interval` generations even if every suite times out.
+    timeout = MUTATION_TIMEOUT_SECONDS * island_size * max(1, interval)
+    inboxes = [multiprocessing.Queue() for _ in range(islands)]
+    results = multiprocessing.Queue()
+    island_rules = split_rules(default_rules() if stopping is None else stopping, islands)
+    processes = []
+    for idx in range(islands):
+        migration = Migration(inboxes[idx], inboxes[(idx + 1) % islands], interval, migrants, timeout)
+        process = multiprocessing.Process(
+            target=_island_main,
+            args=(idx, problem_module_name, island_size, num_generations, seeds[idx], migration, island_rules, results),
+        )
+        process.start()
+        processes.append(process)
+    try:
+        collected = _wait_for_results(processes, results)
+    except BaseException:
+        for process in processes:
+            process.kill()
+        raise
+    finally:
+        for process in processes:
+            process.join(timeout=30)
+            if process.is_alive():
+                process.kill()
+                process.join()
+    return _merge([collected[idx] for idx in range(islands)], seeds, island_size)
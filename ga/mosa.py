@@ -0,0 +1,244 @@
+"""
+Many-objective search with a per-mutant archive (MOSA-style).
+
+Every mutant is its own objective and every individual is a single test
+input. An input's distance to a mutant is 0 if it kills it, 1 if its run of
+the original reaches the mutated line (or the line is unknown) and 2 if it
+never gets there (see mutation.coverage). The archive keeps the first input
+that killed each mutant (within a generation, the one with the most new
+kills, then the smallest); killed mutants leave the objective set, so later
+inputs are never run against them and the entry is not replaced. Offspring
+are only scored against the mutants still alive and selection only rewards
+progress on those. Survivors are chosen by MOSA's
+preference criterion (the closest input to each live mutant goes first)
+followed by non-dominated fronts. The result is the archive as a killing
+suite rather than one best individual.
+"""
+
+from typing import Any, Dict, List, Optional, Set
+import importlib
+import os
+import random
+import time
+
+from config import GA_INCLUDE_BASE_TESTS
+from mutation import coverage as line_coverage
+from mutation import mutpy_runner
+from mutation.kill_matrix import input_key
+from mutation.mutpy_runner import run_mutation_tests, run_mutation_tests_batch
+from .operators import crossover, mutate, tournament_selection
+from .representation import population_init
+from .stopping import EvaluationBudget, SearchState, default_rules, should_stop
+
+# Distances: killed, reached but survived (or no line information), never reached.
+_KILLED, _REACHED, _UNREACHED = 0, 1, 2
+
+
+class _Individual:
+    __slots__ = ("genome", "test_input", "size", "kills", "distances")
+
+    def __init__(self, genome: Any, test_input: Any, kills: Set[int], distances: Dict[int, int]):
+        self.genome = genome
+        self.test_input = test_input
+        self.size = len(repr(test_input))
+        self.kills = kills
+        self.distances = distances
+
+
+def _evaluate(
+    problem_module_name: str,
+    problem_module,
+    decode_fn,
+    genomes: List[Any],
+    alive: Set[int],
+    mutants_by_id: Dict[int, Dict[str, Any]],
+    budget: EvaluationBudget,
+) -> List[_Individual]:
+    """Score each genome as a one-input suite against the live mutants only."""
+    inputs = [decode_fn(genome) for genome in genomes]
+    suites = [[test_input] for test_input in inputs]
+    budget.charge(suites)
+    results = run_mutation_tests_batch(problem_module_name, suites, use_base_tests=False, mutant_ids=sorted(alive))
+    if line_coverage.SUPPORTED:
+        _, covered = line_coverage.baseline_runs(problem_module, inputs)
+        span = line_coverage.body_span(problem_module)
+    else:
+        covered, span = [None] * len(inputs), None
+    individuals = []
+    for genome, test_input, result, lines in zip(genomes, inputs, results, covered):
+        kills = set(result.get("killed_ids", ())) & alive
+        distances = {
+            m: _KILLED if m in kills
+            else _REACHED if lines is None or line_coverage.reaches(mutants_by_id[m], lines, span)
+            else _UNREACHED
+            for m in alive
+        }
+        individuals.append(_Individual(genome, test_input, kills, distances))
+    return individuals
+
+
+def _update_archive(archive: Dict[int, _Individual], individuals: List[_Individual], alive: Set[int]) -> None:
+    """Record new kills, most new kills first so the archive needs as few inputs as possible."""
+    for individual in sorted(individuals, key=lambda ind: (-len(ind.kills & alive), ind.size)):
+        for mutant_id in individual.kills & alive:
+            archive[mutant_id] = individual
+        alive -= individual.kills
+
+
+def _dominates(a: _Individual, b: _Individual, objectives: List[int]) -> bool:
+    better = False
+    for m in objectives:
+        if a.distances[m] > b.distances[m]:
+            return False
+        if a.distances[m] < b.distances[m]:
+            better = True
+    return better
+
+
+def _ranks(individuals: List[_Individual], alive: Set[int], needed: int) -> List[int]:
+    """
+    Preference front (rank 0) and non-dominated fronts after it, until ``needed`` are ranked.
+
+    Individuals left unranked get the next rank.
+    """
+    objectives = sorted(alive)
+    ranks: List[Optional[int]] = [None] * len(individuals)
+    for m in objectives:
+        best = min(range(len(individuals)), key=lambda i: (individuals[i].distances[m], individuals[i].size))
+        ranks[best] = 0
+    ranked = sum(1 for r in ranks if r is not None)
+    rest = [i for i, r in enumerate(ranks) if r is None]
+    level = 1
+    while rest and ranked < needed:
+        front = [
+            i for i in rest
+            if not any(_dominates(individuals[j], individuals[i], objectives) for j in rest if j != i)
+        ]
+        for i in front:
+            ranks[i] = level
+        ranked += len(front)
+        rest = [i for i in rest if ranks[i] is None]
+        level += 1
+    return [level if r is None else r for r in ranks]
+
+
+def _selection_scores(individuals: List[_Individual], ranks: List[int], alive: Set[int]) -> List[float]:
+    """Higher is better: rank first, then total distance to the live mutants."""
+    scale = 2 * len(alive) + 1
+    return [-rank - sum(ind.distances[m] for m in alive) / scale for ind, rank in zip(individuals, ranks)]
+
+
+def run_mosa(
+    problem_module_name: str,
+    population_size: int,
+    num_generations: int,
+    stopping: Optional[List[Any]] = None,
+    rng: Optional[random.Random] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Run the archive search on ``rng`` (the run's stream); the caller resolves budgets.
+
+    Returns the run_ga_for_problem keys: ``best_fitness`` is the archive
+    suite's score on the full mutant set (with BASE_TESTS if
+    GA_INCLUDE_BASE_TESTS), ``best_individual`` the genomes of that suite and
+    ``fitness_history`` the share of mutants the archive kills after each
+    generation. ``suite`` holds the decoded inputs, ``archive`` maps each
+    killed mutant to its suite index and ``evaluations`` counts inputs scored.
+    The ``stopping`` rules (default: config) are checked while mutants are
+    still alive, against the archive's score.
+    Without a cached mutant set there are no per-mutant results to search on,
+    so it returns None and the caller falls back to the scalar GA.
+    """
+    mutant_set = None
+    if os.getenv("EVOBUG_MUTPY", "1") != "0":
+        mutant_set = mutpy_runner._load_mutant_set(problem_module_name)
+    if not mutant_set or not mutant_set["mutants"]:
+        return None
+    problem_module = importlib.import_module(problem_module_name)
+    decode_fn = getattr(problem_module, "decode_individual")
+    mutants_by_id = {mutant["id"]: mutant for mutant in mutant_set["mutants"]}
+    total = len(mutants_by_id)
+    alive: Set[int] = set(mutants_by_id)
+    archive: Dict[int, _Individual] = {}
+    rules = default_rules() if stopping is None else stopping
+    budget = EvaluationBudget()
+    started = time.monotonic()
+    stop_reason = None
+
+    population = _evaluate(
+        problem_module_name, problem_module, decode_fn,
+        population_init(problem_module, population_size, rng), alive, mutants_by_id, budget,
+    )
+    evaluated_inputs = {input_key(ind.test_input): ind.test_input for ind in population}
+    _update_archive(archive, population, alive)
+
+    fitness_history: List[float] = []
+    avg_fitness_history: List[float] = []
+    stopped_at = None
+    for gen in range(num_generations):
+        fitness_history.append(len(archive) / total)
+        # Kills counted against the mutants that were alive when each input was scored.
+        avg_fitness_history.append(sum(len(ind.kills) for ind in population) / len(population) / total)
+        if not alive:
+            # Everything is killed: nothing left to search for.
+            if stopped_at is None:
+                stopped_at = gen
+            continue
+        state = SearchState(gen, fitness_history, True, time.monotonic() - started, budget.suites, population_size)
+        stop_reason = should_stop(rules, state)
+        if stop_reason is not None:
+            break
+
+        scores = _selection_scores(population, _ranks(population, alive, len(population)), alive)
+        genomes = [ind.genome for ind in population]
+        offspring: List[Any] = []
+        while len(offspring) < population_size:
+            parent1 = tournament_selection(genomes, scores, rng)
+            parent2 = tournament_selection(genomes, scores, rng)
+            child1, child2 = crossover(parent1, parent2, problem_module, rng)
+            offspring.append(mutate(child1, problem_module, rng))
+            if len(offspring) < population_size:
+                offspring.append(mutate(child2, problem_module, rng))
+
+        children = _evaluate(problem_module_name, problem_module, decode_fn, offspring, alive, mutants_by_id, budget)
+        for child in children:
+            evaluated_inputs.setdefault(input_key(child.test_input), child.test_input)
+        _update_archive(archive, children, alive)
+
+        union = population + children
+        if alive:
+            ranks = _ranks(union, alive, population_size)
+            scores = _selection_scores(union, ranks, alive)
+            order = sorted(range(len(union)), key=lambda i: -scores[i])
+        else:
+            order = list(range(len(union)))
+        population = [union[i] for i in order[:population_size]]
+
+    suite_members: List[_Individual] = []
+    for individual in archive.values():
+        if all(individual is not member for member in suite_members):
+            suite_members.append(individual)
+    suite = [member.test_input for member in suite_members]
+    if suite:
+        best_fitness = run_mutation_tests(problem_module_name, suite, use_base_tests=GA_INCLUDE_BASE_TESTS)["mutation_score"]
+    else:
+        best_fitness = 0.0
+    result = {
+        "best_individual": [member.genome for member in suite_members],
+        "best_fitness": best_fitness,
+        "fitness_history": fitness_history,
+        "avg_fitness_history": avg_fitness_history,
+        "search": "mosa",
+        "suite": suite,
+        "archive": {
+            mutant_id: next(idx for idx, member in enumerate(suite_members) if member is individual)
+            for mutant_id, individual in sorted(archive.items())
+        },
+        "evaluations": budget.suites,
+        "evaluation_budget": budget.stats(),
+        "stopping": {"reason": stop_reason, "generations": len(fitness_history)},
+        "evaluated_inputs": list(evaluated_inputs.values()),
+    }
+    if stopped_at is not None:
+        result["all_killed_at_generation"] = stopped_at
+    return result
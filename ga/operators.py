@@ -2,6 +2,8 @@
 GA operators: selection, crossover, mutation.
 
 These stay as problem-agnostic as possible and lean on INPUT_SPEC when present.
+Each takes the run's ``rng`` (a random.Random; default: the global random
+module), so concurrent runs never share a stream.
 """
 
 from typing import List, Any, Tuple
@@ -10,7 +12,7 @@ import random
 from config import TOURNAMENT_SIZE, CROSSOVER_RATE, MUTATION_RATE
 
 
-def tournament_selection(population: List[Any], fitnesses: List[float]) -> Any:
+def tournament_selection(population: List[Any], fitnesses: List[float], rng: random.Random | None = None) -> Any:
     """
     Tournament selection: pick TOURNAMENT_SIZE individuals at random
     and return the one with highest fitness.
@@ -21,13 +23,16 @@ def tournament_selection(population: List[Any], fitnesses: List[float]) -> Any:
         Current population.
     fitnesses : List[float]
         Fitness values aligned with population indices.
+    rng : random.Random, optional
+        The run's random stream.
 
     Returns
     -------
     selected : Any
         Selected individual (genome).
     """
-    indices = random.sample(range(len(population)), TOURNAMENT_SIZE)
+    rng = rng or random
+    indices = rng.sample(range(len(population)), TOURNAMENT_SIZE)
     best_index = max(indices, key=lambda i: fitnesses[i])
     return population[best_index]
 
@@ -40,7 +45,12 @@ def _arg_type(spec):
     return spec.get("type")
 
 
-def crossover(parent1: Any, parent2: Any, problem_module=None) -> Tuple[Any, Any]:
+def crossover(
+    parent1: Any,
+    parent2: Any,
+    problem_module=None,
+    rng: random.Random | None = None,
+) -> Tuple[Any, Any]:
     """
     Single-point crossover for tuple- or list-like genomes.
 
@@ -52,7 +62,8 @@ def crossover(parent1: Any, parent2: Any, problem_module=None) -> Tuple[Any, Any
         * a flat list.
     - We handle the flat-list case and a per-argument crossover for tuples.
     """
-    if random.random() > CROSSOVER_RATE:
+    rng = rng or random
+    if rng.random() > CROSSOVER_RATE:
         return parent1, parent2
 
     spec_args = getattr(problem_module, "INPUT_SPEC", {}).get("args", []) if problem_module else []
@@ -67,23 +78,23 @@ def crossover(parent1: Any, parent2: Any, problem_module=None) -> Tuple[Any, Any
 
             if isinstance(a, list) and isinstance(b, list):
                 if len(a) < 2 or len(b) < 2:
-                    children1.append(random.choice([a, b]))
-                    children2.append(random.choice([a, b]))
+                    children1.append(rng.choice([a, b]))
+                    children2.append(rng.choice([a, b]))
                 else:
-                    point = random.randint(1, min(len(a), len(b)) - 1)
+                    point = rng.randint(1, min(len(a), len(b)) - 1)
                     children1.append(a[:point] + b[point:])
                     children2.append(b[:point] + a[point:])
             elif arg_type == "str" and isinstance(a, str) and isinstance(b, str):
                 if len(a) < 2 or len(b) < 2:
-                    children1.append(random.choice([a, b]))
-                    children2.append(random.choice([a, b]))
+                    children1.append(rng.choice([a, b]))
+                    children2.append(rng.choice([a, b]))
                 else:
-                    point = random.randint(1, min(len(a), len(b)) - 1)
+                    point = rng.randint(1, min(len(a), len(b)) - 1)
                     children1.append(a[:point] + b[point:])
                     children2.append(b[:point] + a[point:])
             else:
-                children1.append(random.choice([a, b]))
-                children2.append(random.choice([a, b]))
+                children1.append(rng.choice([a, b]))
+                children2.append(rng.choice([a, b]))
 
         child1 = tuple(children1) if isinstance(parent1, tuple) else children1
         child2 = tuple(children2) if isinstance(parent2, tuple) else children2
@@ -94,7 +105,7 @@ def crossover(parent1: Any, parent2: Any, problem_module=None) -> Tuple[Any, Any
         length = min(len(parent1), len(parent2))
         if length < 2:
             return parent1, parent2
-        point = random.randint(1, length - 1)
+        point = rng.randint(1, length - 1)
         child1 = parent1[:point] + parent2[point:]
         child2 = parent2[:point] + parent1[point:]
         return child1, child2
@@ -102,71 +113,72 @@ def crossover(parent1: Any, parent2: Any, problem_module=None) -> Tuple[Any, Any
     return parent1, parent2
 
 
-def _mutate_int(value: int, arg_spec: dict) -> int:
+def _mutate_int(value: int, arg_spec: dict, rng: random.Random) -> int:
     lo, hi = arg_spec.get("value_range", (-1_000_000, 1_000_000))
-    delta = random.randint(-5, 5)
+    delta = rng.randint(-5, 5)
     return _clamp(value + delta, lo, hi)
 
 
-def _mutate_list_int(values: list, arg_spec: dict) -> list:
+def _mutate_list_int(values: list, arg_spec: dict, rng: random.Random) -> list:
     lo, hi = arg_spec.get("value_range", (-1_000_000, 1_000_000))
     len_lo, len_hi = arg_spec.get("length_range", (1, len(values) or 1))
 
     values = list(values)
-    if values and random.random() < 0.5:
-        idx = random.randrange(len(values))
-        values[idx] = _clamp(values[idx] + random.randint(-5, 5), lo, hi)
+    if values and rng.random() < 0.5:
+        idx = rng.randrange(len(values))
+        values[idx] = _clamp(values[idx] + rng.randint(-5, 5), lo, hi)
     else:
-        if len(values) < len_hi and random.random() < 0.5:
-            values.append(random.randint(lo, hi))
+        if len(values) < len_hi and rng.random() < 0.5:
+            values.append(rng.randint(lo, hi))
         elif len(values) > len_lo:
-            values.pop(random.randrange(len(values)))
+            values.pop(rng.randrange(len(values)))
     return values
 
 
-def _mutate_str(value: str, arg_spec: dict) -> str:
+def _mutate_str(value: str, arg_spec: dict, rng: random.Random) -> str:
     import string
 
     len_lo, len_hi = arg_spec.get("length_range", (1, max(1, len(value))))
     value_list = list(value)
     alphabet = string.ascii_letters + string.digits + string.punctuation + " "
 
-    action = random.random()
+    action = rng.random()
     if action < 0.34 and value_list:
-        idx = random.randrange(len(value_list))
-        value_list[idx] = random.choice(alphabet)
+        idx = rng.randrange(len(value_list))
+        value_list[idx] = rng.choice(alphabet)
     elif action < 0.67 and len(value_list) < len_hi:
-        value_list.insert(random.randrange(len(value_list) + 1), random.choice(alphabet))
+        value_list.insert(rng.randrange(len(value_list) + 1), rng.choice(alphabet))
     elif len(value_list) > len_lo:
-        value_list.pop(random.randrange(len(value_list)))
+        value_list.pop(rng.randrange(len(value_list)))
     return "".join(value_list)
 
 
-def mutate(individual: Any, problem_module=None) -> Any:
+def mutate(individual: Any, problem_module=None, rng: random.Random | None = None) -> Any:
     """
     Mutation operator using problem INPUT_SPEC to stay within bounds.
     """
-    if random.random() > MUTATION_RATE:
+    rng = rng or random
+    if rng.random() > MUTATION_RATE:
         return individual
 
     spec_args = getattr(problem_module, "INPUT_SPEC", {}).get("args", []) if problem_module else []
 
     if isinstance(individual, (tuple, list)) and spec_args and len(individual) == len(spec_args):
         mutated = list(individual)
-        idx = random.randrange(len(mutated))
+        idx = rng.randrange(len(mutated))
         arg_spec = spec_args[idx]
         arg_type = _arg_type(arg_spec)
 
         if arg_type == "list_int" and isinstance(mutated[idx], list):
-            mutated[idx] = _mutate_list_int(mutated[idx], arg_spec)
+            mutated[idx] = _mutate_list_int(mutated[idx], arg_spec, rng)
         elif arg_type == "int" and isinstance(mutated[idx], int):
-            mutated[idx] = _mutate_int(mutated[idx], arg_spec)
+            mutated[idx] = _mutate_int(mutated[idx], arg_spec, rng)
         elif arg_type == "str" and isinstance(mutated[idx], str):
-            mutated[idx] = _mutate_str(mutated[idx], arg_spec)
+            mutated[idx] = _mutate_str(mutated[idx], arg_spec, rng)
         else:
             # Fallback: perturb ints or leave untouched
             if isinstance(mutated[idx], int):
-                mutated[idx] = mutated[idx] + random.randint(-3, 3)
+                mutated[idx] = mutated[idx] + rng.randint(-3, 3)
         return tuple(mutated) if isinstance(individual, tuple) else mutated
 
     # Fallback: leave unchanged
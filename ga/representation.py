@@ -3,11 +3,11 @@
 from typing import Any, List, Callable
 import random
 
-def create_random_individual(problem_module) -> Any:
+def create_random_individual(problem_module, rng: random.Random | None = None) -> Any:
     """Create a single random individual using the problem's random_input()."""
-    return problem_module.random_input()
+    return problem_module.random_input(rng)
 
 
-def population_init(problem_module, population_size: int) -> List[Any]:
-    """Initialize a population of random individuals."""
-    return [create_random_individual(problem_module) for _ in range(population_size)]
+def population_init(problem_module, population_size: int, rng: random.Random | None = None) -> List[Any]:
+    """Initialize a population of random individuals from ``rng`` (default: the global random module)."""
+    return [create_random_individual(problem_module, rng) for _ in range(population_size)]
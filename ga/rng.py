@@ -0,0 +1,18 @@
+"""
+Per-run random streams.
+
+Each GA run, island and experiment job draws from its own random.Random
+instead of the global random module. Runs can then share a process (threads,
+asyncio) and stay reproducible. Child seeds are derived SeedSequence-style:
+hashed from the parent seed and a path naming the child (such as problem and
+run index). A child's seed never depends on how many siblings came before it
+or in which order they ran.
+"""
+
+import hashlib
+
+
+def derive_seed(seed: int, *path) -> int:
+    """32-bit seed of the child named by ``path`` under ``seed``."""
+    text = ":".join(str(part) for part in (seed,) + path)
+    return int.from_bytes(hashlib.sha256(text.encode("utf-8")).digest()[:4], "big")
@@ -0,0 +1,102 @@
+"""
+Adaptive sampled fitness (FITNESS_SAMPLING).
+
+Early generations only need scores good enough to rank individuals, so suites
+are scored on a stratified sample of the cached mutant set (mutation.sampling)
+and the result is an estimate with a confidence interval. The sample grows
+whenever the population's scores can no longer be told apart: when it has
+converged (the spread of scores is within the interval width) or when too
+many of the pairs a tournament could compare have overlapping intervals. The GA re-scores its
+final best suite on the full mutant set.
+"""
+
+from typing import Any, Dict, List, Optional
+import hashlib
+import math
+import os
+
+from config import (
+    FITNESS_SAMPLE_CLOSE_LIMIT,
+    FITNESS_SAMPLE_FRACTION,
+    FITNESS_SAMPLE_GROWTH,
+    FITNESS_SAMPLE_MIN,
+    FITNESS_SAMPLE_Z,
+)
+from mutation import mutpy_runner
+from mutation.sampling import half_width, stratified_sample
+
+
+class FitnessSampler:
+    """Current mutant sample for a GA run, and the rule for growing it."""
+
+    def __init__(self, problem_module_name: str, fraction: float = FITNESS_SAMPLE_FRACTION):
+        self.problem_module_name = problem_module_name
+        mutant_set = None
+        if os.getenv("EVOBUG_MUTPY", "1") != "0":
+            mutant_set = mutpy_runner._load_mutant_set(problem_module_name)
+        # Without a cached mutant set there is nothing to sample from: score in full.
+        self.mutant_set = mutant_set if mutant_set and mutant_set["mutants"] else None
+        self.population_size = len(self.mutant_set["mutants"]) if self.mutant_set else 0
+        self.fraction = min(1.0, fraction)
+        self.growth_generations: List[int] = []
+        self.sampled_evaluations = 0
+        # Suites of the last evaluated population (set by ga.evaluation.evaluate_population).
+        self.last_suites: List[List[Any]] = []
+        self._resample()
+
+    def _resample(self) -> None:
+        self.ids: Optional[List[int]] = None
+        if self.mutant_set is None:
+            return
+        size = max(FITNESS_SAMPLE_MIN, math.ceil(self.fraction * self.population_size))
+        if size < self.population_size:
+            self.ids = stratified_sample(self.mutant_set, size)
+
+    @property
+    def active(self) -> bool:
+        """True while scores come from a sample rather than the full mutant set."""
+        return self.ids is not None
+
+    def variant(self) -> str:
+        """Fitness-cache variant for the current sample ("" when scoring in full)."""
+        if self.ids is None:
+            return ""
+        digest = hashlib.sha256(",".join(map(str, self.ids)).encode("utf-8")).hexdigest()[:16]
+        return f"sample={digest}"
+
+    def half_width(self, fitness: float) -> float:
+        if self.ids is None:
+            return 0.0
+        return half_width(fitness, len(self.ids), self.population_size, FITNESS_SAMPLE_Z)
+
+    def too_close(self, fitnesses: List[float]) -> bool:
+        """True when the current sample cannot rank these scores reliably."""
+        if not fitnesses:
+            return False
+        widths = [self.half_width(f) for f in fitnesses]
+        if max(fitnesses) - min(fitnesses) <= sum(widths) / len(widths):
+            return True  # converged: everything sits within one interval
+        # Tournaments compare arbitrary pairs: count the pairs whose intervals overlap.
+        pairs = [(a, b) for i, a in enumerate(fitnesses) for b in fitnesses[i + 1:] if a != b]
+        if not pairs:
+            return False
+        overlapping = sum(1 for a, b in pairs if abs(a - b) <= self.half_width(a) + self.half_width(b))
+        return overlapping / len(pairs) > FITNESS_SAMPLE_CLOSE_LIMIT
+
+    def update(self, generation: int, fitnesses: List[float]) -> bool:
+        """Grow the sample if ``fitnesses`` are too close to call; returns True when it grew."""
+        if self.ids is None or not self.too_close(fitnesses):
+            return False
+        self.fraction = min(1.0, self.fraction * FITNESS_SAMPLE_GROWTH)
+        self._resample()
+        self.growth_generations.append(generation)
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "final_fraction": self.fraction if self.ids is not None else 1.0,
+            "sample_size": len(self.ids) if self.ids is not None else self.population_size,
+            "population_size": self.population_size,
+            "growth_generations": self.growth_generations,
+            "sampled_evaluations": self.sampled_evaluations,
+        }
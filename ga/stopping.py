@@ -0,0 +1,132 @@
+"""
+Stopping rules and evaluation-budget accounting for the GA and the archive search.
+
+A run is charged for the suites it actually sends to the scorer, and for
+those the shared fitness store answered in their place: inherited fitnesses,
+hits in the run's own fitness-cache LRU and in-generation duplicates are
+free. What other runs stored therefore never changes a run's budget. After
+each generation's stats are recorded, the rules see a SearchState and the
+first one that fires ends the run; its ``name`` is reported as the stop
+reason. Rules are plain picklable objects (island processes get copies), so
+any callable with a ``name`` that takes a SearchState can be plugged in.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence
+
+from config import (
+    STOP_DEADLINE_SECONDS,
+    STOP_MAX_EVALUATIONS,
+    STOP_MAX_SCORE,
+    STOP_STAGNATION_GENERATIONS,
+)
+
+
+class EvaluationBudget:
+    """Suites (and inputs in them) scored by one run."""
+
+    def __init__(self):
+        self.suites = 0
+        self.inputs = 0
+
+    def charge(self, suites: Sequence[Sequence[Any]]) -> None:
+        self.suites += len(suites)
+        self.inputs += sum(len(suite) for suite in suites)
+
+    def stats(self) -> Dict[str, int]:
+        return {"suites": self.suites, "inputs": self.inputs}
+
+
+class SearchState:
+    """What the rules see after a generation."""
+
+    __slots__ = ("generation", "best_history", "exact", "elapsed", "evaluations", "next_cost")
+
+    def __init__(self, generation: int, best_history: List[float], exact: bool, elapsed: float,
+                 evaluations: int, next_cost: int):
+        self.generation = generation
+        self.best_history = best_history  # best fitness so far, one entry per generation
+        self.exact = exact                # False while fitnesses are sampled estimates
+        self.elapsed = elapsed            # seconds since the run started
+        self.evaluations = evaluations    # suites scored so far
+        self.next_cost = next_cost        # most suites the next generation can score
+
+
+class MaxScore:
+    """Stop once the best (exact) fitness reaches ``score``."""
+
+    name = "max_score"
+
+    def __init__(self, score: float):
+        self.score = score
+
+    def __call__(self, state: SearchState) -> bool:
+        return state.exact and state.best_history[-1] >= self.score
+
+
+class Stagnation:
+    """Stop when the best fitness has not improved for ``generations`` generations."""
+
+    name = "stagnation"
+
+    def __init__(self, generations: int):
+        self.generations = max(1, generations)
+
+    def __call__(self, state: SearchState) -> bool:
+        history = state.best_history
+        return len(history) > self.generations and history[-1] <= history[-1 - self.generations]
+
+
+class Deadline:
+    """Stop once ``seconds`` of wall-clock time have passed (checked between generations)."""
+
+    name = "deadline"
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+
+    def __call__(self, state: SearchState) -> bool:
+        return state.elapsed >= self.seconds
+
+
+class MaxEvaluations:
+    """Stop before a generation that could take the run past ``cap`` scored suites."""
+
+    name = "max_evaluations"
+
+    def __init__(self, cap: int):
+        self.cap = cap
+
+    def __call__(self, state: SearchState) -> bool:
+        return state.evaluations + state.next_cost > self.cap
+
+
+def default_rules(
+    max_score: Optional[float] = STOP_MAX_SCORE,
+    stagnation: Optional[int] = STOP_STAGNATION_GENERATIONS,
+    deadline: Optional[float] = STOP_DEADLINE_SECONDS,
+    max_evaluations: Optional[int] = STOP_MAX_EVALUATIONS,
+) -> List[Any]:
+    """The rules enabled in config (None disables one)."""
+    rules: List[Any] = []
+    if max_score is not None:
+        rules.append(MaxScore(max_score))
+    if stagnation is not None:
+        rules.append(Stagnation(stagnation))
+    if deadline is not None:
+        rules.append(Deadline(deadline))
+    if max_evaluations is not None:
+        rules.append(MaxEvaluations(max_evaluations))
+    return rules
+
+
+def split_rules(rules: List[Any], parts: int) -> List[Any]:
+    """Rules for one of ``parts`` islands: each gets an equal share of an evaluation cap."""
+    return [MaxEvaluations(-(-rule.cap // parts)) if isinstance(rule, MaxEvaluations) else rule for rule in rules]
+
+
+def should_stop(rules: List[Any], state: SearchState) -> Optional[str]:
+    """Name of the first rule that fires, else None."""
+    for rule in rules:
+        if rule(state):
+            return rule.name
+    return None
@@ -19,14 +19,45 @@ def main():
         type=str,
         help="Problem module, e.g., problems.problem_two_sum",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes: GA population evaluation in single-ga mode (default: EVALUATION_JOBS), "
+        "concurrent GA runs and baselines in all-experiments mode (default: EXPERIMENT_JOBS)",
+    )
+    parser.add_argument(
+        "--islands",
+        type=int,
+        default=None,
+        help="Island processes for the GA, with periodic migration (default: ISLAND_COUNT in config.py)",
+    )
+    parser.add_argument(
+        "--search",
+        choices=["ga", "mosa"],
+        default=None,
+        help="Scalar mutation-score GA or per-mutant archive search (default: SEARCH_MODE in config.py)",
+    )
+    parser.add_argument(
+        "--resume",
+        metavar="RUN_DIR",
+        default=None,
+        help="Continue an interrupted all-experiments batch from its checkpoints in RUN_DIR",
+    )
     args = parser.parse_args()
+    if args.resume and args.mode != "all-experiments":
+        raise ValueError("--resume only applies to mode=all-experiments")
 
     if args.mode == "single-ga":
         if not args.problem:
             raise ValueError("You must provide --problem for mode=single-ga")
-        result = run_ga_for_problem(args.problem)
+        result = run_ga_for_problem(args.problem, jobs=args.jobs, islands=args.islands, search=args.search)
         print("Best fitness:", result["best_fitness"])
         print("Best individual:", result["best_individual"])
+        if "suite" in result:
+            print("Killing suite:", result["suite"])
+        if "fitness_cache" in result:
+            print("Fitness cache:", result["fitness_cache"])
 
     elif args.mode == "single-random":
         if not args.problem:
@@ -35,7 +66,7 @@ def main():
         print("Random baseline mutation score:", result["mutation_score"])
 
     elif args.mode == "all-experiments":
-        run_all_experiments()
+        run_all_experiments(jobs=args.jobs, islands=args.islands, search=args.search, resume=args.resume)
 
 
 if __name__ == "__main__":
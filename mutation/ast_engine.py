@@ -0,0 +1,297 @@
+"""
+Native AST mutation engine (MUTATION_TOOL = "custom").
+
+Applies standard first-order operators to the AST of a problem's
+target_function (nested helpers included) and returns mutant records in the
+same shape as mutation.mutants, so they share the on-disk cache, the executor
+and the kill matrix. Mutants are compiled once per process and run in-process;
+no MutPy and no subprocess are involved.
+
+Operators:
+- AOR: arithmetic operator replacement (binary and augmented assignment)
+- ROR: relational operator replacement (non-boundary swaps, ==/!=, in/not in, is/is not)
+- BND: boundary shifts (< <=, > >=)
+- COI: conditional operator insertion (negate if/while/ternary/assert conditions)
+- CRP: constant replacement (numbers +1, strings emptied/filled, booleans flipped)
+- LCR: logical connector replacement (and/or)
+- SDL: statement deletion (assignment, expression, return, break/continue -> pass)
+
+Every mutant records the ``point`` it came from. build_schemata compiles all
+points into one meta-function where each point is a branch on the
+ACTIVE_MUTANT global, so switching mutants is a single integer assignment
+(mutant schemata, Untch et al.).
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import ast
+import copy
+import inspect
+
+OPERATORS = ("AOR", "ROR", "BND", "COI", "CRP", "LCR", "SDL")
+
+TARGET_NAME = "target_function"
+
+# Global read by the schemata meta-function; -1 runs the original code.
+ACTIVE_MUTANT = "__evobug_active_mutant__"
+
+_AOR = {
+    ast.Add: [ast.Sub],
+    ast.Sub: [ast.Add],
+    ast.Mult: [ast.FloorDiv, ast.Div],
+    ast.Div: [ast.Mult, ast.FloorDiv],
+    ast.FloorDiv: [ast.Mult, ast.Div],
+    ast.Mod: [ast.FloorDiv],
+    ast.Pow: [ast.Mult],
+}
+
+_ROR = {
+    ast.Lt: [ast.Gt, ast.GtE],
+    ast.LtE: [ast.Gt, ast.GtE],
+    ast.Gt: [ast.Lt, ast.LtE],
+    ast.GtE: [ast.Lt, ast.LtE],
+    ast.Eq: [ast.NotEq],
+    ast.NotEq: [ast.Eq],
+    ast.In: [ast.NotIn],
+    ast.NotIn: [ast.In],
+    ast.Is: [ast.IsNot],
+    ast.IsNot: [ast.Is],
+}
+
+_BND = {
+    ast.Lt: ast.LtE,
+    ast.LtE: ast.Lt,
+    ast.Gt: ast.GtE,
+    ast.GtE: ast.Gt,
+}
+
+_LCR = {ast.And: ast.Or, ast.Or: ast.And}
+
+_SDL_TYPES = (ast.Assign, ast.AugAssign, ast.AnnAssign, ast.Expr, ast.Return, ast.Break, ast.Continue)
+
+
+def _is_docstring(node: ast.AST) -> bool:
+    return isinstance(node, ast.Expr) and isinstance(node.value, ast.Constant) and isinstance(node.value.value, str)
+
+
+def _points(node: ast.AST) -> List[Tuple[str, Any]]:
+    """(operator, variant) pairs applicable at this node."""
+    points: List[Tuple[str, Any]] = []
+    if isinstance(node, (ast.BinOp, ast.AugAssign)):
+        for replacement in _AOR.get(type(node.op), []):
+            points.append(("AOR", replacement))
+    elif isinstance(node, ast.Compare):
+        for pos, op in enumerate(node.ops):
+            for replacement in _ROR.get(type(op), []):
+                points.append(("ROR", (pos, replacement)))
+            if type(op) in _BND:
+                points.append(("BND", (pos, _BND[type(op)])))
+    elif isinstance(node, ast.BoolOp):
+        points.append(("LCR", _LCR[type(node.op)]))
+    elif isinstance(node, ast.Constant) and not isinstance(node.value, bytes):
+        value = node.value
+        if isinstance(value, bool):
+            points.append(("CRP", not value))
+        elif isinstance(value, (int, float)):
+            points.append(("CRP", value + 1))
+        elif isinstance(value, str):
+            points.append(("CRP", "" if value else "mutant"))
+
+    if isinstance(node, (ast.If, ast.While, ast.IfExp, ast.Assert)):
+        points.append(("COI", None))
+    if isinstance(node, _SDL_TYPES):
+        points.append(("SDL", None))
+    return points
+
+
+def _apply(node: ast.AST, operator: str, variant: Any) -> ast.AST:
+    """Return the mutated replacement for ``node`` (node may be modified in place)."""
+    if operator == "AOR":
+        node.op = variant()
+    elif operator in ("ROR", "BND"):
+        pos, replacement = variant
+        node.ops[pos] = replacement()
+    elif operator == "LCR":
+        node.op = variant()
+    elif operator == "CRP":
+        node.value = variant
+    elif operator == "COI":
+        node.test = ast.UnaryOp(op=ast.Not(), operand=node.test)
+    elif operator == "SDL":
+        return ast.copy_location(ast.Pass(), node)
+    return node
+
+
+class _PointWalker(ast.NodeTransformer):
+    """
+    Pre-order walk numbering every node of the target function.
+
+    Without a target it collects mutation points; with one it swaps the node
+    at that index for its mutated version. Both passes number nodes the same
+    way because they walk identical (deep-copied) trees.
+    """
+
+    def __init__(self, target: Optional[int] = None, mutate: Optional[Callable[[ast.AST], ast.AST]] = None):
+        self.index = -1
+        self.target = target
+        self.mutate = mutate
+        self.points: List[Tuple[int, str, Any, Optional[int]]] = []
+        # f-string literal parts must stay plain constants (a schemata branch is not allowed there).
+        self._literal_parts: set = set()
+
+    def visit(self, node: ast.AST) -> ast.AST:
+        self.index += 1
+        my_index = self.index
+        if _is_docstring(node) or isinstance(node, ast.pattern) or id(node) in self._literal_parts:
+            return node
+        if isinstance(node, ast.JoinedStr):
+            self._literal_parts.update(id(value) for value in node.values if isinstance(value, ast.Constant))
+        if self.target is None:
+            for operator, variant in _points(node):
+                self.points.append((my_index, operator, variant, getattr(node, "lineno", None)))
+        node = self.generic_visit(node)
+        if my_index == self.target:
+            return self.mutate(node)
+        return node
+
+
+def _strip_annotations(func: ast.FunctionDef) -> None:
+    """Annotations are not behaviour; keep them out of the mutation space."""
+    for node in ast.walk(func):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            node.returns = None
+            for arg in node.args.args + node.args.kwonlyargs + node.args.posonlyargs:
+                arg.annotation = None
+            if node.args.vararg:
+                node.args.vararg.annotation = None
+            if node.args.kwarg:
+                node.args.kwarg.annotation = None
+
+
+def target_function_ast(problem_module) -> ast.FunctionDef:
+    """Parse the problem module and return target_function's AST (annotations stripped)."""
+    tree = ast.parse(inspect.getsource(problem_module))
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef) and node.name == TARGET_NAME:
+            _strip_annotations(node)
+            return node
+    raise ValueError(f"{problem_module.__name__} has no top-level {TARGET_NAME}")
+
+
+def mutation_points(func: ast.FunctionDef) -> List[Tuple[int, str, Any, Optional[int]]]:
+    """(node index, operator, variant, lineno) for every mutation of func's body."""
+    walker = _PointWalker()
+    for stmt in func.body:
+        walker.visit(copy.deepcopy(stmt))
+    return walker.points
+
+
+def _mutate_function(func: ast.FunctionDef, index: int, operator: str, variant: Any) -> ast.FunctionDef:
+    mutant = copy.deepcopy(func)
+    walker = _PointWalker(target=index, mutate=lambda node: _apply(node, operator, copy.deepcopy(variant)))
+    mutant.body = [walker.visit(stmt) for stmt in mutant.body]
+    return ast.fix_missing_locations(mutant)
+
+
+def _selected_points(
+    func: ast.FunctionDef, operators: Tuple[str, ...]
+) -> List[Tuple[int, int, str, Any, Optional[int]]]:
+    """(point, node index, operator, variant, lineno) for the chosen operators; ``point`` is stable per source."""
+    return [
+        (point, index, operator, variant, lineno)
+        for point, (index, operator, variant, lineno) in enumerate(mutation_points(func))
+        if operator in operators
+    ]
+
+
+def generate_mutants(problem_module, operators: Tuple[str, ...] = OPERATORS) -> List[Dict[str, Any]]:
+    """
+    Build first-order mutants of target_function.
+
+    Each record keeps the mutated function source with ``scope`` = "function":
+    the executor compiles it once and binds it into a copy of the original
+    module namespace instead of re-executing the whole module. ``point``
+    selects the same mutant in the schemata meta-function.
+    """
+    func = target_function_ast(problem_module)
+    mutants = []
+    for point, index, operator, variant, lineno in _selected_points(func, operators):
+        mutated = _mutate_function(func, index, operator, variant)
+        mutants.append(
+            {
+                "id": len(mutants),
+                "point": point,
+                "operator": operator,
+                "lineno": lineno,
+                "scope": "function",
+                "source": ast.unparse(mutated),
+            }
+        )
+    return mutants
+
+
+def _is_active(point: int) -> ast.Compare:
+    return ast.Compare(
+        left=ast.Name(id=ACTIVE_MUTANT, ctx=ast.Load()),
+        ops=[ast.Eq()],
+        comparators=[ast.Constant(value=point)],
+    )
+
+
+def _schema_branch(node: ast.AST, branches: List[Tuple[int, str, Any]]) -> ast.AST:
+    """
+    Wrap an (already schematised) node so each mutation point is one branch.
+
+    Expressions become a chain of conditional expressions, statements an
+    if/else chain; the original node is the final else. COI only switches the
+    condition, so loop and if bodies are never duplicated.
+    """
+    for point, operator, _ in branches:
+        if operator == "COI":
+            negated = ast.UnaryOp(op=ast.Not(), operand=copy.deepcopy(node.test))
+            node.test = ast.IfExp(test=_is_active(point), body=negated, orelse=node.test)
+    result = node
+    for point, operator, variant in reversed([b for b in branches if b[1] != "COI"]):
+        mutated = _apply(copy.deepcopy(node), operator, copy.deepcopy(variant))
+        if isinstance(node, ast.expr):
+            result = ast.IfExp(test=_is_active(point), body=mutated, orelse=result)
+        else:
+            result = ast.If(test=_is_active(point), body=[mutated], orelse=[result])
+        ast.copy_location(result, node)
+    return result
+
+
+class _SchemataWalker(_PointWalker):
+    """Same pre-order numbering as _PointWalker, wrapping every selected node in its branches."""
+
+    def __init__(self, by_index: Dict[int, List[Tuple[int, str, Any]]]):
+        super().__init__()
+        self.by_index = by_index
+
+    def visit(self, node: ast.AST) -> ast.AST:
+        self.index += 1
+        my_index = self.index
+        if _is_docstring(node) or isinstance(node, ast.pattern) or id(node) in self._literal_parts:
+            return node
+        if isinstance(node, ast.JoinedStr):
+            self._literal_parts.update(id(value) for value in node.values if isinstance(value, ast.Constant))
+        node = self.generic_visit(node)
+        if my_index in self.by_index:
+            return _schema_branch(node, self.by_index[my_index])
+        return node
+
+
+def build_schemata(problem_module, operators: Tuple[str, ...] = OPERATORS) -> str:
+    """
+    Source of a meta target_function containing every mutant of generate_mutants.
+
+    Setting the ACTIVE_MUTANT global to a mutant's ``point`` turns that mutant
+    on; -1 (or any unused value) runs the original code.
+    """
+    func = target_function_ast(problem_module)
+    by_index: Dict[int, List[Tuple[int, str, Any]]] = {}
+    for point, index, operator, variant, _ in _selected_points(func, operators):
+        by_index.setdefault(index, []).append((point, operator, variant))
+    meta = copy.deepcopy(func)
+    walker = _SchemataWalker(by_index)
+    meta.body = [walker.visit(stmt) for stmt in meta.body]
+    return ast.unparse(ast.fix_missing_locations(meta))
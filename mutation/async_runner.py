@@ -0,0 +1,212 @@
+"""
+asyncio front-end for the mutation scorer.
+
+`run_mutation_tests_async` mirrors `run_mutation_tests` but drives the child
+process (the cached-mutant executor or mut.py) with
+asyncio.create_subprocess_exec. A global semaphore caps concurrent children,
+timeouts and cancellations kill the child's whole process group, and file
+writes / YAML parsing run in worker threads so they overlap with running mutants.
+The native engine has no child and runs in a worker thread under the same cap.
+"""
+
+from typing import Any, Dict, List, Optional
+import asyncio
+import importlib
+import os
+import subprocess
+import tempfile
+import weakref
+
+from config import MUTATION_ASYNC_CONCURRENCY, MUTATION_TIMEOUT_SECONDS, MUTATION_TOOL
+from mutation import harness, mutpy_runner as runner
+from mutation.executor import read_stream
+from mutation.kill_matrix import get_kill_matrix
+
+# One semaphore per event loop (asyncio primitives are bound to the loop that first uses them).
+_SEMAPHORES: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+
+
+def _semaphore() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    # A semaphore that has bound to its loop keeps that loop alive as a key, so closed loops are dropped here.
+    for closed in [other for other in _SEMAPHORES if other.is_closed()]:
+        del _SEMAPHORES[closed]
+    sem = _SEMAPHORES.get(loop)
+    if sem is None:
+        sem = asyncio.Semaphore(max(1, MUTATION_ASYNC_CONCURRENCY))
+        _SEMAPHORES[loop] = sem
+    return sem
+
+
+async def _run_process_async(cmd: List[str], env: Dict[str, str], timeout: float) -> subprocess.CompletedProcess:
+    """
+    Run a child in its own process group under the global concurrency limit.
+
+    On timeout raises subprocess.TimeoutExpired; on timeout or cancellation the
+    whole process group is killed so no MutPy grandchildren are left behind.
+    """
+    async with _semaphore():
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env=env,
+            start_new_session=True,
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+        except asyncio.TimeoutError:
+            runner._kill_process_group(proc.pid)
+            await proc.wait()
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        except BaseException:
+            # Cancellation (GA stopped early) or any other error: do not leak the child.
+            runner._kill_process_group(proc.pid)
+            await asyncio.shield(proc.wait())
+            raise
+    return subprocess.CompletedProcess(cmd, proc.returncode, stdout.decode(), stderr.decode())
+
+
+async def _run_cached_mutants_async(
+    problem_module_name: str,
+    problem_module,
+    mutant_set: Dict[str, Any],
+    all_tests: List[Any],
+) -> Dict[str, Any]:
+    # Same plan and bookkeeping as the blocking path; only the child is awaited differently.
+    work = runner._matrix_work(problem_module, mutant_set, [all_tests])
+    if work is not None:
+        payload = runner._executor_payload(
+            problem_module_name, mutant_set, work.test_inputs, work.expected_outputs,
+            work.mutant_ids, work.coverage, work.plan,
+        )
+        stream_fd, payload["stream_path"] = tempfile.mkstemp(prefix="evobug_stream_", suffix=".jsonl")
+        os.close(stream_fd)
+        cmd, payload_path, result_path, tmp_dir = await asyncio.to_thread(runner._write_executor_payload, payload)
+        try:
+            proc = await _run_process_async(cmd, runner._child_env([]), MUTATION_TIMEOUT_SECONDS)
+            rows = await asyncio.to_thread(runner._read_executor_result, proc, result_path)
+        except (subprocess.TimeoutExpired, runner.ExecutorError) as exc:
+            reason = exc.reason if isinstance(exc, runner.ExecutorError) else "timeout"
+            partial = read_stream(payload["stream_path"], len(work.test_inputs))
+            if not partial["completed"]:
+                if isinstance(exc, runner.ExecutorError):
+                    return runner._executor_error_result(problem_module_name, all_tests, exc)
+                return runner._timeout_result()
+            work.store(partial, partial=True)
+            return runner._partial_result(
+                problem_module_name, mutant_set, all_tests, None, runner.PartialRun(reason, partial, exc)
+            )
+        finally:
+            await asyncio.to_thread(
+                runner._remove_quietly, payload_path, result_path, payload["stream_path"], tmp_dir
+            )
+        work.store(rows)
+    return runner._matrix_result(problem_module_name, get_kill_matrix(mutant_set), all_tests)
+
+
+async def _run_mutpy_async(problem_module_name: str, problem_module, all_tests: List[Any]) -> Dict[str, Any]:
+    expected_outputs = runner._baseline_outputs(problem_module, all_tests)
+    test_module_name, payload_path, env = await asyncio.to_thread(
+        runner._write_temp_tests, problem_module_name, all_tests, expected_outputs
+    )
+    report_path = runner._report_path()
+
+    mutpy_bin = runner._find_mutpy_bin(env)
+    if not mutpy_bin:
+        runner._remove_quietly(payload_path)
+        return runner._fallback_lightweight(problem_module_name, all_tests)
+
+    cmd = runner._mutpy_command(mutpy_bin, problem_module_name, test_module_name, harness.workspace(), report_path)
+    try:
+        proc = await _run_process_async(cmd, env, MUTATION_TIMEOUT_SECONDS)
+    except subprocess.TimeoutExpired:
+        runner._remove_quietly(payload_path, report_path)
+        return runner._timeout_result()
+    except BaseException:
+        runner._remove_quietly(payload_path, report_path)
+        raise
+    runner._remove_quietly(payload_path)
+
+    if proc.returncode != 0 or not os.path.exists(report_path):
+        return runner._mutpy_failure_result(problem_module_name, all_tests, proc)
+
+    try:
+        report = await asyncio.to_thread(runner._load_report, report_path)
+    except Exception as exc:
+        fallback = runner._fallback_lightweight(problem_module_name, all_tests)
+        fallback["error"] = f"yaml_parse_error:{exc}"
+        return fallback
+    finally:
+        runner._remove_quietly(report_path)
+    return runner._report_result(problem_module_name, all_tests, report)
+
+
+async def run_mutation_tests_async(
+    problem_module_name: str,
+    test_inputs: List[Any],
+    use_base_tests: bool = True,
+) -> Dict[str, Any]:
+    """
+    Async counterpart of mutation.mutpy_runner.run_mutation_tests (same result dict).
+
+    The native engine (MUTATION_TOOL = "custom") has no child process to await:
+    it runs in a worker thread under the concurrency cap, guarded by the
+    executor's deadline (SIGALRM only works on the main thread). Cancelling
+    the call returns at once, but the thread finishes the suite it started.
+    """
+    problem_module = importlib.import_module(problem_module_name)
+    all_tests = runner._collect_tests(problem_module, test_inputs, use_base_tests)
+
+    if os.getenv("EVOBUG_MUTPY", "1") == "0":
+        return runner._fallback_lightweight(problem_module_name, all_tests)
+    if MUTATION_TOOL == "custom":
+        async with _semaphore():
+            return await asyncio.to_thread(runner.run_mutation_tests, problem_module_name, test_inputs, use_base_tests)
+
+    mutant_set = runner._load_mutant_set(problem_module_name)
+    if mutant_set is not None and mutant_set["mutants"]:
+        return await _run_cached_mutants_async(problem_module_name, problem_module, mutant_set, all_tests)
+    return await _run_mutpy_async(problem_module_name, problem_module, all_tests)
+
+
+async def run_many_async(
+    problem_module_name: str,
+    suites: List[List[Any]],
+    use_base_tests: bool = True,
+    stop_event: Optional[asyncio.Event] = None,
+) -> List[Optional[Dict[str, Any]]]:
+    """
+    Score several suites concurrently, in order.
+
+    Setting ``stop_event`` (e.g. when a GA run stops early) cancels every
+    evaluation that has not finished yet; their slots come back as None and
+    their child processes are killed.
+    """
+    tasks = [
+        asyncio.ensure_future(run_mutation_tests_async(problem_module_name, suite, use_base_tests))
+        for suite in suites
+    ]
+    watcher: Optional[asyncio.Future] = None
+    if stop_event is not None:
+        async def _cancel_on_stop() -> None:
+            await stop_event.wait()
+            for task in tasks:
+                task.cancel()
+
+        watcher = asyncio.ensure_future(_cancel_on_stop())
+    try:
+        outcomes: List[Any] = await asyncio.gather(*tasks, return_exceptions=True)
+    finally:
+        if watcher is not None:
+            watcher.cancel()
+
+    results: List[Optional[Dict[str, Any]]] = []
+    for outcome in outcomes:
+        if isinstance(outcome, asyncio.CancelledError):
+            results.append(None)
+        elif isinstance(outcome, BaseException):
+            raise outcome
+        else:
+            results.append(outcome)
+    return results
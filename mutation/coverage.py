@@ -0,0 +1,141 @@
+"""
+Per-input line coverage of target_function, for pruning mutant executions.
+
+A mutant behaves exactly like the original until its mutated line runs, so a
+test whose run of the original never reaches that line cannot kill it. Each
+distinct input is traced once, together with the run that produces its
+expected output, and the pair is memoized per process. Lines are recorded
+for every frame of the problem module's source file (nested helpers and
+comprehensions included) with sys.monitoring where available (3.12+) and
+sys.settrace otherwise. Line events are exact since PEP 626 (3.10+), so on
+older interpreters nothing is pruned.
+"""
+
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+import ast
+import inspect
+import sys
+
+from mutation.kill_matrix import input_key
+
+# Line events are only guaranteed for every executed line since PEP 626.
+SUPPORTED = sys.version_info >= (3, 10)
+
+# (problem module name, input key) -> (baseline output, covered lines).
+_BASELINES: Dict[Tuple[str, str], Tuple[Any, FrozenSet[int]]] = {}
+
+# problem module name -> (first, last) line of target_function's body.
+_SPANS: Dict[str, Tuple[int, int]] = {}
+
+
+def _call_with_input(fn, test_input):
+    if isinstance(test_input, (tuple, list)):
+        return fn(*test_input)
+    return fn(test_input)
+
+
+def _lines_settrace(filename: str, run: Callable[[], None]) -> Set[int]:
+    lines: Set[int] = set()
+
+    def _local(frame, event, arg):
+        if event == "line":
+            lines.add(frame.f_lineno)
+        return _local
+
+    def _global(frame, event, arg):
+        return _local if frame.f_code.co_filename == filename else None
+
+    previous = sys.gettrace()
+    sys.settrace(_global)
+    try:
+        run()
+    finally:
+        sys.settrace(previous)
+    return lines
+
+
+def _lines_monitoring(filename: str, run: Callable[[], None]) -> Optional[Set[int]]:
+    """sys.monitoring LINE events; None if the coverage tool id is taken (e.g. by coverage.py)."""
+    monitoring = sys.monitoring
+    tool = monitoring.COVERAGE_ID
+    try:
+        monitoring.use_tool_id(tool, "evobug")
+    except ValueError:
+        return None
+    lines: Set[int] = set()
+
+    def _line(code, line_number):
+        if code.co_filename == filename:
+            lines.add(line_number)
+        # Each location only needs to be seen once.
+        return monitoring.DISABLE
+
+    try:
+        monitoring.register_callback(tool, monitoring.events.LINE, _line)
+        monitoring.set_events(tool, monitoring.events.LINE)
+        run()
+    finally:
+        monitoring.set_events(tool, 0)
+        monitoring.register_callback(tool, monitoring.events.LINE, None)
+        monitoring.restart_events()
+        monitoring.free_tool_id(tool)
+    return lines
+
+
+def run_traced(problem_module, test_input: Any) -> Tuple[Any, FrozenSet[int]]:
+    """Run the original target_function on one input; returns (output or raised exception, covered lines)."""
+    target_fn = getattr(problem_module, "target_function")
+    outcome: List[Any] = [None]
+
+    def _run() -> None:
+        try:
+            outcome[0] = _call_with_input(target_fn, test_input)
+        except Exception as exc:  # noqa: BLE001 - capture for comparison
+            outcome[0] = exc
+
+    filename = target_fn.__code__.co_filename
+    lines = None
+    if hasattr(sys, "monitoring"):
+        lines = _lines_monitoring(filename, _run)
+    if lines is None:
+        lines = _lines_settrace(filename, _run)
+    return outcome[0], frozenset(lines)
+
+
+def baseline_runs(problem_module, test_inputs: Iterable[Any]) -> Tuple[List[Any], List[FrozenSet[int]]]:
+    """Expected outputs and covered lines for test_inputs, each input traced once per process."""
+    outputs, coverage = [], []
+    for test_input in test_inputs:
+        key = (problem_module.__name__, input_key(test_input))
+        if key not in _BASELINES:
+            _BASELINES[key] = run_traced(problem_module, test_input)
+        output, lines = _BASELINES[key]
+        outputs.append(output)
+        coverage.append(lines)
+    return outputs, coverage
+
+
+def body_span(problem_module) -> Tuple[int, int]:
+    """First and last source line of target_function's body (the lines a call can execute)."""
+    name = problem_module.__name__
+    if name not in _SPANS:
+        tree = ast.parse(inspect.getsource(problem_module))
+        func = next(
+            node for node in tree.body
+            if isinstance(node, ast.FunctionDef) and node.name == "target_function"
+        )
+        _SPANS[name] = (func.body[0].lineno, func.body[-1].end_lineno)
+    return _SPANS[name]
+
+
+def reaches(mutant: Dict[str, Any], lines: FrozenSet[int], span: Tuple[int, int]) -> bool:
+    """
+    False only when the test provably cannot execute the mutant's change.
+
+    Mutants without a line, or outside target_function's body (module
+    constants, default arguments, other functions), always count as reached.
+    """
+    lineno = mutant.get("lineno")
+    if lineno is None or not span[0] <= lineno <= span[1]:
+        return True
+    return lineno in lines
@@ -0,0 +1,514 @@
+"""
+Executor for cached mutant sets.
+
+Loads each cached mutant as a stand-in for the problem module and runs every
+test input against its target_function, recording which mutants each input
+kills (one row of the kill matrix per input). The same checks as the generated
+unittest module are applied so scores stay comparable with MutPy's. The parent normally runs
+this in a child process (`python -m mutation.executor <payload> <result>`) so a
+hanging mutant cannot stall the GA.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import contextlib
+import importlib
+import json
+import pickle
+import signal
+import sys
+import threading
+import time
+import types
+
+from config import MUTANT_LINE_BUDGET, MUTANT_LINE_BUDGET_FACTOR, MUTANT_LINE_BUDGET_MIN, MUTANT_SCHEMATA
+from mutation.ast_engine import ACTIVE_MUTANT
+from mutation.coverage import body_span, reaches
+from mutation.mutants import _read_cache, _write_cache, load_mutant_set_file
+from mutation.outcomes import error_status, is_kill
+
+# Per-(mutant, test) wall-clock guard, scaled from the original's runtime (MutPy does the same).
+_TIMEOUT_FACTOR = 10
+_CELL_TIMEOUT_FLOOR_SECONDS = 0.1
+# With MUTANT_LINE_BUDGET the line-event budget decides timeouts, and the wall clock is only a
+# backstop for mutants stuck without line events (a huge C-level operation), set far beyond load noise.
+_BACKSTOP_FACTOR = 100
+_BACKSTOP_FLOOR_SECONDS = 2.0
+
+# Compiled mutant modules, keyed by (mutant set key, mutant id).
+_MODULES: Dict[Any, types.ModuleType] = {}
+
+# Schemata modules (one meta target_function per native mutant set), keyed by mutant set key.
+_SCHEMATA: Dict[str, Optional[types.ModuleType]] = {}
+
+# Held by run_matrix: a schemata module switches mutants through one module global,
+# so threads of one process run their matrices one at a time.
+_RUN_LOCK = threading.Lock()
+
+
+class MutantTimeout(Exception):
+    """Raised inside a mutant run that exceeded its time limit or line budget."""
+
+
+def call_with_input(fn, test_input):
+    if isinstance(test_input, (tuple, list)):
+        return fn(*test_input)
+    return fn(test_input)
+
+
+def _is_subsequence(s: str, t: str) -> bool:
+    it = iter(t)
+    return all(c in it for c in s)
+
+
+_TWO_SUM_BASE_CHECKS = [
+    ([2, 7, 11, 15], 9),
+    ([3, 3], 6),
+    ([3, 2, 4], 6),
+    ([-1, -2, -3, -4, -5], -8),
+    ([0, 4, 3, 0], 0),
+    ([1, 2, 3, 4, 5], 6),
+    ([1, 2, 3], 2),
+    ([10, -10, 20, -20], 0),
+    ([5, 5, 5, 5, 3, 2], 7),
+]
+
+
+def _check_problem_specific(problem_module_name: str, module, args, result) -> None:
+    """Problem-specific assertions mirrored from the generated unittest module."""
+    if "problem_two_sum" in problem_module_name:
+        if isinstance(result, list) and result:
+            assert len(result) == 2
+            assert result[0] != result[1]
+            assert all(0 <= i < len(args[0]) for i in result)
+            assert args[0][result[0]] + args[0][result[1]] == args[1]
+        # Guard critical constants to catch mutants touching specs or bases.
+        assert module.INPUT_SPEC["args"][0]["value_range"] == (-100, 100)
+        assert module.INPUT_SPEC["args"][1]["value_range"] == (-200, 200)
+        assert module.INPUT_SPEC["args"][0]["length_range"] == (2, 20)
+        assert module.INPUT_SPEC["args"][0]["name"] == "nums"
+        assert module.INPUT_SPEC["args"][1]["name"] == "target"
+        for bc in _TWO_SUM_BASE_CHECKS:
+            assert bc in module.BASE_TESTS
+    if "problem_rotated_sort" in problem_module_name:
+        if isinstance(result, int) and result != -1:
+            assert 0 <= result < len(args[0])
+            assert args[0][result] == args[1]
+    if "problem_supersequence" in problem_module_name:
+        if isinstance(result, str):
+            assert _is_subsequence(args[0], result)
+            assert _is_subsequence(args[1], result)
+
+
+def outcome_kills(problem_module_name: str, module, args, expected) -> bool:
+    """
+    Run one test input against a (mutant) module and report whether the test fails.
+
+    Any assertion failure or unexpected exception counts as a kill, except a
+    TypeError (see mutation.outcomes), matching how MutPy treats unittest
+    failures and errors.
+    """
+    target_fn = getattr(module, "target_function")
+    if isinstance(expected, Exception):
+        try:
+            call_with_input(target_fn, args)
+        except MutantTimeout:
+            raise
+        except Exception:
+            return False
+        return True
+    try:
+        result = call_with_input(target_fn, args)
+        if result != expected:
+            return True
+        _check_problem_specific(problem_module_name, module, args, result)
+    except MutantTimeout:
+        raise
+    except Exception as exc:  # noqa: BLE001 - AssertionError and test errors both kill
+        return is_kill(error_status(type(exc).__name__))
+    return False
+
+
+def load_mutant_module(problem_module_name: str, set_key: str, mutant: Dict[str, Any]) -> types.ModuleType:
+    """
+    Compile and execute a mutant's source once per process.
+
+    Whole-module mutants (MutPy) are executed as a fresh module. Mutants with
+    ``scope`` = "function" (mutation.ast_engine) only carry target_function, so
+    they are bound into a copy of the original module's namespace.
+    """
+    memo_key = (set_key, mutant["id"])
+    if memo_key not in _MODULES:
+        module = types.ModuleType(problem_module_name)
+        if mutant.get("scope") == "function":
+            module.__dict__.update(importlib.import_module(problem_module_name).__dict__)
+        code = compile(mutant["source"], f"<mutant {mutant['id']} of {problem_module_name}>", "exec")
+        exec(code, module.__dict__)
+        _MODULES[memo_key] = module
+    return _MODULES[memo_key]
+
+
+def load_schemata_module(problem_module_name: str, mutant_set: Dict[str, Any]) -> Optional[types.ModuleType]:
+    """
+    Compile the mutant set's schemata meta-function once per process.
+
+    Only native (mutation.ast_engine) sets qualify: every mutant must carry a
+    ``point``. The meta-function source is stored next to the mutant cache
+    file, so it is built once per problem source. Returns None otherwise, or if the meta-function cannot be
+    built, and callers fall back to one module per mutant.
+    """
+    key = mutant_set["key"]
+    if key not in _SCHEMATA:
+        module = None
+        if all(m.get("scope") == "function" and "point" in m for m in mutant_set["mutants"]):
+            from mutation.ast_engine import build_schemata
+
+            try:
+                original = importlib.import_module(problem_module_name)
+                schemata_path = f"{mutant_set['path']}.schemata" if mutant_set.get("path") else None
+                source = _read_cache(schemata_path) if schemata_path else None
+                if source is None:
+                    source = build_schemata(original)
+                    if schemata_path:
+                        _write_cache(schemata_path, source)
+                module = types.ModuleType(problem_module_name)
+                module.__dict__.update(original.__dict__)
+                module.__dict__[ACTIVE_MUTANT] = -1
+                code = compile(source, f"<schemata of {problem_module_name}>", "exec")
+                exec(code, module.__dict__)
+            except Exception:  # noqa: BLE001 - fall back to per-mutant modules
+                module = None
+        _SCHEMATA[key] = module
+    return _SCHEMATA[key]
+
+
+@contextlib.contextmanager
+def _time_limit(seconds: float):
+    """SIGALRM-based guard; a no-op where signals are unavailable (non-main thread, Windows; see _guard)."""
+    def _raise(signum, frame):
+        raise MutantTimeout()
+
+    try:
+        previous = signal.signal(signal.SIGALRM, _raise)
+    except (AttributeError, ValueError):
+        yield
+        return
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+class _LineCounter:
+    """
+    sys.settrace hook counting line events in frames entered while active.
+
+    Raises MutantTimeout past ``budget`` line events or, if given, once
+    time.monotonic() passes ``deadline``.
+    """
+
+    def __init__(self, budget: Optional[int] = None, deadline: Optional[float] = None):
+        self.budget = budget
+        self.deadline = deadline
+        self.events = 0
+
+    def _local(self, frame, event, arg):
+        if event == "line":
+            self.events += 1
+            if self.budget is not None and self.events > self.budget:
+                raise MutantTimeout()  # also unsets the hook; active() restores the previous one
+            if self.deadline is not None and time.monotonic() > self.deadline:
+                raise MutantTimeout()
+        return self._local
+
+    def _global(self, frame, event, arg):
+        return self._local
+
+    @contextlib.contextmanager
+    def active(self):
+        previous = sys.gettrace()
+        sys.settrace(self._global)
+        try:
+            yield self
+        finally:
+            sys.settrace(previous)
+
+
+@contextlib.contextmanager
+def _guard(limit: float, budget: Optional[int]):
+    """
+    Cell guard: a line-event budget (if given) inside a wall-clock limit.
+
+    SIGALRM only reaches the main thread, so on other threads the line
+    counter enforces the wall-clock limit as a deadline.
+    """
+    if threading.current_thread() is not threading.main_thread() or not hasattr(signal, "SIGALRM"):
+        with _LineCounter(budget, time.monotonic() + limit).active():
+            yield
+        return
+    with _time_limit(limit):
+        if budget is None:
+            yield
+        else:
+            with _LineCounter(budget).active():
+                yield
+
+
+def _baseline_runs(
+    problem_module_name: str, test_inputs: List[Any], expected_outputs: List[Any], count_lines: bool
+) -> List[Tuple[float, int]]:
+    """
+    (seconds, line events) of one guarded cell per input, run on the original.
+
+    The cell is the same outcome_kills call _guard wraps for a mutant (the
+    target_function call, the oracle and the problem-specific checks).
+    Events are 0 unless counted.
+    """
+    original = importlib.import_module(problem_module_name)
+    runs = []
+    for args, expected in zip(test_inputs, expected_outputs):
+        counter = _LineCounter()
+        start = time.perf_counter()
+        if count_lines:
+            with counter.active():
+                outcome_kills(problem_module_name, original, args, expected)
+        else:
+            outcome_kills(problem_module_name, original, args, expected)
+        runs.append((time.perf_counter() - start, counter.events))
+    return runs
+
+
+def cell_guards(
+    problem_module_name: str, test_inputs: List[Any], expected_outputs: List[Any]
+) -> List[Tuple[float, Optional[int]]]:
+    """
+    (wall-clock limit, line budget) per input, calibrated on the original.
+
+    With MUTANT_LINE_BUDGET a mutant may execute MUTANT_LINE_BUDGET_FACTOR
+    times the original cell's line events on the same input (at least
+    MUTANT_LINE_BUDGET_MIN) before it is stopped as a timeout, so a looping
+    mutant is caught within milliseconds and whether a mutant times out does
+    not depend on machine load. The wall-clock limit is then only a backstop
+    (_BACKSTOP_FACTOR times the traced original, at least
+    _BACKSTOP_FLOOR_SECONDS). Without the budget it is the MutPy-style limit.
+    """
+    guards = []
+    runs = _baseline_runs(problem_module_name, test_inputs, expected_outputs, count_lines=MUTANT_LINE_BUDGET)
+    for seconds, events in runs:
+        if MUTANT_LINE_BUDGET:
+            budget = max(MUTANT_LINE_BUDGET_MIN, MUTANT_LINE_BUDGET_FACTOR * events)
+            guards.append((max(_BACKSTOP_FLOOR_SECONDS, _BACKSTOP_FACTOR * seconds), budget))
+        else:
+            guards.append((max(_CELL_TIMEOUT_FLOOR_SECONDS, _TIMEOUT_FACTOR * seconds), None))
+    return guards
+
+
+def line_budget_signature() -> str:
+    """The line-budget settings; they decide which mutant runs time out."""
+    if not MUTANT_LINE_BUDGET:
+        return "line_budget=0"
+    return (
+        f"line_budget={MUTANT_LINE_BUDGET_FACTOR}x,min={MUTANT_LINE_BUDGET_MIN},cell,"
+        f"backstop={_BACKSTOP_FACTOR}x,{_BACKSTOP_FLOOR_SECONDS}s"
+    )
+
+
+def _stream_mutant(
+    stream, mutant_id: int, outcomes: Dict[int, bool], timed_out: List[int], incompetent: bool = False
+) -> None:
+    """Append one finished mutant (test index -> killed, timed-out test indices) to the stream."""
+    if stream is None:
+        return
+    record = {
+        "id": mutant_id,
+        "killed": [idx for idx, killed in outcomes.items() if killed],
+        "timeouts": timed_out,
+        "evaluated": list(outcomes),
+        "incompetent": incompetent,
+    }
+    stream.write(json.dumps(record) + "\n")
+    stream.flush()
+
+
+def read_stream(stream_path: str, test_count: int) -> Dict[str, Any]:
+    """
+    Rebuild a run_matrix result from the mutants a (killed or crashed) run streamed.
+
+    Only finished mutants are included: ``evaluated`` lists them per test and
+    ``completed`` lists their ids; a torn last line is ignored.
+    """
+    rows: List[List[int]] = [[] for _ in range(test_count)]
+    timeouts: List[List[int]] = [[] for _ in range(test_count)]
+    evaluated: List[List[int]] = [[] for _ in range(test_count)]
+    incompetent: List[int] = []
+    completed: List[int] = []
+    try:
+        with open(stream_path, "r") as f:
+            lines = f.read().splitlines()
+    except OSError:
+        lines = []
+    for line in lines:
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue
+        completed.append(record["id"])
+        for idx in record["killed"]:
+            rows[idx].append(record["id"])
+        for idx in record["timeouts"]:
+            timeouts[idx].append(record["id"])
+        for idx in record["evaluated"]:
+            evaluated[idx].append(record["id"])
+        if record["incompetent"]:
+            incompetent.append(record["id"])
+    return {
+        "rows": rows,
+        "timeouts": timeouts,
+        "incompetent": incompetent,
+        "evaluated": evaluated,
+        "completed": completed,
+    }
+
+
+def run_matrix(
+    problem_module_name: str,
+    mutant_set: Dict[str, Any],
+    test_inputs: List[Any],
+    expected_outputs: List[Any],
+    mutant_ids: Optional[List[int]] = None,
+    coverage: Optional[List[Iterable[int]]] = None,
+    plan: Optional[Dict[int, List[List[int]]]] = None,
+    stream_path: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Run every test against every mutant (or only ``mutant_ids``) and record which mutants each test kills.
+
+    Returns ``rows`` (killed mutant ids per test, aligned with test_inputs),
+    ``timeouts`` (mutant ids that hit the guard per test, which also count
+    as killed; see cell_guards) and ``incompetent``
+    (mutants that fail to compile/import and can never be killed). Native
+    mutant sets run from their schemata module when MUTANT_SCHEMATA is set.
+    With ``coverage`` (lines of the original each test executes, see
+    mutation.coverage) pairs whose test never reaches the mutated line are not
+    run and count as survivors; ``pruned`` is how many were skipped.
+
+    With ``plan`` only the planned mutants run: for each, groups of test
+    indices (one per suite that has not killed it yet) are tried in the given
+    order, and a group stops at its first kill. ``evaluated`` then lists, per
+    test, the mutants whose outcome on it is known. ``executed`` counts the
+    (mutant, test) pairs actually run.
+
+    With ``stream_path`` each mutant's outcomes are appended there as one JSON
+    line as soon as it finishes, so a parent that has to kill this run can
+    still use them (see read_stream).
+
+    Calls from several threads of one process run one at a time.
+    """
+    with _RUN_LOCK:
+        return _run_matrix(
+            problem_module_name, mutant_set, test_inputs, expected_outputs, mutant_ids, coverage, plan, stream_path
+        )
+
+
+def _run_matrix(
+    problem_module_name: str,
+    mutant_set: Dict[str, Any],
+    test_inputs: List[Any],
+    expected_outputs: List[Any],
+    mutant_ids: Optional[List[int]],
+    coverage: Optional[List[Iterable[int]]],
+    plan: Optional[Dict[int, List[List[int]]]],
+    stream_path: Optional[str],
+) -> Dict[str, Any]:
+    guards = cell_guards(problem_module_name, test_inputs, expected_outputs)
+    rows: List[List[int]] = [[] for _ in test_inputs]
+    timeouts: List[List[int]] = [[] for _ in test_inputs]
+    evaluated: List[List[int]] = [[] for _ in test_inputs]
+    incompetent: List[int] = []
+    pruned = 0
+    executed = 0
+    covered = None if coverage is None else [frozenset(lines) for lines in coverage]
+    span = body_span(importlib.import_module(problem_module_name)) if covered is not None else None
+    schemata = load_schemata_module(problem_module_name, mutant_set) if MUTANT_SCHEMATA else None
+    all_tests = [list(range(len(test_inputs)))]
+    stream = open(stream_path, "a") if stream_path else None
+    try:
+        wanted = None if mutant_ids is None else set(mutant_ids)
+        for mutant in mutant_set["mutants"]:
+            if wanted is not None and mutant["id"] not in wanted:
+                continue
+            if plan is not None and mutant["id"] not in plan:
+                continue
+            groups = all_tests if plan is None else plan[mutant["id"]]
+            if schemata is not None:
+                schemata.__dict__[ACTIVE_MUTANT] = mutant["point"]
+                module = schemata
+            else:
+                try:
+                    module = load_mutant_module(problem_module_name, mutant_set["key"], mutant)
+                except Exception:  # noqa: BLE001 - mutant fails to compile/import
+                    incompetent.append(mutant["id"])
+                    tests = sorted({idx for group in groups for idx in group})
+                    for idx in tests:
+                        evaluated[idx].append(mutant["id"])
+                    _stream_mutant(stream, mutant["id"], dict.fromkeys(tests, False), [], incompetent=True)
+                    continue
+            outcomes: Dict[int, bool] = {}
+            timed_out: List[int] = []
+            for group in groups:
+                if plan is not None and any(outcomes.get(idx) for idx in group):
+                    continue  # an earlier group already found a killer in this one
+                for idx in group:
+                    if idx in outcomes:
+                        continue
+                    killed = False
+                    if covered is not None and not reaches(mutant, covered[idx], span):
+                        pruned += 1
+                    else:
+                        executed += 1
+                        try:
+                            with _guard(*guards[idx]):
+                                killed = outcome_kills(
+                                    problem_module_name, module, test_inputs[idx], expected_outputs[idx]
+                                )
+                        except MutantTimeout:
+                            # Killed by timeout, as under MutPy; also listed in ``timeouts``.
+                            timeouts[idx].append(mutant["id"])
+                            timed_out.append(idx)
+                            killed = True
+                    outcomes[idx] = killed
+                    if killed:
+                        rows[idx].append(mutant["id"])
+                        if plan is not None:
+                            break
+            for idx in outcomes:
+                evaluated[idx].append(mutant["id"])
+            _stream_mutant(stream, mutant["id"], outcomes, timed_out)
+    finally:
+        if schemata is not None:
+            schemata.__dict__[ACTIVE_MUTANT] = -1
+        if stream is not None:
+            stream.close()
+    result = {"rows": rows, "timeouts": timeouts, "incompetent": incompetent, "pruned": pruned, "executed": executed}
+    if plan is not None:
+        result["evaluated"] = evaluated
+    return result
+
+
+def main(argv: List[str]) -> int:
+    payload_path, result_path = argv[0], argv[1]
+    with open(payload_path, "rb") as f:
+        payload = pickle.load(f)
+    mutant_set = load_mutant_set_file(payload["mutant_path"], payload["problem"])
+    matrix = run_matrix(
+        payload["problem"], mutant_set, payload["tests"], payload["expected"],
+        payload.get("mutant_ids"), payload.get("coverage"), payload.get("plan"), payload.get("stream_path"),
+    )
+    with open(result_path, "w") as f:
+        json.dump(matrix, f)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
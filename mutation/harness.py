@@ -0,0 +1,93 @@
+"""
+Per-process workspace and payloads for the static MutPy test harness.
+
+MutPy needs an importable unittest module. Instead of generating one per
+evaluation, mutation/mutpy_harness.py is copied once into a per-process
+workspace (on tmpfs when available, see MUTATION_WORKSPACE_DIR) and every
+run only writes a pickled payload of (input, expected) pairs next to it.
+Codegen is gone, the harness is compiled once per workspace, and the
+per-call file traffic is one payload file whatever the suite size.
+"""
+
+from typing import Any, List, Optional, Tuple
+import multiprocessing.util
+import os
+import pickle
+import shutil
+import tempfile
+
+from config import MUTATION_WORKSPACE_DIR
+
+# Name MutPy imports the harness as (--unit-test).
+MODULE_NAME = "evobug_harness"
+
+_SOURCE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "mutpy_harness.py")
+
+# (pid, path): a forked child must not share its parent's workspace.
+_WORKSPACE: Optional[Tuple[int, str]] = None
+
+
+def _base_dir() -> str:
+    if MUTATION_WORKSPACE_DIR:
+        return MUTATION_WORKSPACE_DIR
+    if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+        return "/dev/shm"
+    return tempfile.gettempdir()
+
+
+def workspace() -> str:
+    """This process's workspace directory, created (with the harness in it) on first use."""
+    global _WORKSPACE
+    if _WORKSPACE is not None and _WORKSPACE[0] == os.getpid() and os.path.exists(
+        os.path.join(_WORKSPACE[1], f"{MODULE_NAME}.py")
+    ):
+        return _WORKSPACE[1]
+    base = _base_dir()
+    try:
+        os.makedirs(base, exist_ok=True)
+        path = tempfile.mkdtemp(prefix="evobug_ws_", dir=base)
+    except OSError:
+        path = tempfile.mkdtemp(prefix="evobug_ws_")
+    shutil.copyfile(_SOURCE, os.path.join(path, f"{MODULE_NAME}.py"))
+    # Unlike atexit, this also runs when a multiprocessing worker exits.
+    multiprocessing.util.Finalize(None, shutil.rmtree, args=(path, True), exitpriority=0)
+    _WORKSPACE = (os.getpid(), path)
+    return path
+
+
+def scratch_file(prefix: str, suffix: str) -> str:
+    """Create an empty uniquely named file in the workspace and return its path."""
+    fd, path = tempfile.mkstemp(prefix=prefix, suffix=suffix, dir=workspace())
+    os.close(fd)
+    return path
+
+
+def write_payload(
+    problem_module_name: str,
+    suites: List[List[Any]],
+    expected_per_suite: List[List[Any]],
+    record_path: Optional[str] = None,
+) -> str:
+    """
+    Pickle the suites for the harness; returns the payload path.
+
+    An expected exception is stored as ``raises`` (the harness only checks
+    that the mutant raises something), so exception objects never need to
+    be picklable.
+    """
+    payload = {
+        "problem": problem_module_name,
+        "suites": [
+            [
+                (args, True, None) if isinstance(expected, Exception) else (args, False, expected)
+                for args, expected in zip(tests, expected_outputs)
+            ]
+            for tests, expected_outputs in zip(suites, expected_per_suite)
+        ],
+        "record_path": record_path,
+    }
+    path = scratch_file("payload_", ".pkl")
+    with open(path, "wb") as f:
+        pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+    return path
+
@@ -0,0 +1,159 @@
+"""
+Mutant × input kill matrix with per-input memoization.
+
+Each distinct test input is run against every mutant once; the set of mutants
+it kills is stored as a row. A suite's mutation score is then the union of its
+rows, so re-scoring duplicated elites or BASE_TESTS entries costs nothing.
+Rows may also be partial, covering only a sample of the mutants (see
+mutation.sampling) or only the mutants no other test of a suite had killed
+(see pending); they are completed as later calls evaluate more mutants.
+"""
+
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set
+import threading
+
+
+def input_key(test_input: Any) -> str:
+    """Stable key for a decoded test input (matches run_mutation_tests' dedupe)."""
+    return repr(test_input)
+
+
+class KillMatrix:
+    """Kill rows for one cached mutant set, keyed by input."""
+
+    def __init__(self, mutant_set: Dict[str, Any]):
+        self.mutant_set_key = mutant_set["key"]
+        self.total = len(mutant_set["mutants"])
+        self.ids: FrozenSet[int] = frozenset(m["id"] for m in mutant_set["mutants"])
+        self.rows: Dict[str, FrozenSet[int]] = {}
+        self.timeouts: Dict[str, FrozenSet[int]] = {}
+        # Mutants each row has been evaluated against (all of them unless sampled).
+        self.evaluated: Dict[str, FrozenSet[int]] = {}
+        self.incompetent: FrozenSet[int] = frozenset()
+        # (mutant, input) pairs skipped because the input never reaches the mutated line.
+        self.pruned = 0
+        # Execution counters: mutant runs requested, (mutant, input) pairs they had pending, pairs executed.
+        self.mutant_runs = 0
+        self.pending_tests = 0
+        self.executed = 0
+        # Runs scored on several threads share this matrix (see get_kill_matrix); updates hold the lock.
+        self._lock = threading.Lock()
+
+    def missing(self, test_inputs: Iterable[Any], mutant_ids: Optional[Iterable[int]] = None) -> List[Any]:
+        """Distinct inputs whose row does not cover mutant_ids (default: all mutants), in first-seen order."""
+        wanted = self.ids if mutant_ids is None else frozenset(mutant_ids)
+        seen: Set[str] = set()
+        missing = []
+        for test_input in test_inputs:
+            key = input_key(test_input)
+            if key in seen or wanted <= self.evaluated.get(key, frozenset()):
+                continue
+            seen.add(key)
+            missing.append(test_input)
+        return missing
+
+    def pending(
+        self,
+        suites: Iterable[Iterable[Any]],
+        mutant_ids: Optional[Iterable[int]] = None,
+    ) -> Dict[int, List[List[Any]]]:
+        """
+        What each suite still needs to know, per mutant.
+
+        For every mutant (default: all) that no input of a suite is known to
+        kill, the suite's distinct inputs not yet run against it; mutants
+        decided for every suite are left out.
+        """
+        wanted = sorted(self.ids if mutant_ids is None else frozenset(mutant_ids))
+        pending: Dict[int, List[List[Any]]] = {}
+        for suite in suites:
+            unique: Dict[str, Any] = {}
+            for test_input in suite:
+                unique.setdefault(input_key(test_input), test_input)
+            killed: Set[int] = set()
+            for key in unique:
+                killed |= self.rows.get(key, frozenset())
+            for mutant_id in wanted:
+                if mutant_id in killed:
+                    continue
+                tests = [t for key, t in unique.items() if mutant_id not in self.evaluated.get(key, frozenset())]
+                if tests:
+                    pending.setdefault(mutant_id, []).append(tests)
+        return pending
+
+    def add_rows(
+        self,
+        test_inputs: List[Any],
+        result: Dict[str, Any],
+        mutant_ids: Optional[Iterable[int]] = None,
+    ) -> None:
+        """
+        Store rows returned by mutation.executor.run_matrix for test_inputs.
+
+        Each row covers mutant_ids (default all), or the result's own
+        ``evaluated`` lists when it ran a plan.
+        """
+        evaluated = self.ids if mutant_ids is None else frozenset(mutant_ids)
+        per_test = result.get("evaluated") or [evaluated] * len(test_inputs)
+        with self._lock:
+            for test_input, row, timeouts, done in zip(test_inputs, result["rows"], result["timeouts"], per_test):
+                key = input_key(test_input)
+                self.rows[key] = self.rows.get(key, frozenset()) | frozenset(row)
+                self.timeouts[key] = self.timeouts.get(key, frozenset()) | frozenset(timeouts)
+                self.evaluated[key] = self.evaluated.get(key, frozenset()) | frozenset(done)
+            self.incompetent = self.incompetent | frozenset(result.get("incompetent", []))
+            self.pruned += result.get("pruned", 0)
+            self.executed += result.get("executed", 0)
+
+    def count_runs(self, mutant_runs: int, pending_tests: int) -> None:
+        """Add to the mutant-run counters (see execution_stats)."""
+        with self._lock:
+            self.mutant_runs += mutant_runs
+            self.pending_tests += pending_tests
+
+    def row(self, test_input: Any) -> FrozenSet[int]:
+        """Mutants test_input is known to kill (an input never needed for any mutant has an empty row)."""
+        return self.rows.get(input_key(test_input), frozenset())
+
+    def killed_by(self, test_inputs: Iterable[Any], mutant_ids: Optional[Iterable[int]] = None) -> Set[int]:
+        """Union of the rows for test_inputs, restricted to mutant_ids if given."""
+        killed: Set[int] = set()
+        for test_input in test_inputs:
+            killed |= self.row(test_input)
+        if mutant_ids is not None:
+            killed &= set(mutant_ids)
+        return killed
+
+    def score(self, test_inputs: List[Any]) -> Dict[str, Any]:
+        """Mutation stats for a suite, with per-test kill attribution."""
+        killed = self.killed_by(test_inputs)
+        # per_test_killed is the observed attribution: when a suite's tests run
+        # likely killers first, a mutant shows up only under the test that killed it first.
+        return {
+            "mutation_score": len(killed) / self.total if self.total else 0.0,
+            "killed": len(killed),
+            "total": self.total,
+            "killed_ids": sorted(killed),
+            "per_test_killed": [sorted(self.row(t)) for t in test_inputs],
+        }
+
+    def execution_stats(self) -> Dict[str, Any]:
+        """Cumulative execution counters (mutant runs, tests they had pending, tests executed and pruned)."""
+        return {
+            "mutant_runs": self.mutant_runs,
+            "pending_tests": self.pending_tests,
+            "executed_tests": self.executed,
+            "pruned_tests": self.pruned,
+        }
+
+
+# One matrix per mutant set per process.
+_MATRICES: Dict[str, KillMatrix] = {}
+
+
+def get_kill_matrix(mutant_set: Dict[str, Any]) -> KillMatrix:
+    matrix = _MATRICES.get(mutant_set["key"])
+    if matrix is None:
+        # setdefault: a thread that lost the race uses the winner's matrix.
+        matrix = _MATRICES.setdefault(mutant_set["key"], KillMatrix(mutant_set))
+    return matrix
@@ -0,0 +1,196 @@
+"""
+Historical kill statistics for ordering tests within a mutant's run.
+
+Once a test kills a mutant the suite's other tests are pointless for it, so
+the scorer runs each mutant's pending tests likely killers first and stops at
+the first kill (see mutation.executor.run_matrix). "Likely" comes from
+per-mutant counts of how often tests with a given feature killed it: coarse
+shape features of each argument and the lines of target_function the input
+covers. There is no per-input feature: the kill matrix never reruns an
+(input, mutant) pair, so its count could never order a later run, and the
+table would grow with every input ever scored. Counts live in memory for the process and
+are flushed to a shared SQLite table (KILL_STATS_PATH), so they carry over
+across generations, workers and runs. They only affect order, never scores.
+"""
+
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+import os
+import sqlite3
+import threading
+
+from config import KILL_STATS_PATH
+
+# Feature counting every run of a mutant (its overall kill rate, used as the prior).
+_ALL = "*"
+# Weight of the prior against a feature's own counts.
+_PRIOR_WEIGHT = 2.0
+
+
+def _size_bucket(n: int) -> str:
+    if n <= 2:
+        return str(n)
+    if n <= 4:
+        return "3-4"
+    if n <= 8:
+        return "5-8"
+    return "9+"
+
+
+def _arg_features(i: int, value: Any) -> List[str]:
+    prefix = f"arg{i}"
+    if isinstance(value, bool):
+        return [f"{prefix}:bool={value}"]
+    if isinstance(value, int):
+        sign = "neg" if value < 0 else "zero" if value == 0 else "pos"
+        return [f"{prefix}:{sign}", f"{prefix}:digits={_size_bucket(len(str(abs(value))))}"]
+    if isinstance(value, (str, list, tuple)):
+        features = [f"{prefix}:len={_size_bucket(len(value))}"]
+        if len(value) > 1:
+            try:
+                if len(set(value)) < len(value):
+                    features.append(f"{prefix}:repeats")
+                if list(value) == sorted(value):
+                    features.append(f"{prefix}:sorted")
+            except TypeError:
+                pass
+        return features
+    return [f"{prefix}:{type(value).__name__}"]
+
+
+def input_features(test_input: Any, lines: Optional[Iterable[int]] = None) -> FrozenSet[str]:
+    """Features of one decoded input (plus the lines it covers, if known)."""
+    args = test_input if isinstance(test_input, (tuple, list)) else (test_input,)
+    features = {_ALL}
+    for i, value in enumerate(args):
+        features.update(_arg_features(i, value))
+    features.update(f"line:{n}" for n in lines or ())
+    return frozenset(features)
+
+
+class KillStats:
+    """Per-mutant kill counts by input feature for one mutant set."""
+
+    def __init__(self, set_key: str, db_path: Optional[str] = KILL_STATS_PATH):
+        self.set_key = set_key
+        self.db_path = db_path
+        # mutant id -> feature -> [kills, runs]
+        self.counts: Dict[int, Dict[str, List[int]]] = {}
+        self._pending: Dict[Tuple[int, str], List[int]] = {}
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_pid: Optional[int] = None
+        # Runs scored on several threads share this store (see get_kill_stats).
+        self._lock = threading.Lock()
+        self._load()
+
+    def _db(self) -> Optional[sqlite3.Connection]:
+        """Open (or reopen after fork) the SQLite store; None when disabled or unavailable."""
+        if not self.db_path:
+            return None
+        if self._conn is not None and self._conn_pid == os.getpid():
+            return self._conn
+        try:
+            directory = os.path.dirname(self.db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            # Any thread may flush; _lock serializes them.
+            conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS kill_stats (set_key TEXT NOT NULL, mutant INTEGER NOT NULL, "
+                "feature TEXT NOT NULL, kills INTEGER NOT NULL, runs INTEGER NOT NULL, "
+                "PRIMARY KEY (set_key, mutant, feature))"
+            )
+            # Drop rows of the per-input feature older stores still hold.
+            conn.execute("DELETE FROM kill_stats WHERE feature LIKE 'input=%'")
+            conn.commit()
+        except sqlite3.Error:
+            self.db_path = None
+            return None
+        self._conn = conn
+        self._conn_pid = os.getpid()
+        return conn
+
+    def _load(self) -> None:
+        conn = self._db()
+        if conn is None:
+            return
+        try:
+            rows = conn.execute(
+                "SELECT mutant, feature, kills, runs FROM kill_stats WHERE set_key = ?", (self.set_key,)
+            ).fetchall()
+        except sqlite3.Error:
+            return
+        for mutant_id, feature, kills, runs in rows:
+            self.counts.setdefault(mutant_id, {})[feature] = [kills, runs]
+
+    def score(self, mutant_id: int, features: Iterable[str]) -> float:
+        """Estimated chance that a test with ``features`` kills the mutant (best single feature, smoothed)."""
+        per_feature = self.counts.get(mutant_id)
+        if not per_feature:
+            return 0.0
+        kills, runs = per_feature.get(_ALL, (0, 0))
+        prior = (kills + 1) / (runs + 2)
+        best = prior
+        for feature in features:
+            counts = per_feature.get(feature)
+            if counts is not None:
+                rate = (counts[0] + _PRIOR_WEIGHT * prior) / (counts[1] + _PRIOR_WEIGHT)
+                if rate > best:
+                    best = rate
+        return best
+
+    def order(
+        self,
+        mutant_id: int,
+        groups: Sequence[Sequence[int]],
+        features: Sequence[FrozenSet[str]],
+    ) -> List[List[int]]:
+        """Each group of test indices sorted likely killers first (stable, so ties keep suite order)."""
+        if mutant_id not in self.counts:
+            return [list(group) for group in groups]
+        scores: Dict[int, float] = {}
+        for group in groups:
+            for idx in group:
+                if idx not in scores:
+                    scores[idx] = -self.score(mutant_id, features[idx])
+        return [sorted(group, key=scores.__getitem__) for group in groups]
+
+    def record(self, mutant_id: int, features: Iterable[str], killed: bool) -> None:
+        kill = int(killed)
+        with self._lock:
+            per_feature = self.counts.setdefault(mutant_id, {})
+            for feature in features:
+                for counts in (per_feature.setdefault(feature, [0, 0]), self._pending.setdefault((mutant_id, feature), [0, 0])):
+                    counts[0] += kill
+                    counts[1] += 1
+
+    def flush(self) -> None:
+        """Add the counts recorded since the last flush to the shared store."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            conn = self._db()
+            if conn is None or not pending:
+                return
+            try:
+                conn.executemany(
+                    "INSERT INTO kill_stats (set_key, mutant, feature, kills, runs) VALUES (?, ?, ?, ?, ?) "
+                    "ON CONFLICT (set_key, mutant, feature) DO UPDATE SET "
+                    "kills = kills + excluded.kills, runs = runs + excluded.runs",
+                    [(self.set_key, m, f, k, n) for (m, f), (k, n) in pending.items()],
+                )
+                conn.commit()
+            except sqlite3.Error:
+                pass
+
+
+# One store per mutant set per process.
+_STATS: Dict[str, KillStats] = {}
+
+
+def get_kill_stats(mutant_set: Dict[str, Any]) -> KillStats:
+    stats = _STATS.get(mutant_set["key"])
+    if stats is None:
+        # setdefault: a thread that lost the race uses the winner's store.
+        stats = _STATS.setdefault(mutant_set["key"], KillStats(mutant_set["key"], KILL_STATS_PATH))
+    return stats
@@ -0,0 +1,145 @@
+"""
+Post-run test suite minimization.
+
+Given every input a run evaluated (plus BASE_TESTS), find a smallest subset
+that kills the same mutants. Each input's full kill row comes from the kill
+matrix: it is scored as its own one-input suite, so rows the run already
+memoized cost nothing. The subset is a set cover of the union of rows. Greedy
+(most new kills first, then dropping redundant picks) gives an upper bound.
+A branch and bound search then looks for a smaller cover within
+SUITE_MINIMIZATION_EXACT_NODES nodes, and ``optimal`` reports whether it
+finished.
+"""
+
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
+import importlib
+import os
+
+from config import SUITE_MINIMIZATION_EXACT_NODES
+from mutation.kill_matrix import input_key
+from mutation.mutpy_runner import _load_mutant_set, run_mutation_tests_batch
+
+
+class _NodeBudget(Exception):
+    pass
+
+
+def kill_rows(problem_module_name: str, test_inputs: List[Any]) -> Optional[List[FrozenSet[int]]]:
+    """Mutants each input kills, or None when the scorer has no per-mutant results (no cached mutant set)."""
+    if not test_inputs:
+        return []
+    if os.getenv("EVOBUG_MUTPY", "1") == "0":
+        return None
+    results = run_mutation_tests_batch(problem_module_name, [[t] for t in test_inputs], use_base_tests=False)
+    if not all(result.get("cached_mutants") or result.get("error") for result in results):
+        return None
+    # A row that timed out or fell back has no per-mutant data: the input counts as killing nothing.
+    return [frozenset(result.get("killed_ids", ())) for result in results]
+
+
+def greedy_cover(rows: List[FrozenSet[int]]) -> List[int]:
+    """Indices of rows covering their union: most new elements first, then redundant picks dropped."""
+    uncovered: Set[int] = set().union(*rows) if rows else set()
+    chosen: List[int] = []
+    while uncovered:
+        best = max(range(len(rows)), key=lambda i: (len(rows[i] & uncovered), -i))
+        chosen.append(best)
+        uncovered -= rows[best]
+    # Reverse pass: a pick whose elements the others already cover is redundant.
+    for idx in reversed(list(chosen)):
+        others = set().union(*(rows[i] for i in chosen if i != idx))
+        if rows[idx] <= others:
+            chosen.remove(idx)
+    return sorted(chosen)
+
+
+def exact_cover(
+    rows: List[FrozenSet[int]],
+    upper: List[int],
+    node_limit: int = SUITE_MINIMIZATION_EXACT_NODES,
+) -> Tuple[List[int], bool]:
+    """
+    Smallest cover found by branch and bound, starting from the ``upper`` cover.
+
+    Branches on the uncovered element with the fewest covering rows; prunes
+    with the bound len(chosen) + ceil(uncovered / largest remaining row).
+    Returns (cover, optimal); optimal is False when ``node_limit`` ran out.
+    """
+    universe = set().union(*rows) if rows else set()
+    covering: Dict[int, List[int]] = {element: [] for element in universe}
+    for idx, row in enumerate(rows):
+        for element in row:
+            covering[element].append(idx)
+    best = [sorted(upper)]
+    nodes = [0]
+
+    def search(uncovered: FrozenSet[int], chosen: List[int]) -> None:
+        nodes[0] += 1
+        if nodes[0] > node_limit:
+            raise _NodeBudget()
+        if not uncovered:
+            if len(chosen) < len(best[0]):
+                best[0] = sorted(chosen)
+            return
+        largest = max(len(rows[i] & uncovered) for e in uncovered for i in covering[e])
+        if len(chosen) + -(-len(uncovered) // largest) >= len(best[0]):
+            return
+        element = min(uncovered, key=lambda e: len(covering[e]))
+        for idx in sorted(covering[element], key=lambda i: -len(rows[i] & uncovered)):
+            chosen.append(idx)
+            search(uncovered - rows[idx], chosen)
+            chosen.pop()
+
+    try:
+        search(frozenset(universe), [])
+    except _NodeBudget:
+        return best[0], False
+    return best[0], True
+
+
+def minimize_suite(
+    problem_module_name: str,
+    test_inputs: List[Any],
+    include_base_tests: bool = True,
+) -> Optional[Dict[str, Any]]:
+    """
+    Smallest found subset of ``test_inputs`` (plus BASE_TESTS) with the same kill set.
+
+    Returns a dict with the chosen ``inputs`` (decoded), their ``killed_ids``,
+    ``total`` mutants, ``candidates`` (distinct inputs considered), ``greedy_size``
+    and ``optimal``; None without per-mutant kill data.
+    """
+    problem_module = importlib.import_module(problem_module_name)
+    candidates: Dict[str, Any] = {}
+    extra = list(getattr(problem_module, "BASE_TESTS", [])) if include_base_tests else []
+    for test_input in list(test_inputs) + extra:
+        candidates.setdefault(input_key(test_input), test_input)
+    inputs = list(candidates.values())
+    rows = kill_rows(problem_module_name, inputs)
+    if rows is None:
+        return None
+
+    # Only distinct, non-empty rows matter; keep the first (earliest evaluated) input for each.
+    first_for_row: Dict[FrozenSet[int], int] = {}
+    for idx, row in enumerate(rows):
+        if row:
+            first_for_row.setdefault(row, idx)
+    distinct = list(first_for_row.items())
+    distinct_rows = [row for row, _ in distinct]
+    greedy = greedy_cover(distinct_rows)
+    cover, optimal = exact_cover(distinct_rows, greedy)
+    chosen = sorted(distinct[i][1] for i in cover)
+    killed = set().union(*(rows[i] for i in chosen)) if chosen else set()
+    mutant_set = _load_mutant_set(problem_module_name)
+    total = len(mutant_set["mutants"]) if mutant_set else 0
+    return {
+        "inputs": [inputs[i] for i in chosen],
+        "size": len(chosen),
+        "candidates": len(inputs),
+        "greedy_size": len(greedy),
+        "optimal": optimal,
+        "killed_ids": sorted(killed),
+        "killed": len(killed),
+        "total": total,
+        "mutation_score": len(killed) / total if total else 0.0,
+    }
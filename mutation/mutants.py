@@ -0,0 +1,182 @@
+"""
+Persistent per-problem mutant cache.
+
+Mutants are generated once per problem, keyed by a hash of the problem module's
+source and the operator set, and stored under MUTANTS_CACHE_DIR. Later
+evaluations, GA runs and experiment batches load them from disk instead of
+having MutPy re-parse the module and regenerate every mutant per call.
+MUTATION_TOOL picks the generator: MutPy ("mutpy") or the native AST engine
+in mutation.ast_engine ("custom"). With MUTANT_REDUCTION the raw set is
+reduced once (see mutation.reduction) and the reduced set is cached and used
+by every later evaluation.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import ast
+import hashlib
+import importlib
+import inspect
+import os
+import pickle
+import tempfile
+
+from config import MUTANTS_CACHE_DIR, MUTANT_REDUCTION, MUTATION_TOOL
+
+# Bump when the on-disk mutant record layout changes so stale caches are ignored.
+CACHE_FORMAT_VERSION = 2
+
+# Per-process memo so a cache file is unpickled at most once per process.
+_LOADED: Dict[str, Dict[str, Any]] = {}
+
+
+def source_hash(problem_module) -> str:
+    """SHA-256 of the problem module's source text."""
+    source = inspect.getsource(problem_module)
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+
+def cache_key(problem_module, operator_names: List[str]) -> str:
+    """Key a mutant set by problem source, operator set and cache format."""
+    digest = hashlib.sha256()
+    digest.update(source_hash(problem_module).encode("utf-8"))
+    digest.update(",".join(sorted(operator_names)).encode("utf-8"))
+    digest.update(str(CACHE_FORMAT_VERSION).encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def cache_path(problem_module_name: str, key: str) -> str:
+    return os.path.join(MUTANTS_CACHE_DIR, f"{problem_module_name.replace('.', '_')}_{key}.pkl")
+
+
+def _mutpy_operators() -> List[Any]:
+    """
+    MutPy's standard + experimental operators (what `mut.py --experimental-operators` applies).
+
+    Imported lazily so the rest of the project keeps working without MutPy.
+    """
+    from mutpy import operators
+
+    ops = set(operators.standard_operators) | set(operators.experimental_operators)
+    return sorted(ops, key=lambda op: op.name())
+
+
+def _generate_with_mutpy(problem_module, operators: List[Any]) -> List[Dict[str, Any]]:
+    """Run MutPy's first-order mutator over the module AST and keep each mutant's source."""
+    from mutpy import controller, utils
+
+    target_ast = utils.create_ast(inspect.getsource(problem_module))
+    mutator = controller.FirstOrderMutator(operators)
+    mutants = []
+    for mutations, mutant_ast in mutator.mutate(target_ast, module=problem_module):
+        mutation = mutations[0]
+        mutants.append(
+            {
+                "id": len(mutants),
+                "operator": mutation.operator.name(),
+                "lineno": getattr(mutation.node, "lineno", None),
+                # MutPy mutates the AST in place and restores it, so render it now.
+                "source": ast.unparse(mutant_ast),
+            }
+        )
+    return mutants
+
+
+def _read_cache(path: str) -> Optional[Any]:
+    try:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        return None
+
+
+def _write_cache(path: str, mutants: Any) -> None:
+    """Write atomically so concurrent workers never observe a half-written cache file."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(mutants, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def _generator(tool: str) -> Optional[Tuple[List[str], Callable[[Any], List[Dict[str, Any]]]]]:
+    """(operator names for the cache key, generate(problem_module)) for a mutation tool."""
+    if tool == "custom":
+        from mutation import ast_engine
+
+        return [f"custom:{name}" for name in ast_engine.OPERATORS], ast_engine.generate_mutants
+    try:
+        operators = _mutpy_operators()
+    except Exception:
+        return None
+    return [op.name() for op in operators], lambda module: _generate_with_mutpy(module, operators)
+
+
+def _reduced(problem_module_name: str, raw_key: str, mutants: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Reduced counterpart of a raw mutant set, read from or written to its own cache file."""
+    from mutation.reduction import reduce_mutants, settings_signature
+
+    key = hashlib.sha256(f"{raw_key};{settings_signature()}".encode("utf-8")).hexdigest()[:16]
+    path = cache_path(problem_module_name, key)
+    kept = _read_cache(path)
+    report = _read_cache(f"{path}.reduction")
+    if kept is None or report is None:
+        kept, report = reduce_mutants(problem_module_name, raw_key, mutants)
+        _write_cache(f"{path}.reduction", report)
+        _write_cache(path, kept)
+    return {"key": key, "path": path, "problem": problem_module_name, "mutants": kept, "reduction": report}
+
+
+def load_mutants(problem_module_name: str, tool: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    Return the mutant set for a problem, generating and caching it on first use.
+
+    The result is a dict with the cache ``key``, the on-disk ``path`` and the
+    ``mutants`` list (each mutant: id, operator, lineno, source); reduced sets
+    also carry the ``reduction`` report. ``tool`` defaults to MUTATION_TOOL.
+    Returns None when no mutant generator is available (e.g. MutPy is not
+    importable).
+    """
+    problem_module = importlib.import_module(problem_module_name)
+    generator = _generator(tool or MUTATION_TOOL)
+    if generator is None:
+        return None
+    operator_names, generate = generator
+
+    key = cache_key(problem_module, operator_names)
+    memo_key = f"{key}:reduced" if MUTANT_REDUCTION else key
+    if memo_key in _LOADED:
+        return _LOADED[memo_key]
+
+    path = cache_path(problem_module_name, key)
+    mutants = _read_cache(path)
+    if mutants is None:
+        try:
+            mutants = generate(problem_module)
+        except Exception:
+            return None
+        _write_cache(path, mutants)
+
+    if MUTANT_REDUCTION:
+        mutant_set = _reduced(problem_module_name, key, mutants)
+        _LOADED[mutant_set["key"]] = mutant_set
+    else:
+        mutant_set = {"key": key, "path": path, "problem": problem_module_name, "mutants": mutants}
+    _LOADED[memo_key] = mutant_set
+    return mutant_set
+
+
+def load_mutant_set_file(path: str, problem_module_name: str) -> Dict[str, Any]:
+    """Load a mutant set straight from its cache file (used by child executor processes)."""
+    key = os.path.splitext(os.path.basename(path))[0].rsplit("_", 1)[-1]
+    if key not in _LOADED:
+        mutants = _read_cache(path)
+        if mutants is None:
+            raise FileNotFoundError(path)
+        _LOADED[key] = {"key": key, "path": path, "problem": problem_module_name, "mutants": mutants}
+    return _LOADED[key]
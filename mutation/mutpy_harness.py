@@ -0,0 +1,163 @@
+"""
+Static unittest module that MutPy runs against its mutants.
+
+mutation.harness copies this file into a per-process workspace as
+evobug_harness.py. The source never changes with the suite, so MutPy
+imports the same bytecode every time. The tests themselves are data: the
+(input, expected) pairs are unpickled from the file named by
+EVOBUG_HARNESS_PAYLOAD and become one TestCase class per suite.
+
+The module-level ``problem_module`` and ``target_function`` names matter:
+MutPy swaps them for the mutant's before each run, and every check looks
+them up at call time.
+
+Payload keys:
+  problem      -- problem module name
+  suites       -- list of suites; each a list of (args, raises, expected)
+                  where ``raises`` means the original raised and ``expected``
+                  is then ignored
+  record_path  -- None for a single GeneratedTests class whose failures kill
+                  the mutant; otherwise batch mode (see _run_recorded)
+"""
+
+import importlib
+import json
+import os
+import pickle
+import unittest
+import uuid
+
+PAYLOAD_ENV = "EVOBUG_HARNESS_PAYLOAD"
+
+
+def _load_payload():
+    path = os.environ.get(PAYLOAD_ENV)
+    if not path:
+        return None
+    with open(path, "rb") as f:
+        return pickle.load(f)
+
+
+_PAYLOAD = _load_payload()
+
+if _PAYLOAD is not None:
+    problem_module = importlib.import_module(_PAYLOAD["problem"])
+    target_function = getattr(problem_module, "target_function")
+
+
+def _call_with_input(args):
+    if isinstance(args, (tuple, list)):
+        return target_function(*args)
+    return target_function(args)
+
+
+def _is_subsequence(s: str, t: str) -> bool:
+    it = iter(t)
+    return all(c in it for c in s)
+
+
+def _check_two_sum(case, args, result):
+    if isinstance(result, list) and result:
+        case.assertEqual(len(result), 2)
+        case.assertNotEqual(result[0], result[1])
+        case.assertTrue(all(0 <= i < len(args[0]) for i in result))
+        case.assertEqual(args[0][result[0]] + args[0][result[1]], args[1])
+    # Guard critical constants to catch mutants touching specs or bases.
+    case.assertEqual(problem_module.INPUT_SPEC['args'][0]['value_range'], (-100, 100))
+    case.assertEqual(problem_module.INPUT_SPEC['args'][1]['value_range'], (-200, 200))
+    case.assertEqual(problem_module.INPUT_SPEC['args'][0]['length_range'], (2, 20))
+    case.assertEqual(problem_module.INPUT_SPEC['args'][0]['name'], 'nums')
+    case.assertEqual(problem_module.INPUT_SPEC['args'][1]['name'], 'target')
+    base_checks = [
+        ([2, 7, 11, 15], 9),
+        ([3, 3], 6),
+        ([3, 2, 4], 6),
+        ([-1, -2, -3, -4, -5], -8),
+        ([0, 4, 3, 0], 0),
+        ([1, 2, 3, 4, 5], 6),
+        ([1, 2, 3], 2),
+        ([10, -10, 20, -20], 0),
+        ([5, 5, 5, 5, 3, 2], 7),
+    ]
+    for bc in base_checks:
+        case.assertIn(bc, problem_module.BASE_TESTS)
+
+
+def _check_rotated_sort(case, args, result):
+    if isinstance(result, int) and result != -1:
+        case.assertTrue(0 <= result < len(args[0]))
+        case.assertEqual(args[0][result], args[1])
+
+
+def _check_supersequence(case, args, result):
+    if isinstance(result, str):
+        case.assertTrue(_is_subsequence(args[0], result))
+        case.assertTrue(_is_subsequence(args[1], result))
+
+
+# Extra property checks, by problem module name fragment.
+_EXTRA_CHECKS = {
+    "problem_two_sum": _check_two_sum,
+    "problem_rotated_sort": _check_rotated_sort,
+    "problem_supersequence": _check_supersequence,
+}
+
+
+def _check_case(case, args, raises, expected, extra_checks):
+    if raises:
+        with case.assertRaises(Exception):
+            _call_with_input(args)
+        return
+    result = _call_with_input(args)
+    case.assertEqual(result, expected)
+    for check in extra_checks:
+        check(case, args, result)
+
+
+def _run_recorded(suite_idx, body):
+    """
+    Batch mode: MutPy stops a mutant at its first failing test, so tests never
+    fail; every failure is appended to the record file as [mutant token,
+    suite index, exception name] instead. The token is stamped on the
+    (mutant) problem module, so failures can be grouped per mutant.
+    """
+    try:
+        body()
+    except Exception as exc:
+        token = getattr(problem_module, '_evobug_token', None)
+        if token is None:
+            token = uuid.uuid4().hex
+            problem_module._evobug_token = token
+        with open(_PAYLOAD["record_path"], 'a') as f:
+            f.write(json.dumps([token, suite_idx, type(exc).__name__]) + '\n')
+
+
+def _make_test(suite_idx, case_data, extra_checks, recorded):
+    def check(self):
+        _check_case(self, *case_data, extra_checks)
+
+    if not recorded:
+        return check
+
+    def test(self):
+        _run_recorded(suite_idx, lambda: check(self))
+
+    return test
+
+
+def _build_test_cases(payload):
+    extra_checks = [check for fragment, check in _EXTRA_CHECKS.items() if fragment in payload["problem"]]
+    recorded = payload.get("record_path") is not None
+    classes = {}
+    for suite_idx, cases in enumerate(payload["suites"]):
+        methods = {
+            f"test_case_{idx}": _make_test(suite_idx, case_data, extra_checks, recorded)
+            for idx, case_data in enumerate(cases)
+        }
+        name = f"Suite{suite_idx}Tests" if recorded else "GeneratedTests"
+        classes[name] = type(name, (unittest.TestCase,), methods)
+    return classes
+
+
+if _PAYLOAD is not None:
+    globals().update(_build_test_cases(_PAYLOAD))
@@ -1,21 +1,49 @@
 """
 MutPy-backed mutation scorer.
 
-Builds a temporary unittest module from provided + baseline inputs, runs MutPy,
-and reports killed/total mutants. Falls back to an internal heuristic mutator
-if MutPy fails or times out.
+Pickles provided + baseline inputs for a static unittest harness (see
+mutation.harness), runs MutPy, and reports killed/total mutants. When a cached mutant set is available
+(see mutation.mutants) the mutants are executed directly instead of having
+MutPy regenerate them, and each distinct input's kills are memoized in a
+kill matrix (see mutation.kill_matrix). With MUTATION_TOOL = "custom" the
+mutants come from the native AST engine (mutation.ast_engine) and run
+in-process, without MutPy or a subprocess. Falls back to an internal heuristic mutator if MutPy
+fails or times out.
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 import importlib
+import importlib.util
+import json
 import os
+import pickle
+import signal
 import subprocess
 import sys
 import tempfile
 
 import yaml
 
-from config import MUTATION_TIMEOUT_SECONDS
+from config import (
+    COVERAGE_PRUNING,
+    MUTANT_CACHE_ENABLED,
+    MUTANT_REDUCTION,
+    MUTATION_TIMEOUT_SECONDS,
+    MUTATION_TOOL,
+    MUTATION_WORKER_POOL,
+    TEST_PRIORITIZATION,
+)
+from mutation import coverage as line_coverage
+from mutation import harness
+from mutation.executor import line_budget_signature, read_stream, run_matrix
+from mutation.kill_matrix import get_kill_matrix, input_key
+from mutation.kill_stats import get_kill_stats, input_features
+from mutation.mutants import load_mutants
+from mutation.mutpy_harness import PAYLOAD_ENV
+from mutation.outcomes import error_status, is_kill
+from mutation.reduction import settings_signature as reduction_signature
+from mutation.sampling import estimate
+from mutation.worker_pool import WorkerCrashed, get_worker_pool
 
 
 def _call_with_input(fn, test_input):
@@ -35,111 +63,57 @@ def _baseline_outputs(problem_module, test_inputs: List[Any]) -> List[Any]:
     return outputs
 
 
-def _format_literal(value: Any) -> str:
+def _baseline_runs(problem_module, test_inputs: List[Any]) -> Tuple[List[Any], Optional[List[List[int]]]]:
     """
-    Safe-ish repr for embedding into generated test files.
+    Expected outputs plus, with COVERAGE_PRUNING, the lines each input executes.
+
+    Both come from one traced run per distinct input (see mutation.coverage);
+    coverage is None when pruning is off or unsupported.
     """
-    if isinstance(value, Exception):
-        return f"Exception('{type(value).__name__}')"
-    return repr(value)
+    if not (COVERAGE_PRUNING and line_coverage.SUPPORTED):
+        return _baseline_outputs(problem_module, test_inputs), None
+    outputs, covered = line_coverage.baseline_runs(problem_module, test_inputs)
+    return outputs, [sorted(lines) for lines in covered]
 
 
 def _write_temp_tests(
     problem_module_name: str,
     test_inputs: List[Any],
     expected_outputs: List[Any],
-) -> (str, str, str):
-    """
-    Create a temporary unittest module with one test per input.
-
-    Returns (module_name, file_path, tmp_dir)
-    """
-    tmp_dir = tempfile.mkdtemp(prefix="mutpy_tests_")
-    module_name = "generated_mutpy_tests"
-    file_path = os.path.join(tmp_dir, f"{module_name}.py")
-
-    lines = [
-        "import unittest",
-        "import importlib",
-        "from typing import Iterable",
-        "",
-        f"problem_module = importlib.import_module('{problem_module_name}')",
-        "target_function = getattr(problem_module, 'target_function')",
-        "",
-        "def _call_with_input(args):",
-        "    if isinstance(args, (tuple, list)):",
-        "        return target_function(*args)",
-        "    return target_function(args)",
-        "",
-        "def _is_subsequence(s: str, t: str) -> bool:",
-        "    it = iter(t)",
-        "    return all(c in it for c in s)",
-        "",
-        "class GeneratedTests(unittest.TestCase):",
-    ]
+) -> Tuple[str, str, Dict[str, str]]:
+    """
+    Write a payload for the static harness (mutation/mutpy_harness.py): one test per input.
 
-    for idx, (args, expected) in enumerate(zip(test_inputs, expected_outputs)):
-        lines.append(f"    def test_case_{idx}(self):")
-        lines.append(f"        args = {repr(args)}")
-        lines.append(f"        expected = {_format_literal(expected)}")
-        lines.append("        if isinstance(expected, Exception):")
-        lines.append("            with self.assertRaises(Exception):")
-        lines.append("                _call_with_input(args)")
-        lines.append("            return")
-        lines.append("        result = _call_with_input(args)")
-        lines.append("        self.assertEqual(result, expected)")
+    Returns (module_name, payload_path, child_env).
+    """
+    payload_path = harness.write_payload(problem_module_name, [test_inputs], [expected_outputs])
+    return harness.MODULE_NAME, payload_path, _harness_env(payload_path)
 
-        if "problem_two_sum" in problem_module_name:
-            lines.extend(
-                [
-                    "        if isinstance(result, list) and result:",
-                    "            self.assertEqual(len(result), 2)",
-                    "            self.assertNotEqual(result[0], result[1])",
-                    "            self.assertTrue(all(0 <= i < len(args[0]) for i in result))",
-                    "            self.assertEqual(args[0][result[0]] + args[0][result[1]], args[1])",
-                    "        # Guard critical constants to catch mutants touching specs or bases.",
-                    "        self.assertEqual(problem_module.INPUT_SPEC['args'][0]['value_range'], (-100, 100))",
-                    "        self.assertEqual(problem_module.INPUT_SPEC['args'][1]['value_range'], (-200, 200))",
-                    "        self.assertEqual(problem_module.INPUT_SPEC['args'][0]['length_range'], (2, 20))",
-                    "        self.assertEqual(problem_module.INPUT_SPEC['args'][0]['name'], 'nums')",
-                    "        self.assertEqual(problem_module.INPUT_SPEC['args'][1]['name'], 'target')",
-                    "        base_checks = [",
-                    "            ([2, 7, 11, 15], 9),",
-                    "            ([3, 3], 6),",
-                    "            ([3, 2, 4], 6),",
-                    "            ([-1, -2, -3, -4, -5], -8),",
-                    "            ([0, 4, 3, 0], 0),",
-                    "            ([1, 2, 3, 4, 5], 6),",
-                    "            ([1, 2, 3], 2),",
-                    "            ([10, -10, 20, -20], 0),",
-                    "            ([5, 5, 5, 5, 3, 2], 7),",
-                    "        ]",
-                    "        for bc in base_checks:",
-                    "            self.assertIn(bc, problem_module.BASE_TESTS)",
-                ]
-            )
-        if "problem_rotated_sort" in problem_module_name:
-            lines.extend(
-                [
-                    "        if isinstance(result, int) and result != -1:",
-                    "            self.assertTrue(0 <= result < len(args[0]))",
-                    "            self.assertEqual(args[0][result], args[1])",
-                ]
-            )
-        if "problem_supersequence" in problem_module_name:
-            lines.extend(
-                [
-                    "        if isinstance(result, str):",
-                    "            self.assertTrue(_is_subsequence(args[0], result))",
-                    "            self.assertTrue(_is_subsequence(args[1], result))",
-                ]
-            )
-        lines.append("")
 
-    with open(file_path, "w") as f:
-        f.write("\n".join(lines))
+def _write_batch_tests(
+    problem_module_name: str,
+    suites: List[List[Any]],
+    expected_per_suite: List[List[Any]],
+    record_path: str,
+) -> Tuple[str, str, Dict[str, str]]:
+    """
+    Write a batch payload: the harness builds one TestCase class per suite.
 
-    return module_name, file_path, tmp_dir
+    MutPy stops a mutant at its first failing test, so in batch mode the
+    tests never fail; instead every failure is appended to ``record_path`` as
+    [mutant token, suite index, exception name], and each suite's kills are
+    recovered from a single MutPy run.
+
+    Returns (module_name, payload_path, child_env).
+    """
+    payload_path = harness.write_payload(problem_module_name, suites, expected_per_suite, record_path)
+    return harness.MODULE_NAME, payload_path, _harness_env(payload_path)
+
+
+def _harness_env(payload_path: str) -> Dict[str, str]:
+    env = _child_env([harness.workspace()])
+    env[PAYLOAD_ENV] = payload_path
+    return env
 
 
 def _fallback_lightweight(problem_module_name: str, test_inputs: List[Any]) -> Dict[str, Any]:
@@ -280,12 +254,525 @@ def _fallback_lightweight(problem_module_name: str, test_inputs: List[Any]) -> D
     }
 
 
-def run_mutation_tests(
+def _score_or_augment(problem_module_name: str, all_tests: List[Any], killed: int, total: int) -> Dict[str, Any]:
+    mutation_score = killed / total if total else 0.0
+
+    if total == 0 or killed == 0:
+        # Augment with internal mutants to provide signal while still considering MutPy execution.
+        internal = _fallback_lightweight(problem_module_name, all_tests)
+        return {
+            "mutation_score": internal["mutation_score"],
+            "killed": internal["killed"],
+            "total": internal["total"],
+            "fallback": False,
+            "augmented": True,
+        }
+
+    return {
+        "mutation_score": mutation_score,
+        "killed": killed,
+        "total": total,
+        "fallback": False,
+    }
+
+
+def _child_env(extra_paths: List[str]) -> Dict[str, str]:
+    env = os.environ.copy()
+    env["PYTHONPATH"] = os.pathsep.join(extra_paths + [os.getcwd(), env.get("PYTHONPATH", "")])
+    return env
+
+
+class ExecutorError(RuntimeError):
+    """A child executor process exited without producing results."""
+
+    def __init__(self, reason: str, stderr: str = ""):
+        super().__init__(reason)
+        self.reason = reason
+        self.stderr = stderr
+
+
+class PartialRun(RuntimeError):
+    """A child executor was killed or crashed after some mutants had finished; ``rows`` holds those."""
+
+    def __init__(self, reason: str, rows: Dict[str, Any], cause: Exception):
+        super().__init__(reason)
+        self.reason = reason
+        self.rows = rows
+        self.cause = cause
+
+
+def _remove_quietly(*paths: str) -> None:
+    """Remove files then directories, ignoring anything already gone."""
+    for path in paths:
+        try:
+            if os.path.isdir(path):
+                os.rmdir(path)
+            else:
+                os.remove(path)
+        except OSError:
+            pass
+
+
+def _kill_process_group(pid: int) -> None:
+    """Kill a child started with start_new_session=True together with its grandchildren."""
+    try:
+        os.killpg(os.getpgid(pid), signal.SIGKILL)
+    except (ProcessLookupError, PermissionError, AttributeError, OSError):
+        pass
+
+
+def _run_process(cmd: List[str], env: Dict[str, str], timeout: float) -> subprocess.CompletedProcess:
+    """
+    subprocess.run with a timeout that also reaps grandchildren.
+
+    The child gets its own session/process group so a timeout kills everything
+    it spawned (MutPy runs mutants in helper processes), not just the child.
+    """
+    with subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        env=env,
+        start_new_session=True,
+    ) as proc:
+        try:
+            stdout, stderr = proc.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            _kill_process_group(proc.pid)
+            proc.communicate()
+            raise
+        except BaseException:
+            _kill_process_group(proc.pid)
+            raise
+    return subprocess.CompletedProcess(cmd, proc.returncode, stdout, stderr)
+
+
+def _executor_payload(
     problem_module_name: str,
+    mutant_set: Dict[str, Any],
     test_inputs: List[Any],
-    use_base_tests: bool = True,
+    expected_outputs: List[Any],
+    mutant_ids: Optional[List[int]] = None,
+    coverage: Optional[List[List[int]]] = None,
+    plan: Optional[Dict[int, List[List[int]]]] = None,
 ) -> Dict[str, Any]:
-    problem_module = importlib.import_module(problem_module_name)
+    return {
+        "problem": problem_module_name,
+        "mutant_path": mutant_set["path"],
+        "tests": test_inputs,
+        "expected": expected_outputs,
+        "mutant_ids": mutant_ids,
+        "coverage": coverage,
+        "plan": plan,
+    }
+
+
+def _write_executor_payload(payload: Dict[str, Any]) -> Tuple[List[str], str, str, str]:
+    """Write a payload for `python -m mutation.executor`; returns (cmd, payload_path, result_path, tmp_dir)."""
+    tmp_dir = tempfile.mkdtemp(prefix="evobug_exec_")
+    payload_path = os.path.join(tmp_dir, "payload.pkl")
+    result_path = os.path.join(tmp_dir, "result.json")
+    with open(payload_path, "wb") as f:
+        pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+    cmd = [sys.executable, "-m", "mutation.executor", payload_path, result_path]
+    return cmd, payload_path, result_path, tmp_dir
+
+
+def _read_executor_result(proc: subprocess.CompletedProcess, result_path: str) -> Dict[str, Any]:
+    if proc.returncode != 0 or not os.path.exists(result_path):
+        raise ExecutorError(f"executor_returncode_{proc.returncode}", proc.stderr)
+    with open(result_path, "r") as f:
+        return json.load(f)
+
+
+def _compute_rows_in_child(
+    problem_module_name: str,
+    mutant_set: Dict[str, Any],
+    test_inputs: List[Any],
+    expected_outputs: List[Any],
+    timeout: float = MUTATION_TIMEOUT_SECONDS,
+    mutant_ids: Optional[List[int]] = None,
+    coverage: Optional[List[List[int]]] = None,
+    plan: Optional[Dict[int, List[List[int]]]] = None,
+) -> Dict[str, Any]:
+    """
+    Run mutation.executor.run_matrix in a child process for test_inputs.
+
+    Uses a warm worker from mutation.worker_pool when MUTATION_WORKER_POOL is
+    set, otherwise a one-shot `python -m mutation.executor` process. Either way
+    the ``timeout`` guard covers the whole task; the mutants come
+    from MUTANTS_CACHE_DIR rather than being regenerated.
+    The child streams each finished mutant to a file; if it times out or
+    crashes after some finished, PartialRun carries their rows. Otherwise
+    raises subprocess.TimeoutExpired or ExecutorError on failure.
+    """
+    payload = _executor_payload(
+        problem_module_name, mutant_set, test_inputs, expected_outputs, mutant_ids, coverage, plan
+    )
+    stream_fd, stream_path = tempfile.mkstemp(prefix="evobug_stream_", suffix=".jsonl")
+    os.close(stream_fd)
+    payload["stream_path"] = stream_path
+    try:
+        try:
+            return _run_payload(payload, timeout)
+        except subprocess.TimeoutExpired as exc:
+            _raise_partial("timeout", stream_path, len(test_inputs), exc)
+        except ExecutorError as exc:
+            _raise_partial(exc.reason, stream_path, len(test_inputs), exc)
+    finally:
+        _remove_quietly(stream_path)
+
+
+def _run_payload(payload: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+    if MUTATION_WORKER_POOL:
+        try:
+            return get_worker_pool().run(payload, timeout)
+        except WorkerCrashed as exc:
+            raise ExecutorError("worker_crashed", str(exc)) from exc
+
+    cmd, payload_path, result_path, tmp_dir = _write_executor_payload(payload)
+    try:
+        proc = _run_process(cmd, _child_env([]), timeout)
+        return _read_executor_result(proc, result_path)
+    finally:
+        _remove_quietly(payload_path, result_path, tmp_dir)
+
+
+def _raise_partial(reason: str, stream_path: str, test_count: int, exc: Exception) -> None:
+    """Re-raise a failed child run, as PartialRun if any mutant finished before it failed."""
+    rows = read_stream(stream_path, test_count)
+    if rows["completed"]:
+        raise PartialRun(reason, rows, exc) from exc
+    raise exc
+
+
+def _compute_rows(
+    problem_module_name: str,
+    mutant_set: Dict[str, Any],
+    test_inputs: List[Any],
+    expected_outputs: List[Any],
+    timeout: float = MUTATION_TIMEOUT_SECONDS,
+    mutant_ids: Optional[List[int]] = None,
+    coverage: Optional[List[List[int]]] = None,
+    plan: Optional[Dict[int, List[List[int]]]] = None,
+) -> Dict[str, Any]:
+    """
+    Kill-matrix rows for test_inputs, over all mutants or only ``mutant_ids``.
+
+    Native (MUTATION_TOOL = "custom") mutants run in-process, each cell under
+    the executor's own guard; cached MutPy mutants run in a child. Pairs the
+    ``coverage`` rules out are skipped, and a ``plan`` limits which pairs run
+    (see mutation.executor.run_matrix).
+    """
+    if MUTATION_TOOL == "custom":
+        return run_matrix(
+            problem_module_name, mutant_set, test_inputs, expected_outputs, mutant_ids, coverage, plan
+        )
+    return _compute_rows_in_child(
+        problem_module_name, mutant_set, test_inputs, expected_outputs, timeout, mutant_ids, coverage, plan
+    )
+
+
+def _timeout_result() -> Dict[str, Any]:
+    return {"mutation_score": 0.0, "killed": 0, "total": 0, "error": "timeout"}
+
+
+def _executor_error_result(problem_module_name: str, all_tests: List[Any], exc: ExecutorError) -> Dict[str, Any]:
+    fallback = _fallback_lightweight(problem_module_name, all_tests)
+    fallback["error"] = exc.reason
+    fallback["stderr"] = exc.stderr
+    return fallback
+
+
+def _partial_result(
+    problem_module_name: str,
+    mutant_set: Dict[str, Any],
+    all_tests: List[Any],
+    mutant_ids: Optional[List[int]],
+    exc: PartialRun,
+) -> Dict[str, Any]:
+    """
+    Score a suite from the mutants whose outcome on it is known after a failed run.
+
+    The rest are unknown and left out of ``total``; ``completed_fraction`` is
+    the share of the (sampled) mutant set that was decided.
+    """
+    matrix = get_kill_matrix(mutant_set)
+    wanted = matrix.ids if mutant_ids is None else frozenset(mutant_ids)
+    killed = matrix.killed_by(all_tests, wanted)
+    keys = [input_key(t) for t in all_tests]
+    decided = killed | {m for m in wanted if all(m in matrix.evaluated.get(key, frozenset()) for key in keys)}
+    if not decided:
+        if isinstance(exc.cause, ExecutorError):
+            return _executor_error_result(problem_module_name, all_tests, exc.cause)
+        return _timeout_result()
+    return {
+        "mutation_score": len(killed) / len(decided),
+        "killed": len(killed),
+        "total": len(decided),
+        "fallback": False,
+        "killed_ids": sorted(killed),
+        "error": exc.reason,
+        "partial": True,
+        "unknown": len(wanted) - len(decided),
+        "completed_fraction": len(decided) / len(wanted),
+        "cached_mutants": True,
+    }
+
+
+def _matrix_result(problem_module_name: str, matrix, all_tests: List[Any]) -> Dict[str, Any]:
+    stats = matrix.score(all_tests)
+    result = _score_or_augment(problem_module_name, all_tests, stats["killed"], stats["total"])
+    if not result.get("augmented"):
+        result["killed_ids"] = stats["killed_ids"]
+        result["per_test_killed"] = stats["per_test_killed"]
+    result["cached_mutants"] = True
+    return result
+
+
+def _sampled_result(
+    problem_module_name: str,
+    matrix,
+    mutant_set: Dict[str, Any],
+    all_tests: List[Any],
+    mutant_ids: List[int],
+) -> Dict[str, Any]:
+    """Estimated full-set score from a mutant sample, with its confidence interval."""
+    killed = matrix.killed_by(all_tests, mutant_ids)
+    if not killed:
+        result = _score_or_augment(problem_module_name, all_tests, 0, len(mutant_ids))
+    else:
+        stats = estimate(mutant_set, mutant_ids, killed)
+        result = {
+            "mutation_score": stats["estimate"],
+            "killed": len(killed),
+            "total": stats["sample_size"],
+            "fallback": False,
+            "killed_ids": sorted(killed),
+            "ci": stats["ci"],
+            "population_size": stats["population_size"],
+        }
+    result["sampled"] = True
+    result["cached_mutants"] = True
+    return result
+
+
+class _MatrixWork:
+    """
+    The runs the kill matrix still needs to score some suites (see _matrix_work).
+
+    ``store`` adds their rows to the matrix, its execution counters and, with
+    a plan, the kill stats, so every caller that runs the work, whichever way
+    it starts the child, keeps the same bookkeeping.
+    """
+
+    def __init__(
+        self,
+        matrix,
+        test_inputs: List[Any],
+        expected_outputs: List[Any],
+        coverage: Optional[List[List[int]]],
+        mutant_ids: Optional[List[int]],
+        plan: Optional[Dict[int, List[List[int]]]] = None,
+        features: Optional[List[Any]] = None,
+        stats=None,
+    ):
+        self.matrix = matrix
+        self.test_inputs = test_inputs
+        self.expected_outputs = expected_outputs
+        self.coverage = coverage
+        self.mutant_ids = mutant_ids
+        self.plan = plan
+        self.features = features
+        self.stats = stats
+
+    def store(self, rows: Dict[str, Any], partial: bool = False) -> None:
+        """Store the rows of a run; ``partial`` when the run failed after only some mutants finished."""
+        if self.plan is None:
+            if partial:
+                self.matrix.add_rows(self.test_inputs, rows)
+                return
+            self.matrix.add_rows(self.test_inputs, rows, self.mutant_ids)
+            runs = self.matrix.total if self.mutant_ids is None else len(self.mutant_ids)
+            self.matrix.count_runs(runs, runs * len(self.test_inputs))
+            return
+        self.matrix.add_rows(self.test_inputs, rows)
+        finished = rows["completed"] if partial else self.plan
+        self.matrix.count_runs(
+            len(finished), sum(len({idx for group in self.plan[m] for idx in group}) for m in finished)
+        )
+        for idx, evaluated in enumerate(rows["evaluated"]):
+            killed = set(rows["rows"][idx])
+            for mutant_id in evaluated:
+                self.stats.record(mutant_id, self.features[idx], mutant_id in killed)
+        self.stats.flush()
+
+
+def _matrix_work(
+    problem_module,
+    mutant_set: Dict[str, Any],
+    suites: List[List[Any]],
+    mutant_ids: Optional[List[int]] = None,
+) -> Optional[_MatrixWork]:
+    """
+    What the kill matrix still needs to score ``suites``, or None if it can already.
+
+    With TEST_PRIORITIZATION each mutant tries a suite's pending inputs likely
+    killers first (mutation.kill_stats) and stops at the first kill, since the
+    suite's score only needs one. Otherwise every input without a full row is
+    run against every mutant.
+    """
+    matrix = get_kill_matrix(mutant_set)
+    if not TEST_PRIORITIZATION:
+        missing = matrix.missing((test for tests in suites for test in tests), mutant_ids)
+        if not missing:
+            return None
+        expected_outputs, coverage = _baseline_runs(problem_module, missing)
+        return _MatrixWork(matrix, missing, expected_outputs, coverage, mutant_ids)
+
+    pending = matrix.pending(suites, mutant_ids)
+    if not pending:
+        return None
+    tests: Dict[str, Any] = {}
+    for groups in pending.values():
+        for group in groups:
+            for test_input in group:
+                tests.setdefault(input_key(test_input), test_input)
+    index = {key: idx for idx, key in enumerate(tests)}
+    test_inputs = list(tests.values())
+    expected_outputs, coverage = _baseline_runs(problem_module, test_inputs)
+    features = [
+        input_features(t, coverage[idx] if coverage is not None else None) for idx, t in enumerate(test_inputs)
+    ]
+    stats = get_kill_stats(mutant_set)
+    plan = {
+        mutant_id: stats.order(mutant_id, [[index[input_key(t)] for t in group] for group in groups], features)
+        for mutant_id, groups in pending.items()
+    }
+    return _MatrixWork(matrix, test_inputs, expected_outputs, coverage, sorted(plan), plan, features, stats)
+
+
+def _fill_matrix(
+    problem_module_name: str,
+    problem_module,
+    mutant_set: Dict[str, Any],
+    suites: List[List[Any]],
+    timeout: float = MUTATION_TIMEOUT_SECONDS,
+    mutant_ids: Optional[List[int]] = None,
+):
+    """
+    Run what the kill matrix still needs to score ``suites`` (see _matrix_work); returns the matrix.
+
+    Raises subprocess.TimeoutExpired or ExecutorError, or PartialRun after
+    storing the mutants that did finish.
+    """
+    work = _matrix_work(problem_module, mutant_set, suites, mutant_ids)
+    if work is None:
+        return get_kill_matrix(mutant_set)
+    try:
+        rows = _compute_rows(
+            problem_module_name, mutant_set, work.test_inputs, work.expected_outputs, timeout,
+            work.mutant_ids, work.coverage, work.plan,
+        )
+    except PartialRun as exc:
+        work.store(exc.rows, partial=True)
+        raise
+    work.store(rows)
+    return work.matrix
+
+
+def _run_cached_mutants(
+    problem_module_name: str,
+    problem_module,
+    mutant_set: Dict[str, Any],
+    all_tests: List[Any],
+    mutant_ids: Optional[List[int]] = None,
+) -> Dict[str, Any]:
+    """
+    Score a suite against cached mutants through the kill matrix.
+
+    Only (input, mutant) pairs the matrix does not know yet are executed (see
+    _fill_matrix); the suite score is the union of rows.
+    With ``mutant_ids`` only that sample is run and the score is an estimate.
+    """
+    try:
+        matrix = _fill_matrix(problem_module_name, problem_module, mutant_set, [all_tests], mutant_ids=mutant_ids)
+    except PartialRun as exc:
+        return _partial_result(problem_module_name, mutant_set, all_tests, mutant_ids, exc)
+    except subprocess.TimeoutExpired:
+        return _timeout_result()
+    except ExecutorError as exc:
+        return _executor_error_result(problem_module_name, all_tests, exc)
+    if mutant_ids is not None:
+        return _sampled_result(problem_module_name, matrix, mutant_set, all_tests, mutant_ids)
+    return _matrix_result(problem_module_name, matrix, all_tests)
+
+
+def _load_mutant_set(problem_module_name: str):
+    """The cached mutant set to score against, or None to run mut.py directly.
+
+    The native engine has no other way to run, so it always goes through the set.
+    """
+    if MUTATION_TOOL == "custom" or MUTANT_CACHE_ENABLED:
+        return load_mutants(problem_module_name)
+    return None
+
+
+def mutant_reduction_report(problem_module_name: str) -> Optional[Dict[str, Any]]:
+    """What the mutant-set reduction removed for this problem, or None if scoring does not use a reduced set."""
+    if os.getenv("EVOBUG_MUTPY", "1") == "0" or not MUTANT_REDUCTION:
+        return None
+    mutant_set = _load_mutant_set(problem_module_name)
+    return mutant_set.get("reduction") if mutant_set else None
+
+
+def execution_stats(problem_module_name: str, since: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+    """
+    Kill-matrix execution counters for this problem in this process (see KillMatrix.execution_stats).
+
+    With ``since`` (an earlier result) the counters cover only the calls made
+    after it. None when scoring does not go through a cached mutant set.
+    """
+    if os.getenv("EVOBUG_MUTPY", "1") == "0":
+        return None
+    mutant_set = _load_mutant_set(problem_module_name)
+    if not mutant_set or not mutant_set["mutants"]:
+        return None
+    stats = get_kill_matrix(mutant_set).execution_stats()
+    if since:
+        for name in ("mutant_runs", "pending_tests", "executed_tests", "pruned_tests"):
+            stats[name] -= since.get(name, 0)
+    runs = stats["mutant_runs"]
+    stats["tests_per_mutant"] = stats["executed_tests"] / runs if runs else 0.0
+    stats["pending_tests_per_mutant"] = stats["pending_tests"] / runs if runs else 0.0
+    return stats
+
+
+def scorer_signature() -> str:
+    """
+    Describe the settings that decide what run_mutation_tests would return.
+
+    Used to key fitness caches so scores from a different scorer are never reused.
+    """
+    mutpy_available = importlib.util.find_spec("mutpy") is not None
+    return ";".join(
+        [
+            f"evobug_mutpy={os.getenv('EVOBUG_MUTPY', '1')}",
+            f"tool={MUTATION_TOOL}",
+            f"mutpy={int(mutpy_available)}",
+            f"mutant_cache={int(MUTANT_CACHE_ENABLED)}",
+            reduction_signature() if MUTANT_REDUCTION else "reduction=0",
+            f"timeout={MUTATION_TIMEOUT_SECONDS}",
+            # Cached mutants count cell timeouts (see line_budget_signature) as kills.
+            f"cell_timeouts=killed;{line_budget_signature()}",
+            # TypeErrors are incompetent, not kills, on every path (mutation.outcomes).
+            "type_errors=incompetent",
+        ]
+    )
+
+
+def _collect_tests(problem_module, test_inputs: List[Any], use_base_tests: bool) -> List[Any]:
     # Fold in deterministic BASE_TESTS so every run exercises known edge cases.
     base_tests = getattr(problem_module, "BASE_TESTS", []) if use_base_tests else []
 
@@ -300,37 +787,26 @@ def run_mutation_tests(
             uniq.append(item)
         return uniq
 
-    all_tests = _dedupe(list(test_inputs) + list(base_tests))
-
-    # Fast path: force fallback when EVOBUG_MUTPY=0
-    if os.getenv("EVOBUG_MUTPY", "1") == "0":
-        return _fallback_lightweight(problem_module_name, all_tests)
-
-    expected_outputs = _baseline_outputs(problem_module, all_tests)
-    test_module_name, test_file, tmp_dir = _write_temp_tests(
-        problem_module_name, all_tests, expected_outputs
-    )
-
-    env = os.environ.copy()
-    env["PYTHONPATH"] = os.pathsep.join(
-        [tmp_dir, os.getcwd(), env.get("PYTHONPATH", "")]
-    )
+    return _dedupe(list(test_inputs) + list(base_tests))
 
-    report_path = os.path.join(tmp_dir, "mutpy_report.yml")
 
+def _find_mutpy_bin(env: Dict[str, str]) -> str | None:
     mutpy_bin = os.path.join(os.path.dirname(sys.executable), "mut.py")
     if not os.path.exists(mutpy_bin):
         import shutil
         mutpy_bin = shutil.which("mut.py", path=os.pathsep.join([os.path.dirname(sys.executable), env.get("PATH", "")]))
-    if not mutpy_bin:
-        try:
-            os.remove(test_file)
-            os.rmdir(tmp_dir)
-        except OSError:
-            pass
-        return _fallback_lightweight(problem_module_name, all_tests)
+    return mutpy_bin
+
+
+def _report_path() -> str:
+    """A fresh (not yet existing) report path in the workspace; MutPy creates it when it finishes."""
+    path = harness.scratch_file("mutpy_report_", ".yml")
+    os.remove(path)
+    return path
 
-    cmd = [
+
+def _mutpy_command(mutpy_bin: str, problem_module_name: str, test_module_name: str, tmp_dir: str, report_path: str) -> List[str]:
+    return [
         mutpy_bin,
         "--target",
         problem_module_name,
@@ -346,82 +822,204 @@ def run_mutation_tests(
         "--experimental-operators",
     ]
 
+
+def _load_report(report_path: str) -> Dict[str, Any]:
+    class MutPyLoader(yaml.SafeLoader):
+        pass
+
+    def _unknown_python(loader, tag_suffix, node):
+        # Treat unknown python tags as simple scalars
+        if isinstance(node, yaml.ScalarNode):
+            return loader.construct_scalar(node)
+        return loader.construct_sequence(node)
+
+    MutPyLoader.add_multi_constructor("tag:yaml.org,2002:python/", _unknown_python)
+
+    with open(report_path, "r") as f:
+        return yaml.load(f, Loader=MutPyLoader) or {}
+
+
+def _mutpy_failure_result(problem_module_name: str, all_tests: List[Any], proc: subprocess.CompletedProcess) -> Dict[str, Any]:
+    reason = "missing_report" if proc.returncode == 0 else f"mutpy_returncode_{proc.returncode}"
+    fallback = _fallback_lightweight(problem_module_name, all_tests)
+    fallback["error"] = reason
+    fallback["stdout"] = proc.stdout
+    fallback["stderr"] = proc.stderr
+    return fallback
+
+
+def _report_result(problem_module_name: str, all_tests: List[Any], report: Dict[str, Any]) -> Dict[str, Any]:
+    mutants = report.get("mutants") or report.get("mutations") or []
+    killed = sum(1 for m in mutants if is_kill(m.get("status")))
+    total = len(mutants)
+    return _score_or_augment(problem_module_name, all_tests, killed, total)
+
+
+def run_mutation_tests(
+    problem_module_name: str,
+    test_inputs: List[Any],
+    use_base_tests: bool = True,
+    mutant_ids: Optional[List[int]] = None,
+) -> Dict[str, Any]:
+    """
+    Score a suite; returns a dict with at least mutation_score, killed and total.
+
+    ``mutant_ids`` scores against that sample of the cached mutant set only
+    (see mutation.sampling); the score is then an estimate with a ``ci``.
+    It is ignored where no cached mutant set is used.
+    """
+    problem_module = importlib.import_module(problem_module_name)
+    all_tests = _collect_tests(problem_module, test_inputs, use_base_tests)
+
+    # Fast path: force fallback when EVOBUG_MUTPY=0
+    if os.getenv("EVOBUG_MUTPY", "1") == "0":
+        return _fallback_lightweight(problem_module_name, all_tests)
+
+    mutant_set = _load_mutant_set(problem_module_name)
+    if mutant_set is not None and mutant_set["mutants"]:
+        return _run_cached_mutants(problem_module_name, problem_module, mutant_set, all_tests, mutant_ids)
+    if MUTATION_TOOL == "custom":
+        return _fallback_lightweight(problem_module_name, all_tests)
+
+    expected_outputs = _baseline_outputs(problem_module, all_tests)
+    test_module_name, payload_path, env = _write_temp_tests(
+        problem_module_name, all_tests, expected_outputs
+    )
+
+    report_path = _report_path()
+
+    mutpy_bin = _find_mutpy_bin(env)
+    if not mutpy_bin:
+        _remove_quietly(payload_path)
+        return _fallback_lightweight(problem_module_name, all_tests)
+
+    cmd = _mutpy_command(mutpy_bin, problem_module_name, test_module_name, harness.workspace(), report_path)
+
     try:
-        proc = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=MUTATION_TIMEOUT_SECONDS,
-            env=env,
-        )
+        proc = _run_process(cmd, env, MUTATION_TIMEOUT_SECONDS)
     except subprocess.TimeoutExpired:
-        return {"mutation_score": 0.0, "killed": 0, "total": 0, "error": "timeout"}
+        _remove_quietly(report_path)
+        return _timeout_result()
     finally:
-        try:
-            os.remove(test_file)
-        except OSError:
-            pass
+        _remove_quietly(payload_path)
 
     if proc.returncode != 0 or not os.path.exists(report_path):
-        reason = "missing_report" if proc.returncode == 0 else f"mutpy_returncode_{proc.returncode}"
-        try:
-            os.rmdir(tmp_dir)
-        except OSError:
-            pass
+        return _mutpy_failure_result(problem_module_name, all_tests, proc)
+
+    try:
+        report = _load_report(report_path)
+    except Exception as exc:
         fallback = _fallback_lightweight(problem_module_name, all_tests)
-        fallback["error"] = reason
-        fallback["stdout"] = proc.stdout
-        fallback["stderr"] = proc.stderr
+        fallback["error"] = f"yaml_parse_error:{exc}"
         return fallback
+    finally:
+        _remove_quietly(report_path)
 
-    try:
-        class MutPyLoader(yaml.SafeLoader):
-            pass
+    return _report_result(problem_module_name, all_tests, report)
+
+
+def _batch_killers(records: List[List[Any]], suite_count: int) -> List[set]:
+    """Mutant tokens each suite kills, from the harness's [token, suite index, exception name] records."""
+    killers: List[set] = [set() for _ in range(suite_count)]
+    for token, suite_idx, exc_name in records:
+        if is_kill(error_status(exc_name)):
+            killers[suite_idx].add(token)
+    return killers
+
+
+def _run_mutpy_batch(
+    problem_module_name: str,
+    problem_module,
+    all_suites: List[List[Any]],
+    timeout: float,
+) -> List[Dict[str, Any]]:
+    """One MutPy invocation for many suites; see _write_batch_tests for how kills are split."""
+    expected_per_suite = [_baseline_outputs(problem_module, tests) for tests in all_suites]
+    record_path = harness.scratch_file("mutpy_batch_", ".jsonl")
+    test_module_name, payload_path, env = _write_batch_tests(
+        problem_module_name, all_suites, expected_per_suite, record_path
+    )
+    report_path = _report_path()
+
+    mutpy_bin = _find_mutpy_bin(env)
+    if not mutpy_bin:
+        _remove_quietly(payload_path, record_path)
+        return [_fallback_lightweight(problem_module_name, tests) for tests in all_suites]
 
-        def _unknown_python(loader, tag_suffix, node):
-            # Treat unknown python tags as simple scalars
-            if isinstance(node, yaml.ScalarNode):
-                return loader.construct_scalar(node)
-            return loader.construct_sequence(node)
+    cmd = _mutpy_command(mutpy_bin, problem_module_name, test_module_name, harness.workspace(), report_path)
+    try:
+        proc = _run_process(cmd, env, timeout)
+    except subprocess.TimeoutExpired:
+        _remove_quietly(report_path, record_path)
+        return [_timeout_result() for _ in all_suites]
+    finally:
+        _remove_quietly(payload_path)
 
-        MutPyLoader.add_multi_constructor("tag:yaml.org,2002:python/", _unknown_python)
+    if proc.returncode != 0 or not os.path.exists(report_path):
+        _remove_quietly(record_path)
+        return [_mutpy_failure_result(problem_module_name, tests, proc) for tests in all_suites]
 
-        with open(report_path, "r") as f:
-            report = yaml.load(f, Loader=MutPyLoader) or {}
+    try:
+        report = _load_report(report_path)
+        with open(record_path, "r") as f:
+            records = [json.loads(line) for line in f if line.strip()]
     except Exception as exc:
-        try:
-            os.rmdir(tmp_dir)
-        except OSError:
-            pass
-        fallback = _fallback_lightweight(problem_module_name, all_tests)
-        fallback["error"] = f"yaml_parse_error:{exc}"
-        return fallback
+        results = []
+        for tests in all_suites:
+            fallback = _fallback_lightweight(problem_module_name, tests)
+            fallback["error"] = f"yaml_parse_error:{exc}"
+            results.append(fallback)
+        return results
     finally:
-        try:
-            os.remove(report_path)
-            os.rmdir(tmp_dir)
-        except OSError:
-            pass
+        _remove_quietly(report_path, record_path)
 
-    mutants = report.get("mutants") or report.get("mutations") or []
-    killed = sum(1 for m in mutants if m.get("status") == "killed")
-    total = len(mutants)
-    mutation_score = killed / total if total else 0.0
+    total = len(report.get("mutants") or report.get("mutations") or [])
+    killers = _batch_killers(records, len(all_suites))
+    return [
+        _score_or_augment(problem_module_name, tests, len(killers[idx]), total)
+        for idx, tests in enumerate(all_suites)
+    ]
 
-    if total == 0 or killed == 0:
-        # Augment with internal mutants to provide signal while still considering MutPy execution.
-        internal = _fallback_lightweight(problem_module_name, all_tests)
-        return {
-            "mutation_score": internal["mutation_score"],
-            "killed": internal["killed"],
-            "total": internal["total"],
-            "fallback": False,
-            "augmented": True,
-        }
 
-    return {
-        "mutation_score": mutation_score,
-        "killed": killed,
-        "total": total,
-        "fallback": False,
-    }
+def run_mutation_tests_batch(
+    problem_module_name: str,
+    suites: List[List[Any]],
+    use_base_tests: bool = True,
+    mutant_ids: Optional[List[int]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Score many suites (e.g. a whole GA generation) with one scorer invocation.
+
+    Returns one run_mutation_tests-style result per suite, in order. Cached
+    mutants run each distinct input of the batch once through the kill matrix;
+    the MutPy path writes one TestCase class per suite and runs mut.py once.
+    Subprocess and mutant-generation overhead is paid once per batch, with a
+    timeout of MUTATION_TIMEOUT_SECONDS per suite. ``mutant_ids`` works as in
+    run_mutation_tests.
+    """
+    problem_module = importlib.import_module(problem_module_name)
+    all_suites = [_collect_tests(problem_module, tests, use_base_tests) for tests in suites]
+    if not all_suites:
+        return []
+
+    if os.getenv("EVOBUG_MUTPY", "1") == "0":
+        return [_fallback_lightweight(problem_module_name, tests) for tests in all_suites]
+
+    timeout = MUTATION_TIMEOUT_SECONDS * len(all_suites)
+    mutant_set = _load_mutant_set(problem_module_name)
+    if (mutant_set is None or not mutant_set["mutants"]) and MUTATION_TOOL == "custom":
+        return [_fallback_lightweight(problem_module_name, tests) for tests in all_suites]
+    if mutant_set is None or not mutant_set["mutants"]:
+        return _run_mutpy_batch(problem_module_name, problem_module, all_suites, timeout)
+
+    try:
+        matrix = _fill_matrix(problem_module_name, problem_module, mutant_set, all_suites, timeout, mutant_ids)
+    except PartialRun as exc:
+        return [_partial_result(problem_module_name, mutant_set, tests, mutant_ids, exc) for tests in all_suites]
+    except subprocess.TimeoutExpired:
+        return [_timeout_result() for _ in all_suites]
+    except ExecutorError as exc:
+        return [_executor_error_result(problem_module_name, tests, exc) for tests in all_suites]
+    if mutant_ids is not None:
+        return [_sampled_result(problem_module_name, matrix, mutant_set, tests, mutant_ids) for tests in all_suites]
+    return [_matrix_result(problem_module_name, matrix, tests) for tests in all_suites]
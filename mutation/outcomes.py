@@ -0,0 +1,26 @@
+"""
+How a test run against a mutant is classified, shared by every scoring path.
+
+The rules are MutPy's: a test that fails or raises kills the mutant, except
+a TypeError, which MutPy takes as a sign of an incompetent mutant (the
+mutation broke a type, not the behaviour) and never counts as a kill; a run
+stopped by its time limit counts as killed. The direct MutPy path reads
+these statuses from MutPy's report, the batch path derives them from the
+exception names the harness records, and the cached-mutant executor from
+the exceptions it catches, so one suite scores the same on every path.
+"""
+
+KILLED = "killed"
+SURVIVED = "survived"
+INCOMPETENT = "incompetent"
+TIMEOUT = "timeout"
+
+
+def error_status(exc_name: str) -> str:
+    """Status of a test that raised ``exc_name`` (an exception class name) where the original did not."""
+    return INCOMPETENT if exc_name == "TypeError" else KILLED
+
+
+def is_kill(status: str) -> bool:
+    """Whether a status counts towards the mutation score."""
+    return status in (KILLED, TIMEOUT)
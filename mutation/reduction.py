@@ -0,0 +1,183 @@
+"""
+Mutant set reduction, run once per problem before any scoring.
+
+- Stillborn mutants (fail to compile or import) are dropped.
+- Trivial compiler equivalence (TCE): mutants whose compiled bytecode matches
+  the original are dropped as equivalent, and mutants whose bytecode matches
+  an earlier mutant are dropped as duplicates.
+- Mutants that no input of a large random corpus kills are flagged as likely
+  equivalent (and dropped only with MUTANT_REDUCTION_DROP_LIKELY_EQUIVALENT,
+  since random testing cannot prove equivalence).
+
+The reduced set is cached next to the raw one (see mutation.mutants) with a
+report of what was removed and why.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+import ast
+import hashlib
+import importlib
+import inspect
+import random
+import types
+
+from config import (
+    MUTANT_REDUCTION_CORPUS_SIZE,
+    MUTANT_REDUCTION_DROP_LIKELY_EQUIVALENT,
+    MUTANT_REDUCTION_SEED,
+)
+from mutation import executor
+
+# Bump when the reduction rules change so stale reduced sets are ignored.
+REDUCTION_VERSION = 2
+
+
+def settings_signature() -> str:
+    return (
+        f"reduction={REDUCTION_VERSION};corpus={MUTANT_REDUCTION_CORPUS_SIZE};"
+        f"seed={MUTANT_REDUCTION_SEED};drop_likely={int(MUTANT_REDUCTION_DROP_LIKELY_EQUIVALENT)};"
+        f"{executor.line_budget_signature()}"
+    )
+
+
+def _const_fingerprint(value: Any) -> Any:
+    if isinstance(value, types.CodeType):
+        return code_fingerprint(value)
+    if isinstance(value, (tuple, frozenset)):
+        items = [_const_fingerprint(v) for v in value]
+        return (type(value).__name__, tuple(sorted(items, key=repr)) if isinstance(value, frozenset) else tuple(items))
+    # Type name keeps 1, 1.0 and True apart.
+    return (type(value).__name__, repr(value))
+
+
+def code_fingerprint(code: types.CodeType) -> str:
+    """Hash of a code object's bytecode, constants and names (line numbers and file names ignored)."""
+    parts = (
+        code.co_name,
+        code.co_code,
+        code.co_argcount,
+        code.co_posonlyargcount,
+        code.co_kwonlyargcount,
+        code.co_flags,
+        code.co_names,
+        code.co_varnames,
+        code.co_freevars,
+        code.co_cellvars,
+        tuple(_const_fingerprint(c) for c in code.co_consts),
+    )
+    return hashlib.sha256(repr(parts).encode("utf-8")).hexdigest()
+
+
+def _original_source(problem_module, mutants: List[Dict[str, Any]]) -> str:
+    """The unmutated code rendered the same way the mutants were."""
+    if mutants and mutants[0].get("scope") == "function":
+        from mutation.ast_engine import target_function_ast
+
+        return ast.unparse(target_function_ast(problem_module))
+    return ast.unparse(ast.parse(inspect.getsource(problem_module)))
+
+
+def _corpus(problem_module, size: int, seed: int) -> List[Any]:
+    """BASE_TESTS plus ``size`` random inputs from their own stream."""
+    rng = random.Random(seed)
+    generated = [problem_module.random_input(rng) for _ in range(size)]
+    corpus, seen = [], set()
+    for test_input in list(getattr(problem_module, "BASE_TESTS", [])) + generated:
+        key = repr(test_input)
+        if key not in seen:
+            seen.add(key)
+            corpus.append(test_input)
+    return corpus
+
+
+def _ever_killed(
+    problem_module_name: str,
+    module: types.ModuleType,
+    corpus: List[Any],
+    expected: List[Any],
+    guards: List[Tuple[float, Optional[int]]],
+) -> bool:
+    """True as soon as one corpus input kills the mutant (a timeout counts as a kill)."""
+    for args, want, guard in zip(corpus, expected, guards):
+        try:
+            with executor._guard(*guard):
+                if executor.outcome_kills(problem_module_name, module, args, want):
+                    return True
+        except executor.MutantTimeout:
+            return True
+    return False
+
+
+def reduce_mutants(
+    problem_module_name: str,
+    set_key: str,
+    mutants: List[Dict[str, Any]],
+) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Return (kept mutants, report). Kept mutants keep their original ids.
+
+    The report counts removals per reason (``stillborn``, ``equivalent``,
+    ``duplicate``), lists their ids, and lists the likely-equivalent ids found
+    on the random corpus.
+    """
+    from mutation.mutpy_runner import _baseline_outputs
+
+    problem_module = importlib.import_module(problem_module_name)
+    removed_ids: Dict[str, List[int]] = {"stillborn": [], "equivalent": [], "duplicate": []}
+    duplicate_of: Dict[int, int] = {}
+
+    try:
+        original = code_fingerprint(compile(_original_source(problem_module, mutants), "<original>", "exec"))
+    except Exception:  # noqa: BLE001 - without a reference only duplicates are merged
+        original = None
+
+    seen: Dict[str, int] = {}
+    candidates: List[Tuple[Dict[str, Any], types.ModuleType]] = []
+    for mutant in mutants:
+        try:
+            fingerprint = code_fingerprint(compile(mutant["source"], "<mutant>", "exec"))
+            module = executor.load_mutant_module(problem_module_name, set_key, mutant)
+        except Exception:  # noqa: BLE001 - fails to compile or import
+            removed_ids["stillborn"].append(mutant["id"])
+            continue
+        if fingerprint == original:
+            removed_ids["equivalent"].append(mutant["id"])
+        elif fingerprint in seen:
+            removed_ids["duplicate"].append(mutant["id"])
+            duplicate_of[mutant["id"]] = seen[fingerprint]
+        else:
+            seen[fingerprint] = mutant["id"]
+            candidates.append((mutant, module))
+
+    corpus = _corpus(problem_module, MUTANT_REDUCTION_CORPUS_SIZE, MUTANT_REDUCTION_SEED)
+    expected = _baseline_outputs(problem_module, corpus)
+    guards = executor.cell_guards(problem_module_name, corpus, expected)
+    likely_equivalent = [
+        mutant["id"]
+        for mutant, module in candidates
+        if not _ever_killed(problem_module_name, module, corpus, expected, guards)
+    ]
+
+    dropped = set(likely_equivalent) if MUTANT_REDUCTION_DROP_LIKELY_EQUIVALENT else set()
+    kept = []
+    for mutant, _ in candidates:
+        if mutant["id"] in dropped:
+            continue
+        record = dict(mutant)
+        if mutant["id"] in likely_equivalent:
+            record["likely_equivalent"] = True
+        kept.append(record)
+    if dropped:
+        removed_ids["likely_equivalent"] = sorted(dropped)
+
+    report = {
+        "original": len(mutants),
+        "kept": len(kept),
+        "removed": {reason: len(ids) for reason, ids in removed_ids.items()},
+        "removed_ids": removed_ids,
+        "duplicate_of": {str(k): v for k, v in duplicate_of.items()},
+        "likely_equivalent": len(likely_equivalent),
+        "likely_equivalent_ids": likely_equivalent,
+        "corpus_size": len(corpus),
+    }
+    return kept, report
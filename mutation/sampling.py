@@ -0,0 +1,127 @@
+"""
+Stratified mutant sampling for cheap, approximate mutation scores.
+
+Mutants are stratified by operator with proportional allocation (at least one
+per operator). Within a stratum they are ordered by source line and picked in
+a randomly shifted van der Corput order, so every sample is spread evenly over
+the lines of target_function and a larger sample always contains the smaller
+one (rows computed for it stay useful as the sample grows).
+"""
+
+from typing import Any, Dict, Iterable, List, Sequence
+import hashlib
+import math
+import random
+
+
+def _van_der_corput(i: int) -> float:
+    value, denom = 0.0, 1.0
+    while i:
+        denom *= 2
+        i, bit = divmod(i, 2)
+        value += bit / denom
+    return value
+
+
+def _spread_order(ids: Sequence[int], shift: float) -> List[int]:
+    """Order ids (already sorted by line) so that every prefix is spread across the whole list."""
+    n = len(ids)
+    order, taken = [], set()
+    for i in range(n):
+        pos = int(((_van_der_corput(i) + shift) % 1.0) * n)
+        if pos not in taken:
+            taken.add(pos)
+            order.append(ids[pos])
+    order.extend(ids[pos] for pos in range(n) if pos not in taken)
+    return order
+
+
+# Sampling order per mutant set key.
+_STRATA: Dict[str, Dict[str, List[int]]] = {}
+
+
+def strata(mutant_set: Dict[str, Any]) -> Dict[str, List[int]]:
+    """Mutant ids per operator, each list in sampling order."""
+    if mutant_set["key"] in _STRATA:
+        return _STRATA[mutant_set["key"]]
+    by_operator: Dict[str, List[Dict[str, Any]]] = {}
+    for mutant in mutant_set["mutants"]:
+        by_operator.setdefault(str(mutant.get("operator")), []).append(mutant)
+    rng = random.Random(int(hashlib.sha256(mutant_set["key"].encode("utf-8")).hexdigest()[:8], 16))
+    ordered = {}
+    for operator in sorted(by_operator):
+        mutants = sorted(by_operator[operator], key=lambda m: (m.get("lineno") or 0, m["id"]))
+        ordered[operator] = _spread_order([m["id"] for m in mutants], rng.random())
+    _STRATA[mutant_set["key"]] = ordered
+    return ordered
+
+
+def _allocate(sizes: Dict[str, int], n: int) -> Dict[str, int]:
+    """Proportional allocation (largest remainder), at least one per stratum."""
+    total = sum(sizes.values())
+    n = max(min(n, total), len(sizes))
+    quotas = {h: n * size / total for h, size in sizes.items()}
+    alloc = {h: max(1, min(sizes[h], int(q))) for h, q in quotas.items()}
+    for h in sorted(quotas, key=lambda h: quotas[h] - int(quotas[h]), reverse=True):
+        if sum(alloc.values()) >= n:
+            break
+        if alloc[h] < sizes[h]:
+            alloc[h] += 1
+    return alloc
+
+
+def stratified_sample(mutant_set: Dict[str, Any], size: int) -> List[int]:
+    """Sorted ids of a stratified sample of about ``size`` mutants (deterministic per mutant set)."""
+    ordered = strata(mutant_set)
+    alloc = _allocate({h: len(ids) for h, ids in ordered.items()}, size)
+    return sorted(i for h, ids in ordered.items() for i in ids[: alloc[h]])
+
+
+def _variance_term(killed: int, n: int, population: int) -> float:
+    """Var(p_hat) for one stratum with finite-population correction; p is kept off 0/1 so small samples are not overconfident."""
+    if n >= population:
+        return 0.0
+    p = min(max(killed / n, 0.5 / n), 1 - 0.5 / n)
+    return p * (1 - p) / n * (population - n) / max(1, population - 1)
+
+
+def estimate(
+    mutant_set: Dict[str, Any],
+    sample_ids: Iterable[int],
+    killed_ids: Iterable[int],
+    z: float = 1.96,
+) -> Dict[str, Any]:
+    """Stratified estimate of the full-set mutation score with a normal-approximation interval."""
+    sample = set(sample_ids)
+    killed = set(killed_ids) & sample
+    ordered = strata(mutant_set)
+    total = sum(len(ids) for ids in ordered.values())
+    score, variance = 0.0, 0.0
+    for ids in ordered.values():
+        in_sample = [i for i in ids if i in sample]
+        if not in_sample:
+            continue
+        weight = len(ids) / total
+        k = sum(1 for i in in_sample if i in killed)
+        score += weight * k / len(in_sample)
+        variance += weight ** 2 * _variance_term(k, len(in_sample), len(ids))
+    half = z * math.sqrt(variance)
+    return {
+        "estimate": score,
+        "ci": [max(0.0, score - half), min(1.0, score + half)],
+        "sample_size": len(sample),
+        "population_size": total,
+    }
+
+
+def half_width(score: float, sample_size: int, population_size: int, z: float = 1.96) -> float:
+    """
+    Conservative interval half-width from a score alone (simple random sampling formula).
+
+    Proportional stratification is, up to rounding, no less precise, so it is safe to use
+    where only the fitness value is known (e.g. it came from the fitness cache).
+    """
+    if sample_size <= 0:
+        return 1.0
+    killed = round(score * sample_size)
+    return z * math.sqrt(_variance_term(killed, sample_size, population_size))
@@ -0,0 +1,137 @@
+"""
+Warm, long-lived mutation workers.
+
+Each worker process keeps the problem modules and compiled cached mutants
+loaded (see mutation.executor) and takes kill-matrix tasks over a pipe, so the
+interpreter start-up, imports and mutant compilation are paid once per worker
+instead of once per evaluation. Workers are recycled after
+MUTATION_WORKER_MAX_TASKS tasks, and replaced when they crash or time out.
+"""
+
+from typing import Any, Dict, Optional
+import atexit
+import multiprocessing
+import os
+import queue
+import subprocess
+import traceback
+
+from config import MUTATION_WORKERS, MUTATION_WORKER_MAX_TASKS
+
+
+class WorkerCrashed(RuntimeError):
+    """A worker died or reported an error while running a task."""
+
+
+def _worker_main(conn) -> None:
+    """Worker loop: receive payloads, run the kill matrix, send results back."""
+    from mutation.executor import run_matrix
+    from mutation.mutants import load_mutant_set_file
+
+    while True:
+        try:
+            payload = conn.recv()
+        except (EOFError, KeyboardInterrupt):
+            return
+        if payload is None:
+            return
+        try:
+            mutant_set = load_mutant_set_file(payload["mutant_path"], payload["problem"])
+            result = run_matrix(
+                payload["problem"], mutant_set, payload["tests"], payload["expected"],
+                payload.get("mutant_ids"), payload.get("coverage"), payload.get("plan"), payload.get("stream_path"),
+            )
+            conn.send(("ok", result))
+        except Exception:  # noqa: BLE001 - report and keep serving
+            conn.send(("error", traceback.format_exc()))
+
+
+class _Worker:
+    def __init__(self):
+        self.conn, child_conn = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(target=_worker_main, args=(child_conn,), daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.tasks_done = 0
+
+    def stop(self, kill: bool = False) -> None:
+        if kill:
+            self.process.kill()
+        else:
+            try:
+                self.conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+        self.process.join(timeout=1)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+
+class WorkerPool:
+    """Fixed-size pool of warm workers; ``run`` is safe to call from several threads."""
+
+    def __init__(self, size: int = MUTATION_WORKERS, max_tasks: int = MUTATION_WORKER_MAX_TASKS):
+        self.size = max(1, size)
+        self.max_tasks = max_tasks
+        self._idle: "queue.Queue[Optional[_Worker]]" = queue.Queue()
+        for _ in range(self.size):
+            # Workers start lazily on first use.
+            self._idle.put(None)
+        self.restarts = 0
+
+    def run(self, payload: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        """
+        Run one kill-matrix payload on a warm worker.
+
+        Raises subprocess.TimeoutExpired (worker is killed and replaced) or
+        WorkerCrashed, mirroring the one-shot executor subprocess.
+        """
+        worker = self._idle.get()
+        try:
+            if worker is None or not worker.process.is_alive() or worker.tasks_done >= self.max_tasks:
+                if worker is not None:
+                    worker.stop(kill=not worker.process.is_alive())
+                    self.restarts += 1
+                worker = _Worker()
+            try:
+                worker.conn.send(payload)
+                if not worker.conn.poll(timeout):
+                    worker.stop(kill=True)
+                    worker = None
+                    raise subprocess.TimeoutExpired("mutation worker", timeout)
+                status, result = worker.conn.recv()
+            except (EOFError, BrokenPipeError, OSError) as exc:
+                worker.stop(kill=True)
+                worker = None
+                raise WorkerCrashed(f"worker_crashed: {exc}") from exc
+            worker.tasks_done += 1
+            if status != "ok":
+                raise WorkerCrashed(result)
+            return result
+        finally:
+            self._idle.put(worker)
+
+    def shutdown(self) -> None:
+        while True:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            if worker is not None:
+                worker.stop()
+
+
+_POOL: Optional[WorkerPool] = None
+_POOL_PID: Optional[int] = None
+
+
+def get_worker_pool() -> WorkerPool:
+    """Per-process pool, created on first use (and again after a fork) and shut down at exit."""
+    global _POOL, _POOL_PID
+    if _POOL is None or _POOL_PID != os.getpid():
+        _POOL = WorkerPool()
+        _POOL_PID = os.getpid()
+        atexit.register(_POOL.shutdown)
+    return _POOL
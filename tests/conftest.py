@@ -1,7 +1,24 @@
 import sys
 from pathlib import Path
+from unittest import mock
+
+import pytest
 
 # Ensure project root is on sys.path for imports like `ga.*`
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
+
+
+@pytest.fixture(autouse=True)
+def _no_shared_stores():
+    """Keep the fitness cache, kill stats and job history in memory so tests never share state through disk."""
+    from experiments import run_experiments
+    from ga import engine
+    from mutation import kill_stats
+
+    with mock.patch.object(engine, "FITNESS_CACHE_PATH", None), \
+            mock.patch.object(kill_stats, "KILL_STATS_PATH", None), \
+            mock.patch.object(run_experiments, "JOB_HISTORY_PATH", None), \
+            mock.patch.dict(kill_stats._STATS, clear=True):
+        yield
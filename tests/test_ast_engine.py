@@ -0,0 +1,81 @@
+import ast
+import inspect
+import tempfile
+import unittest
+from unittest import mock
+
+import problems.problem_roman_to_int as roman_to_int
+import problems.problem_two_sum as two_sum
+import problems.problem_dup_digits as dup_digits
+from mutation import ast_engine, executor, kill_matrix, mutants, mutpy_runner
+
+
+class TestAstEngine(unittest.TestCase):
+    def test_generates_every_operator_for_roman_to_int(self):
+        generated = ast_engine.generate_mutants(roman_to_int)
+        self.assertEqual({m["operator"] for m in generated}, set(ast_engine.OPERATORS))
+        self.assertEqual([m["id"] for m in generated], list(range(len(generated))))
+
+    def test_mutants_compile_and_differ_from_original(self):
+        original = ast.unparse(ast_engine.target_function_ast(roman_to_int))
+        for mutant in ast_engine.generate_mutants(roman_to_int):
+            compile(mutant["source"], "<mutant>", "exec")
+            self.assertNotEqual(mutant["source"], original)
+            self.assertEqual(mutant["scope"], "function")
+
+    def test_operator_subset(self):
+        generated = ast_engine.generate_mutants(roman_to_int, ("LCR",))
+        self.assertTrue(generated)
+        self.assertTrue(all(m["operator"] == "LCR" for m in generated))
+
+    def test_docstring_is_not_mutated(self):
+        docstring = inspect.getdoc(two_sum.target_function)
+        for mutant in ast_engine.generate_mutants(two_sum, ("CRP", "SDL")):
+            self.assertIn(docstring.splitlines()[0], mutant["source"])
+
+
+class TestSchemata(unittest.TestCase):
+    def _matrix(self, problem, schemata):
+        mutant_set = {"key": f"schemata-test-{schemata}", "mutants": ast_engine.generate_mutants(problem)}
+        tests = list(problem.BASE_TESTS)
+        expected = mutpy_runner._baseline_outputs(problem, tests)
+        with mock.patch.object(executor, "MUTANT_SCHEMATA", schemata), \
+                mock.patch.object(executor, "_MODULES", {}), \
+                mock.patch.object(executor, "_SCHEMATA", {}):
+            return executor.run_matrix(problem.__name__, mutant_set, tests, expected)
+
+    def test_schemata_rows_match_separate_mutants(self):
+        for problem in (roman_to_int, dup_digits, two_sum):
+            with self.subTest(problem=problem.__name__):
+                self.assertEqual(self._matrix(problem, True), self._matrix(problem, False))
+
+    def test_inactive_meta_function_is_the_original(self):
+        mutant_set = {"key": "schemata-inactive", "mutants": ast_engine.generate_mutants(dup_digits)}
+        with mock.patch.object(executor, "_SCHEMATA", {}):
+            module = executor.load_schemata_module(dup_digits.__name__, mutant_set)
+        self.assertIsNotNone(module)
+        for args in dup_digits.BASE_TESTS:
+            self.assertEqual(module.target_function(*args), dup_digits.target_function(*args))
+
+
+class TestCustomScorer(unittest.TestCase):
+    def test_scores_in_process_without_subprocess(self):
+        with tempfile.TemporaryDirectory() as cache_dir, \
+                mock.patch.object(mutants, "MUTANTS_CACHE_DIR", cache_dir), \
+                mock.patch.object(mutants, "MUTATION_TOOL", "custom"), \
+                mock.patch.object(mutants, "_LOADED", {}), \
+                mock.patch.object(mutpy_runner, "MUTATION_TOOL", "custom"), \
+                mock.patch.object(kill_matrix, "_MATRICES", {}), \
+                mock.patch.object(mutpy_runner, "_compute_rows_in_child", side_effect=AssertionError), \
+                mock.patch.object(mutpy_runner.subprocess, "Popen", side_effect=AssertionError):
+            result = mutpy_runner.run_mutation_tests("problems.problem_roman_to_int", [("XIV",)])
+            batch = mutpy_runner.run_mutation_tests_batch("problems.problem_roman_to_int", [[("XIV",)]])
+
+        self.assertEqual(result["total"], len(ast_engine.generate_mutants(roman_to_int)))
+        self.assertGreater(result["mutation_score"], 0.0)
+        self.assertNotIn("error", result)
+        self.assertEqual(batch, [result])
+
+
+if __name__ == "__main__":
+    unittest.main()
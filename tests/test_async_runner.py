@@ -0,0 +1,140 @@
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from mutation import async_runner, kill_matrix, kill_stats, mutants, mutpy_runner
+from tests.test_mutant_cache import _handmade_mutants
+
+
+def _is_running(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            return f.read().split(")")[-1].split()[0] != "Z"  # zombies are dead, just not reaped yet
+    except OSError:
+        return True
+
+
+class TestAsyncRunner(unittest.TestCase):
+    def test_timeout_kills_process_group(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            pid_file = os.path.join(tmp, "grandchild.pid")
+            script = (
+                "import subprocess, sys, time\n"
+                "p = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(60)'])\n"
+                f"open({pid_file!r}, 'w').write(str(p.pid))\n"
+                "time.sleep(60)\n"
+            )
+            with self.assertRaises(subprocess.TimeoutExpired):
+                asyncio.run(async_runner._run_process_async([sys.executable, "-c", script], dict(os.environ), 1.0))
+            grandchild = int(open(pid_file).read())
+            time.sleep(0.2)
+            self.assertFalse(_is_running(grandchild))
+
+    def test_cached_mutants_scored_and_stop_cancels_pending(self):
+        with tempfile.TemporaryDirectory() as cache_dir, \
+                mock.patch.object(mutants, "MUTANTS_CACHE_DIR", cache_dir), \
+                mock.patch.object(mutants, "_LOADED", {}), \
+                mock.patch.object(kill_matrix, "_MATRICES", {}), \
+                mock.patch.object(mutants, "_mutpy_operators", return_value=[]), \
+                mock.patch.object(mutants, "_generate_with_mutpy", return_value=_handmade_mutants()):
+            async def scenario():
+                done = await async_runner.run_many_async(
+                    "problems.problem_reverse_string", [[("abc",)], [("aa",)]], use_base_tests=False
+                )
+                stop = asyncio.Event()
+                stop.set()
+                cancelled = await async_runner.run_many_async(
+                    "problems.problem_reverse_string", [[("xyz",)]], use_base_tests=False, stop_event=stop
+                )
+                return done, cancelled
+
+            done, cancelled = asyncio.run(scenario())
+        self.assertEqual(done[0]["killed_ids"], [0, 1])
+        self.assertTrue(done[1]["augmented"])  # no cached mutant killed, so the lightweight mutants fill in
+        self.assertEqual(cancelled, [None])
+
+    def test_native_engine_leaves_the_loop_free(self):
+        def slow_score(problem_module_name, test_inputs, use_base_tests=True):
+            time.sleep(0.3)
+            return {"mutation_score": 1.0}
+
+        async def scenario():
+            ticks = 0
+
+            async def tick():
+                nonlocal ticks
+                while True:
+                    await asyncio.sleep(0.01)
+                    ticks += 1
+
+            ticker = asyncio.ensure_future(tick())
+            start = time.perf_counter()
+            done = await async_runner.run_many_async("problems.problem_reverse_string", [[("a",)]] * 3)
+            overlapped = time.perf_counter() - start
+            stop = asyncio.Event()
+            asyncio.get_running_loop().call_later(0.05, stop.set)
+            start = time.perf_counter()
+            cancelled = await async_runner.run_many_async("problems.problem_reverse_string", [[("a",)]] * 2, stop_event=stop)
+            stopped = time.perf_counter() - start
+            ticker.cancel()
+            return done, overlapped, cancelled, stopped, ticks
+
+        with mock.patch.object(async_runner, "MUTATION_TOOL", "custom"), \
+                mock.patch.object(async_runner, "MUTATION_ASYNC_CONCURRENCY", 3), \
+                mock.patch.object(async_runner.runner, "run_mutation_tests", slow_score):
+            done, overlapped, cancelled, stopped, ticks = asyncio.run(scenario())
+        self.assertEqual(done, [{"mutation_score": 1.0}] * 3)
+        self.assertLess(overlapped, 0.6)  # three 0.3 s suites side by side, not one after another
+        self.assertEqual(cancelled, [None, None])
+        self.assertLess(stopped, 0.25)
+        self.assertGreater(ticks, 10)  # the loop kept running while suites were scored
+
+    def test_semaphores_are_per_live_loop(self):
+        async def grab():
+            sem = async_runner._semaphore()
+            return sem, [loop for loop in async_runner._SEMAPHORES if loop.is_closed()]
+
+        first, _ = asyncio.run(grab())
+        second, closed = asyncio.run(grab())
+        self.assertIsNot(first, second)
+        self.assertEqual(closed, [])
+
+    def test_cached_mutants_keep_the_blocking_paths_plan_and_counters(self):
+        problem = "problems.problem_reverse_string"
+        suite = [("aa",), ("abc",), ("",)]
+
+        def score(run):
+            with mock.patch.dict(kill_matrix._MATRICES, clear=True), mock.patch.dict(kill_stats._STATS, clear=True):
+                result = run()
+                mutant_set = mutpy_runner._load_mutant_set(problem)
+                return (
+                    result,
+                    mutpy_runner.execution_stats(problem),
+                    kill_stats.get_kill_stats(mutant_set).counts,
+                )
+
+        with tempfile.TemporaryDirectory() as cache_dir, \
+                mock.patch.object(mutants, "MUTANTS_CACHE_DIR", cache_dir), \
+                mock.patch.object(mutants, "_LOADED", {}), \
+                mock.patch.object(mutants, "_mutpy_operators", return_value=[]), \
+                mock.patch.object(mutants, "_generate_with_mutpy", return_value=_handmade_mutants()), \
+                mock.patch.object(mutpy_runner, "TEST_PRIORITIZATION", True):
+            blocking = score(lambda: mutpy_runner.run_mutation_tests(problem, suite, False))
+            awaited = score(lambda: asyncio.run(async_runner.run_mutation_tests_async(problem, suite, False)))
+        self.assertEqual(awaited, blocking)
+        # Mutants 0 and 1 stop at their first kill instead of running every input.
+        self.assertLess(awaited[1]["executed_tests"], awaited[1]["pending_tests"])
+        self.assertTrue(awaited[2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from experiments import run_experiments
+from ga import checkpoint, engine
+from mutation import mutants, mutpy_runner
+
+PROBLEM = "problems.problem_dup_digits"
+
+
+def _interrupt_after(calls):
+    """evaluate_population that raises KeyboardInterrupt on call number ``calls`` + 1."""
+    real = engine.evaluate_population
+    count = [0]
+
+    def evaluate(*args, **kwargs):
+        count[0] += 1
+        if count[0] > calls:
+            raise KeyboardInterrupt
+        return real(*args, **kwargs)
+
+    return evaluate
+
+
+def _strip(result):
+    # Execution counters describe the work of this process, not the search;
+    # so do shared-store hits, which only depend on what other runs stored first.
+    result.pop("mutant_execution", None)
+    result["fitness_cache"].pop("shared_hits")
+    return result
+
+
+class TestCheckpointFile(unittest.TestCase):
+    def test_state_round_trips_and_other_runs_are_rejected(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "run.pkl")
+            self.assertIsNone(checkpoint.load(path, {"seed": 1}))
+            checkpoint.save(path, {"seed": 1}, {"generation": 3})
+            self.assertEqual(checkpoint.load(path, {"seed": 1}), {"generation": 3})
+            with self.assertRaises(ValueError):
+                checkpoint.load(path, {"seed": 2})
+            self.assertEqual(os.listdir(tmp), ["run.pkl"])
+
+
+class TestResume(unittest.TestCase):
+    def setUp(self):
+        patches = [
+            mock.patch.object(mutpy_runner, "MUTATION_TOOL", "custom"),
+            mock.patch.object(mutants, "MUTATION_TOOL", "custom"),
+        ]
+        # Default cache settings, with the shared on-disk tier in a temp dir: it keeps
+        # filling between an interrupt and the resume, which must not change the run.
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        patches.append(mock.patch.object(engine, "FITNESS_CACHE_PATH", os.path.join(tmp.name, "fitness.sqlite3")))
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def _run(self, path=None):
+        return engine.run_ga_for_problem(
+            PROBLEM, population_size=6, num_generations=5, seed=11, stopping=[], checkpoint=path
+        )
+
+    def test_resumed_ga_run_matches_uninterrupted_run(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "run.pkl")
+            with mock.patch.object(engine, "evaluate_population", _interrupt_after(3)):
+                with self.assertRaises(KeyboardInterrupt):
+                    self._run(path)
+            self.assertTrue(os.path.exists(path))
+            # The uninterrupted run stores every score the resumed run still needs.
+            expected = self._run()
+            resumed = self._run(path)
+        self.assertGreater(resumed["fitness_cache"]["shared_hits"], 0)
+        self.assertEqual(_strip(resumed), _strip(expected))
+
+    def test_resumed_batch_writes_the_same_summary(self):
+        def batch(results_dir, run_id, resume=None):
+            with mock.patch.multiple(
+                run_experiments,
+                PROBLEMS=[PROBLEM],
+                RESULTS_DIR=results_dir,
+                RESULTS_RUN_ID=run_id,
+                GLOBAL_RANDOM_SEED=4,
+                NUM_RUNS_PER_PROBLEM=2,
+                EXPERIMENT_POPULATION_SIZE=6,
+                EXPERIMENT_NUM_GENERATIONS=3,
+                SUITE_MINIMIZATION=False,
+            ), mock.patch("builtins.print"):
+                run_experiments.run_all_experiments(resume=resume)
+            with open(os.path.join(results_dir, run_id, "problems_problem_dup_digits_summary.json")) as f:
+                summary = json.load(f)
+            for run in summary["ga_runs"]:
+                _strip(run)
+            return summary
+
+        with tempfile.TemporaryDirectory() as tmp:
+            expected = batch(tmp, "straight")
+            # Interrupt the second GA run after its second generation is scored.
+            with mock.patch.object(engine, "evaluate_population", _interrupt_after(3 + 2)):
+                with self.assertRaises(KeyboardInterrupt):
+                    batch(tmp, "interrupted")
+            resumed = batch(tmp, "interrupted", resume=os.path.join(tmp, "interrupted"))
+            self.assertFalse(os.path.exists(os.path.join(tmp, "interrupted", "checkpoints")))
+        expected["config"].pop("results_run_id")
+        resumed["config"].pop("results_run_id")
+        self.assertEqual(resumed, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
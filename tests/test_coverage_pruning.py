@@ -0,0 +1,45 @@
+import unittest
+
+import problems.problem_roman_to_int as roman
+import problems.problem_two_sum as two_sum
+from mutation import ast_engine, coverage, executor, mutpy_runner
+
+
+class TestLineCoverage(unittest.TestCase):
+    def test_baseline_outputs_match_untraced_run(self):
+        tests = list(roman.BASE_TESTS) + [("",), ("MMXXIV",)]
+        outputs, covered = coverage.baseline_runs(roman, tests)
+        self.assertEqual(
+            [repr(o) for o in outputs],
+            [repr(o) for o in mutpy_runner._baseline_outputs(roman, tests)],
+        )
+        first, last = coverage.body_span(roman)
+        self.assertTrue(all(lines and min(lines) >= first and max(lines) <= last for lines in covered))
+
+    def test_mutants_outside_target_body_are_always_reached(self):
+        first, last = coverage.body_span(two_sum)
+        self.assertTrue(coverage.reaches({"lineno": None}, frozenset(), (first, last)))
+        self.assertTrue(coverage.reaches({"lineno": first - 1}, frozenset(), (first, last)))
+        self.assertFalse(coverage.reaches({"lineno": first}, frozenset(), (first, last)))
+
+
+class TestCoveragePruning(unittest.TestCase):
+    def test_pruned_matrix_matches_full_matrix(self):
+        for problem, tests in (
+            (two_sum, list(two_sum.BASE_TESTS) + [([1, 1], 5), ([4, 2], 6)]),
+            (roman, list(roman.BASE_TESTS) + [("",), ("IV",)]),
+        ):
+            with self.subTest(problem=problem.__name__):
+                mutant_set = {"key": f"coverage-{problem.__name__}", "mutants": ast_engine.generate_mutants(problem)}
+                expected, covered = coverage.baseline_runs(problem, tests)
+                full = executor.run_matrix(problem.__name__, mutant_set, tests, expected)
+                pruned = executor.run_matrix(problem.__name__, mutant_set, tests, expected, None, covered)
+
+                self.assertEqual(pruned["rows"], full["rows"])
+                self.assertEqual(pruned["timeouts"], full["timeouts"])
+                self.assertGreater(pruned["pruned"], 0)
+                self.assertEqual(full["pruned"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import random
+import unittest
+from unittest import mock
+
+import problems.problem_two_sum as two_sum
+from ga import engine, evaluation
+from mutation import mutants, mutpy_runner
+
+
+class TestInheritedFitness(unittest.TestCase):
+    def test_inherited_individuals_are_not_scored(self):
+        random.seed(2)
+        population = [two_sum.random_input() for _ in range(4)]
+        scored = []
+
+        def _score(name, suites, mutant_ids=None):
+            scored.extend(suites)
+            return [{"mutation_score": 0.25} for _ in suites]
+
+        with mock.patch.object(evaluation, "score_suites", _score):
+            fitnesses = evaluation.evaluate_population(
+                population + [population[0]], two_sum.__name__, two_sum.decode_individual,
+                inherited=[None, (0.9, None), None, None, None],
+            )
+        self.assertEqual(fitnesses, [0.25, 0.9, 0.25, 0.25, 0.25])
+        # The inherited genome and the in-batch duplicate are never scored.
+        self.assertEqual(len(scored), 3)
+
+    def test_unchanged_child_keeps_parent_fitness(self):
+        parent, other = ([1, 2], 3), ([4, 5], 9)
+        known = [(0.5, None), (0.7, None)]
+        self.assertEqual(engine._inherited(([1, 2], 3), [(parent, 0), (other, 1)], known), (0.5, None))
+        self.assertIsNone(engine._inherited(([1, 2], 4), [(parent, 0), (other, 1)], known))
+
+
+class TestElitism(unittest.TestCase):
+    def test_best_fitness_never_drops_and_scoring_is_reused(self):
+        with mock.patch.object(mutpy_runner, "MUTATION_TOOL", "custom"), \
+                mock.patch.object(mutants, "MUTATION_TOOL", "custom"), \
+                mock.patch.object(engine, "FITNESS_CACHE_ENABLED", False), \
+                mock.patch.object(engine, "ELITISM_COUNT", 2):
+            result = engine.run_ga_for_problem(
+                "problems.problem_dup_digits", population_size=8, num_generations=5, seed=4
+            )
+        history = result["fitness_history"]
+        self.assertEqual(history, sorted(history))
+        self.assertGreaterEqual(result["fitness_reuse"]["inherited"], 2 * 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from experiments import run_experiments
+from experiments.job_history import JobHistory, longest_first, predicted_makespan
+from ga import engine
+from mutation import kill_stats, mutants, mutpy_runner
+
+PROBLEMS = ["problems.problem_dup_digits", "problems.problem_two_sum"]
+
+
+class TestExperimentJobs(unittest.TestCase):
+    def test_seeds_are_derived_up_front(self):
+        with mock.patch.multiple(run_experiments, PROBLEMS=PROBLEMS, NUM_RUNS_PER_PROBLEM=2):
+            jobs = run_experiments.experiment_jobs(7)
+            self.assertEqual(jobs, run_experiments.experiment_jobs(7))
+        self.assertEqual([job["kind"] for job in jobs], ["ga", "ga", "random"] * 2)
+        self.assertEqual(len({job["seed"] for job in jobs}), len(jobs))
+
+
+class TestJobHistory(unittest.TestCase):
+    def test_estimates_come_from_the_key_or_scale_with_budget(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            history = JobHistory(os.path.join(tmp, "history.sqlite3"))
+            history.record("p", "mutpy", "ga:ga", 100, 10.0)
+            history.record("p", "mutpy", "ga:ga", 100, 20.0)
+            history.close()
+            history = JobHistory(os.path.join(tmp, "history.sqlite3"))
+            self.assertEqual(history.estimate("p", "mutpy", "ga:ga", 100), 15.0)
+            self.assertEqual(history.estimate("p", "mutpy", "ga:ga", 50), 7.5)
+            self.assertIsNone(history.estimate("p", "custom", "ga:ga", 100))
+            self.assertIsNone(history.estimate("q", "mutpy", "ga:ga", 100))
+            history.close()
+
+    def test_longest_expected_job_starts_first(self):
+        self.assertEqual(longest_first([2.0, None, 9.0, 2.0]), [1, 2, 0, 3])
+        # A 9s job started last on two workers finishes late; started first it overlaps the rest.
+        self.assertEqual(predicted_makespan([2.0, 2.0, 2.0, 9.0], 2), 11.0)
+        self.assertEqual(predicted_makespan([9.0, 2.0, 2.0, 2.0], 2), 9.0)
+
+
+class TestParallelBatch(unittest.TestCase):
+    def _batch(self, results_dir, run_id, jobs):
+        # Caches on, with the fitness and kill-stats stores shared by every job of both batches.
+        with mock.patch.object(mutpy_runner, "MUTATION_TOOL", "custom"), \
+                mock.patch.object(mutants, "MUTATION_TOOL", "custom"), \
+                mock.patch.object(engine, "FITNESS_CACHE_PATH", os.path.join(results_dir, "fitness.sqlite3")), \
+                mock.patch.object(kill_stats, "KILL_STATS_PATH", os.path.join(results_dir, "kill_stats.sqlite3")), \
+                mock.patch.multiple(
+                    run_experiments,
+                    PROBLEMS=PROBLEMS,
+                    RESULTS_DIR=results_dir,
+                    RESULTS_RUN_ID=run_id,
+                    GLOBAL_RANDOM_SEED=5,
+                    NUM_RUNS_PER_PROBLEM=2,
+                    EXPERIMENT_POPULATION_SIZE=6,
+                    EXPERIMENT_NUM_GENERATIONS=3,
+                    RANDOM_BASELINE_EQUAL_COST=True,
+                    SUITE_MINIMIZATION=False,
+                ), mock.patch("builtins.print"):
+            run_experiments.run_all_experiments(jobs=jobs)
+        run_dir = os.path.join(results_dir, run_id)
+        summaries = {}
+        for problem in PROBLEMS:
+            with open(os.path.join(run_dir, f"{problem.replace('.', '_')}_summary.json")) as f:
+                summary = json.load(f)
+            summary["config"].pop("results_run_id")
+            for run in summary["ga_runs"]:
+                # Work counters: how much scoring the shared stores saved depends on which job stored first.
+                run.pop("mutant_execution", None)
+                run["fitness_cache"].pop("shared_hits")
+            summaries[problem] = summary
+        with open(os.path.join(run_dir, "seeds_used.txt")) as f:
+            seeds = f.read()
+        self.assertEqual(sorted(os.listdir(run_dir)), sorted(
+            [f"{p.replace('.', '_')}_summary.json" for p in PROBLEMS] + ["seeds_used.txt"]
+        ))
+        return summaries, seeds
+
+    def test_parallel_batch_matches_serial_batch(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            parallel = self._batch(tmp, "parallel", 3)
+            serial = self._batch(tmp, "serial", 1)
+        self.assertEqual(parallel, serial)
+        for summary in serial[0].values():
+            ga_inputs = [run["evaluation_budget"]["inputs"] for run in summary["ga_runs"]]
+            self.assertEqual(summary["random_details"]["num_tests"], round(sum(ga_inputs) / len(ga_inputs)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import problems.problem_two_sum as two_sum
+from ga import evaluation
+from ga.fitness_cache import FitnessCache, fitness_key
+
+
+class TestFitnessCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, "fitness.sqlite3")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_lru_evicts_oldest_entry(self):
+        cache = FitnessCache(max_entries=2, db_path=None)
+        cache.put("a", 0.1)
+        cache.put("b", 0.2)
+        self.assertEqual(cache.get("a"), 0.1)  # refresh "a"
+        cache.put("c", 0.3)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), 0.1)
+        self.assertEqual(cache.stats()["hits"], 2)
+        self.assertEqual(cache.stats()["misses"], 1)
+
+    def test_sqlite_tier_is_shared_between_instances(self):
+        writer = FitnessCache(db_path=self.db_path)
+        writer.put("k", 0.75)
+        writer.close()
+
+        reader = FitnessCache(db_path=self.db_path)
+        self.assertEqual(reader.lookup("k"), (0.75, True))
+        # Another run's entry saves scoring but is a miss for this run.
+        self.assertEqual(reader.stats()["hit_rate"], 0.0)
+        self.assertEqual(reader.stats()["shared_hits"], 1)
+        reader.close()
+
+    def test_key_depends_on_every_suite_input(self):
+        key_a = fitness_key("problems.problem_two_sum", [([1, 2], 3), ([5, 6], 11)])
+        key_b = fitness_key("problems.problem_two_sum", [([1, 2], 3), ([7, 8], 15)])
+        self.assertNotEqual(key_a, key_b)
+        self.assertEqual(key_a, fitness_key("problems.problem_two_sum", [([1, 2], 3), ([5, 6], 11)]))
+
+    def test_suites_with_different_top_ups_never_share_an_entry(self):
+        cache = FitnessCache(db_path=None)
+        scored = []
+
+        def _score(name, suites, mutant_ids=None):
+            scored.extend(suites)
+            return [{"mutation_score": 0.1 * len(scored)} for _ in suites]
+
+        genome = ([1, 2], 3)
+        fitnesses = []
+        with mock.patch.object(evaluation, "score_suites", _score):
+            for top_up in (([5, 6], 11), ([7, 8], 15), ([5, 6], 11)):
+                with mock.patch.object(two_sum, "random_input", lambda rng=None, top_up=top_up: top_up):
+                    fitnesses += evaluation.evaluate_population([genome], two_sum.__name__, lambda g: g, cache)
+        self.assertEqual([suite[1] for suite in scored], [([5, 6], 11), ([7, 8], 15)])
+        self.assertEqual(fitnesses, [0.1, 0.2, 0.1])
+
+    def test_a_genome_always_gets_the_same_suite(self):
+        genome = ([1, 2], 3)
+        suite = evaluation.build_suite(two_sum, genome, 7)
+        self.assertEqual(suite, evaluation.build_suite(two_sum, genome, 7))
+        self.assertEqual(suite[0], genome)
+
+    def test_top_ups_depend_on_the_run_seed(self):
+        genome = ([1, 2], 3)
+        with mock.patch.object(evaluation, "INDIVIDUAL_SUITE_SIZE", 3):
+            suites = [evaluation.build_suite(two_sum, genome, seed) for seed in (7, 8)]
+        self.assertEqual(suites[0][0], suites[1][0])
+        self.assertNotEqual(suites[0][1:], suites[1][1:])
+
+
+if __name__ == "__main__":
+    unittest.main()
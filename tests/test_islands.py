@@ -0,0 +1,61 @@
+import queue
+import unittest
+from unittest import mock
+
+from ga import engine, islands
+from mutation import mutants, mutpy_runner
+
+
+class TestMigration(unittest.TestCase):
+    def test_best_leave_and_migrants_replace_the_worst(self):
+        inbox, outbox = queue.Queue(), queue.Queue()
+        inbox.put((2, [("m1", 0.9, ["s1"]), ("m2", 0.8, ["s2"])]))
+        migrate = islands.Migration(inbox, outbox, interval=2, migrants=2, timeout=1)
+        population, fitnesses, suites = ["a", "b", "c", "d"], [0.1, 0.5, 0.3, 0.7], [None] * 4
+
+        self.assertEqual(migrate(1, population, fitnesses, suites), (population, fitnesses, suites))
+        population, fitnesses, suites = migrate(2, population, fitnesses, suites)
+
+        gen, outgoing = outbox.get_nowait()
+        self.assertEqual((gen, [individual for individual, _, _ in outgoing]), (2, ["d", "b"]))
+        self.assertEqual(population, ["m1", "b", "m2", "d"])
+        self.assertEqual(fitnesses, [0.9, 0.5, 0.8, 0.7])
+        self.assertEqual(migrate.received, 2)
+
+    def test_a_late_batch_is_dropped_not_used_for_the_next_migration(self):
+        inbox, outbox = queue.Queue(), queue.Queue()
+        migrate = islands.Migration(inbox, outbox, interval=2, migrants=1, timeout=0.05)
+        population, fitnesses, suites = ["a", "b"], [0.1, 0.5], [None] * 2
+
+        self.assertEqual(migrate(2, population, fitnesses, suites), (population, fitnesses, suites))
+        inbox.put((2, [("late", 0.9, None)]))
+        inbox.put((4, [("on_time", 0.8, None)]))
+        population, _, _ = migrate(4, population, fitnesses, suites)
+
+        self.assertEqual(population, ["on_time", "b"])
+        self.assertEqual((migrate.missed, migrate.received), (1, 1))
+
+    def test_island_seeds_are_distinct_and_stable(self):
+        self.assertEqual(islands.island_seeds(7, 3), islands.island_seeds(7, 3))
+        self.assertEqual(len(set(islands.island_seeds(7, 3))), 3)
+
+
+class TestIslandRun(unittest.TestCase):
+    def test_same_seed_same_result(self):
+        with mock.patch.object(mutpy_runner, "MUTATION_TOOL", "custom"), \
+                mock.patch.object(mutants, "MUTATION_TOOL", "custom"), \
+                mock.patch.object(islands, "ISLAND_MIGRATION_INTERVAL", 2):
+            runs = [
+                engine.run_ga_for_problem(
+                    "problems.problem_dup_digits", population_size=10, num_generations=4, seed=9, islands=2
+                )
+                for _ in range(2)
+            ]
+        self.assertEqual(runs[0], runs[1])
+        self.assertEqual(len(runs[0]["islands"]), 2)
+        self.assertEqual(runs[0]["islands"][0]["population_size"], 5)
+        self.assertEqual(runs[0]["islands"][1]["migrants"]["received"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import os
+import random
+import tempfile
+import unittest
+from unittest import mock
+
+import problems.problem_roman_to_int as roman
+from mutation import kill_matrix, kill_stats, mutants, mutpy_runner
+from mutation.kill_matrix import KillMatrix
+from mutation.kill_stats import KillStats, input_features
+
+
+class TestKillStats(unittest.TestCase):
+    def test_history_puts_likely_killers_first(self):
+        stats = KillStats("order-test", db_path=None)
+        features = [input_features(("IV",)), input_features(("MMMCMXCIX",)), input_features(("X",))]
+        for _ in range(3):
+            stats.record(7, features[1], True)
+            stats.record(7, features[0], False)
+        self.assertEqual(stats.order(7, [[0, 1, 2]], features), [[1, 0, 2]])
+        # No history for a mutant: suite order is kept.
+        self.assertEqual(stats.order(8, [[0, 1, 2]], features), [[0, 1, 2]])
+
+    def test_counts_persist_across_instances(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "kill_stats.sqlite3")
+            stats = KillStats("persist-test", db_path=path)
+            stats.record(3, {"*", "arg0:len=2"}, True)
+            stats.flush()
+            stats.record(3, {"*"}, False)
+            stats.flush()
+            reloaded = KillStats("persist-test", db_path=path)
+            self.assertEqual(reloaded.counts[3]["*"], [1, 2])
+            self.assertEqual(KillStats("other-set", db_path=path).counts, {})
+
+    def test_features_generalize_across_inputs(self):
+        # Distinct inputs of the same shape share every feature, so the table does not grow per input.
+        self.assertEqual(input_features(("IV",), [3, 4]), input_features(("IX",), [3, 4]))
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "kill_stats.sqlite3")
+            stats = KillStats("prune-test", db_path=path)
+            stats._db().execute("INSERT INTO kill_stats VALUES ('prune-test', 1, 'input=abc', 1, 1)")
+            stats.record(1, {"*"}, True)
+            stats.flush()
+            self.assertEqual(KillStats("prune-test", db_path=path).counts, {1: {"*": [1, 1]}})
+
+
+class TestPending(unittest.TestCase):
+    def test_mutants_a_suite_already_kills_are_not_pending(self):
+        matrix = KillMatrix({"key": "pending-test", "mutants": [{"id": 0}, {"id": 1}]})
+        matrix.add_rows([("a",)], {"rows": [[0]], "timeouts": [[]], "evaluated": [[0]]})
+        pending = matrix.pending([[("a",), ("b",)], [("b",)]])
+        self.assertEqual(pending, {0: [[("b",)]], 1: [[("a",), ("b",)], [("b",)]]})
+
+
+class TestPrioritizedScoring(unittest.TestCase):
+    def test_scores_match_and_fewer_tests_run(self):
+        random.seed(5)
+        generations = [[[roman.random_input() for _ in range(3)] for _ in range(6)] for _ in range(3)]
+        scores, execution = {}, {}
+        with tempfile.TemporaryDirectory() as cache_dir, \
+                mock.patch.object(mutants, "MUTANTS_CACHE_DIR", cache_dir), \
+                mock.patch.object(mutants, "MUTATION_TOOL", "custom"), \
+                mock.patch.object(mutants, "_LOADED", {}), \
+                mock.patch.object(mutpy_runner, "MUTATION_TOOL", "custom"):
+            for prioritized in (False, True):
+                with mock.patch.object(mutpy_runner, "TEST_PRIORITIZATION", prioritized), \
+                        mock.patch.object(kill_matrix, "_MATRICES", {}), \
+                        mock.patch.object(kill_stats, "_STATS", {}), \
+                        mock.patch.object(kill_stats, "KILL_STATS_PATH", None):
+                    scores[prioritized] = [
+                        [r["mutation_score"] for r in mutpy_runner.run_mutation_tests_batch(roman.__name__, suites)]
+                        for suites in generations
+                    ]
+                    execution[prioritized] = mutpy_runner.execution_stats(roman.__name__)
+
+        self.assertEqual(scores[True], scores[False])
+        self.assertLess(execution[True]["executed_tests"], execution[False]["executed_tests"])
+        self.assertLess(execution[True]["tests_per_mutant"], execution[False]["tests_per_mutant"])
+
+
+if __name__ == "__main__":
+    unittest.main()
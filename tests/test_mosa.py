@@ -0,0 +1,52 @@
+import os
+import unittest
+from unittest import mock
+
+from ga import engine, mosa
+from mutation import mutants, mutpy_runner
+
+
+def _individual(distances, size=1):
+    return mosa._Individual(None, "x" * size, {m for m, d in distances.items() if d == 0}, distances)
+
+
+class TestPreferenceRanking(unittest.TestCase):
+    def test_closest_input_per_live_mutant_is_ranked_first(self):
+        population = [
+            _individual({1: 2, 2: 1}),
+            _individual({1: 1, 2: 2}),
+            _individual({1: 2, 2: 2}),
+            _individual({1: 1, 2: 1}, size=5),
+        ]
+        ranks = mosa._ranks(population, {1, 2}, len(population))
+        # The smaller of the two inputs that reach mutant 1 wins it; the all-2 input is dominated.
+        self.assertEqual(ranks[1], 0)
+        self.assertEqual(ranks[0], 0)
+        self.assertGreater(ranks[2], ranks[3])
+
+
+class TestArchiveSearch(unittest.TestCase):
+    def test_archive_suite_kills_what_the_archive_says(self):
+        with mock.patch.object(mutpy_runner, "MUTATION_TOOL", "custom"), \
+                mock.patch.object(mutants, "MUTATION_TOOL", "custom"):
+            result = engine.run_ga_for_problem(
+                "problems.problem_rotated_sort", population_size=8, num_generations=3, seed=2, search="mosa"
+            )
+            rescored = mutpy_runner.run_mutation_tests("problems.problem_rotated_sort", result["suite"], False)
+        self.assertEqual(result["search"], "mosa")
+        self.assertEqual(set(result["archive"]), set(rescored["killed_ids"]))
+        self.assertEqual(sorted(set(result["archive"].values())), list(range(len(result["suite"]))))
+        self.assertEqual(result["fitness_history"], sorted(result["fitness_history"]))
+        self.assertEqual(result["evaluations"], 8 * 4)
+
+    def test_falls_back_to_scalar_ga_without_per_mutant_results(self):
+        with mock.patch.dict(os.environ, {"EVOBUG_MUTPY": "0"}):
+            result = engine.run_ga_for_problem(
+                "problems.problem_two_sum", population_size=4, num_generations=2, seed=1, search="mosa"
+            )
+        self.assertNotIn("search", result)
+        self.assertIn("best_fitness", result)
+
+
+if __name__ == "__main__":
+    unittest.main()
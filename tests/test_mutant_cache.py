@@ -0,0 +1,166 @@
+import inspect
+import os
+import tempfile
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import problems.problem_reverse_string as reverse_string
+import problems.problem_two_sum as two_sum
+from mutation import executor, kill_matrix, mutants, mutpy_runner
+from mutation.kill_matrix import KillMatrix
+
+
+def _handmade_mutants():
+    source = inspect.getsource(reverse_string)
+    return [
+        {"id": 0, "operator": "SIR", "lineno": 36, "source": source.replace("return s[::-1]", "return s")},
+        {"id": 1, "operator": "SIR", "lineno": 36, "source": source.replace("return s[::-1]", "return s[::1]")},
+        {"id": 2, "operator": "XXX", "lineno": 36, "source": source.replace("return s[::-1]", "return s[::-1] +")},
+        {"id": 3, "operator": "COI", "lineno": 36, "source": source.replace("return s[::-1]", "return s[::-1][::1]")},
+    ]
+
+
+class TestMutantCache(unittest.TestCase):
+    def test_generated_once_then_loaded_from_disk(self):
+        with tempfile.TemporaryDirectory() as cache_dir, \
+                mock.patch.object(mutants, "MUTANTS_CACHE_DIR", cache_dir), \
+                mock.patch.object(mutants, "_LOADED", {}), \
+                mock.patch.object(mutants, "_mutpy_operators", return_value=[]), \
+                mock.patch.object(mutants, "_generate_with_mutpy", return_value=_handmade_mutants()) as gen:
+            first = mutants.load_mutants("problems.problem_reverse_string")
+            self.assertTrue(os.path.exists(first["path"]))
+            mutants._LOADED.clear()
+            second = mutants.load_mutants("problems.problem_reverse_string")
+            self.assertEqual(gen.call_count, 1)
+            self.assertEqual(first["mutants"], second["mutants"])
+
+    def test_key_changes_with_operator_set(self):
+        self.assertNotEqual(
+            mutants.cache_key(reverse_string, ["AOR"]),
+            mutants.cache_key(reverse_string, ["AOR", "ROR"]),
+        )
+
+
+class TestKillMatrix(unittest.TestCase):
+    def setUp(self):
+        self.mutant_set = {"key": "test", "mutants": _handmade_mutants()}
+
+    def test_run_matrix_rows(self):
+        tests = [("abc",), ("",)]
+        expected = [reverse_string.target_function(*t) for t in tests]
+        result = executor.run_matrix("problems.problem_reverse_string", self.mutant_set, tests, expected)
+        self.assertEqual(result["rows"], [[0, 1], []])
+        self.assertEqual(result["incompetent"], [2])
+
+    def test_suite_score_is_union_of_memoized_rows(self):
+        matrix = KillMatrix(self.mutant_set)
+        tests = [("abc",), ("aa",)]
+        expected = [reverse_string.target_function(*t) for t in tests]
+        matrix.add_rows(tests, executor.run_matrix("problems.problem_reverse_string", self.mutant_set, tests, expected))
+
+        self.assertEqual(matrix.missing([("aa",), ("abc",), ("x",), ("x",)]), [("x",)])
+        stats = matrix.score([("aa",), ("abc",)])
+        self.assertEqual(stats["killed_ids"], [0, 1])
+        self.assertEqual(stats["per_test_killed"], [[], [0, 1]])
+        self.assertEqual(stats["mutation_score"], 0.5)
+
+    def test_type_error_is_not_a_kill(self):
+        source = inspect.getsource(reverse_string)
+        broken = {"id": 0, "operator": "AOR", "lineno": 36, "source": source.replace("return s[::-1]", "return s + 1")}
+        tests = [("abc",), ("",)]
+        expected = [reverse_string.target_function(*t) for t in tests]
+        result = executor.run_matrix(
+            "problems.problem_reverse_string", {"key": "type-error", "mutants": [broken]}, tests, expected
+        )
+        self.assertEqual(result["rows"], [[], []])
+
+    def test_looping_mutant_is_killed_by_line_budget(self):
+        looping = {
+            "id": 0, "operator": "SIR", "lineno": None, "scope": "function",
+            "source": "def target_function(s):\n    while True:\n        pass\n",
+        }
+        tests = [("abc",), ("",)]
+        expected = [reverse_string.target_function(*t) for t in tests]
+        start = time.perf_counter()
+        with mock.patch.object(executor, "MUTANT_LINE_BUDGET", True):
+            result = executor.run_matrix(
+                "problems.problem_reverse_string", {"key": "looping", "mutants": [looping]}, tests, expected
+            )
+        # Well under the wall-clock backstop: the budget stopped it.
+        self.assertLess(time.perf_counter() - start, 0.1)
+        self.assertEqual(result["timeouts"], [[0], [0]])
+        self.assertEqual(result["rows"], [[0], [0]])
+
+    def test_slow_mutant_within_its_line_budget_survives(self):
+        # A load spike looks like this: same lines, more wall-clock time than the old 10x/0.1 s limit.
+        slow = {
+            "id": 0, "operator": "SIR", "lineno": None, "scope": "function",
+            "source": "def target_function(s):\n    import time\n    time.sleep(0.15)\n    return s[::-1]\n",
+        }
+        tests = [("abc",)]
+        expected = [reverse_string.target_function(*t) for t in tests]
+        with mock.patch.object(executor, "MUTANT_LINE_BUDGET", True):
+            result = executor.run_matrix(
+                "problems.problem_reverse_string", {"key": "slow", "mutants": [slow]}, tests, expected
+            )
+        self.assertEqual(result["timeouts"], [[]])
+        self.assertEqual(result["rows"], [[]])
+
+    def test_line_budget_is_calibrated_on_the_whole_cell(self):
+        tests = [([2, 7, 11, 15], 9)]
+        expected = [two_sum.target_function(*t) for t in tests]
+        with mock.patch.object(executor, "MUTANT_LINE_BUDGET", True), \
+                mock.patch.object(executor, "MUTANT_LINE_BUDGET_MIN", 0):
+            (_, call_events), = executor._baseline_runs("problems.problem_two_sum", tests, [object()], True)
+            (_, cell_events), = executor._baseline_runs("problems.problem_two_sum", tests, expected, True)
+            (limit, budget), = executor.cell_guards("problems.problem_two_sum", tests, expected)
+        # A wrong expected output stops at the comparison; the right one also runs the two-sum checks.
+        self.assertGreater(cell_events, call_events)
+        self.assertEqual(budget, executor.MUTANT_LINE_BUDGET_FACTOR * cell_events)
+        self.assertGreaterEqual(limit, executor._BACKSTOP_FLOOR_SECONDS)
+
+    def test_wall_clock_limit_holds_off_the_main_thread(self):
+        looping = {
+            "id": 0, "operator": "SIR", "lineno": None, "scope": "function",
+            "source": "def target_function(s):\n    while True:\n        pass\n",
+        }
+        tests = [("abc",)]
+        expected = [reverse_string.target_function(*t) for t in tests]
+        # No SIGALRM on a worker thread and no line budget: only the deadline can stop the mutant.
+        with mock.patch.object(executor, "MUTANT_LINE_BUDGET", False), ThreadPoolExecutor(1) as pool:
+            result = pool.submit(
+                executor.run_matrix,
+                "problems.problem_reverse_string", {"key": "looping-thread", "mutants": [looping]}, tests, expected,
+            ).result(timeout=10)
+        self.assertEqual(result["timeouts"], [[0]])
+
+
+class TestBatchScoring(unittest.TestCase):
+    def test_batch_matches_one_call_per_suite(self):
+        suites = [[("abc",)], [("aa",), ("abc",)], [("",)]]
+        with tempfile.TemporaryDirectory() as cache_dir, \
+                mock.patch.object(mutants, "MUTANTS_CACHE_DIR", cache_dir), \
+                mock.patch.object(mutants, "_LOADED", {}), \
+                mock.patch.object(mutants, "_mutpy_operators", return_value=[]), \
+                mock.patch.object(mutants, "_generate_with_mutpy", return_value=_handmade_mutants()):
+            with mock.patch.object(kill_matrix, "_MATRICES", {}):
+                batch = mutpy_runner.run_mutation_tests_batch("problems.problem_reverse_string", suites, False)
+            with mock.patch.object(kill_matrix, "_MATRICES", {}):
+                single = [mutpy_runner.run_mutation_tests("problems.problem_reverse_string", s, False) for s in suites]
+        self.assertEqual(batch, single)
+        self.assertEqual(batch[1]["per_test_killed"], [[], [0, 1]])
+
+    def test_batch_records_ignore_type_errors(self):
+        records = [["m1", 0, "AssertionError"], ["m2", 0, "TypeError"], ["m2", 1, "ZeroDivisionError"]]
+        self.assertEqual(mutpy_runner._batch_killers(records, 2), [{"m1"}, {"m2"}])
+
+    def test_report_counts_timeouts_but_not_incompetent_mutants(self):
+        report = {"mutants": [{"status": "killed"}, {"status": "timeout"}, {"status": "incompetent"}, {"status": "survived"}]}
+        result = mutpy_runner._report_result("problems.problem_reverse_string", [("abc",)], report)
+        self.assertEqual((result["killed"], result["total"]), (2, 4))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import inspect
+import tempfile
+import unittest
+from unittest import mock
+
+import problems.problem_reverse_string as reverse_string
+from mutation import mutants, reduction
+
+
+def _mutants():
+    source = inspect.getsource(reverse_string)
+    return [
+        {"id": 0, "operator": "SIR", "lineno": 36, "source": source.replace("return s[::-1]", "return s")},
+        # Same bytecode as the original.
+        {"id": 1, "operator": "XXX", "lineno": 36, "source": source.replace("return s[::-1]", "return (s[::-1])")},
+        {"id": 2, "operator": "XXX", "lineno": 36, "source": source.replace("return s[::-1]", "return s[::-1] +")},
+        {"id": 3, "operator": "SIR", "lineno": 36, "source": source.replace("return s[::-1]", "return (s)")},
+        {"id": 4, "operator": "XXX", "lineno": 36, "source": source.replace("return s[::-1]", "return s[::-1][::1]")},
+    ]
+
+
+class TestReduction(unittest.TestCase):
+    def test_removes_stillborn_equivalent_and_duplicates(self):
+        kept, report = reduction.reduce_mutants("problems.problem_reverse_string", "reduction-test", _mutants())
+
+        self.assertEqual([m["id"] for m in kept], [0, 4])
+        self.assertEqual(report["removed"], {"stillborn": 1, "equivalent": 1, "duplicate": 1})
+        self.assertEqual(report["removed_ids"]["stillborn"], [2])
+        self.assertEqual(report["removed_ids"]["equivalent"], [1])
+        self.assertEqual(report["duplicate_of"], {"3": 0})
+        self.assertEqual(report["likely_equivalent_ids"], [4])
+        self.assertTrue(kept[1]["likely_equivalent"])
+
+    def test_can_drop_likely_equivalent(self):
+        with mock.patch.object(reduction, "MUTANT_REDUCTION_DROP_LIKELY_EQUIVALENT", True):
+            kept, report = reduction.reduce_mutants("problems.problem_reverse_string", "reduction-drop", _mutants())
+        self.assertEqual([m["id"] for m in kept], [0])
+        self.assertEqual(report["removed"]["likely_equivalent"], 1)
+
+    def test_corpus_leaves_global_rng_untouched(self):
+        import random
+
+        random.seed(7)
+        expected = random.random()
+        random.seed(7)
+        reduction._corpus(reverse_string, 5, 0)
+        self.assertEqual(random.random(), expected)
+
+    def test_reduced_set_is_cached(self):
+        with tempfile.TemporaryDirectory() as cache_dir, \
+                mock.patch.object(mutants, "MUTANTS_CACHE_DIR", cache_dir), \
+                mock.patch.object(mutants, "MUTANT_REDUCTION", True), \
+                mock.patch.object(mutants, "_LOADED", {}), \
+                mock.patch.object(mutants, "_mutpy_operators", return_value=[]), \
+                mock.patch.object(mutants, "_generate_with_mutpy", return_value=_mutants()):
+            first = mutants.load_mutants("problems.problem_reverse_string", tool="mutpy")
+            mutants._LOADED.clear()
+            with mock.patch.object(reduction, "reduce_mutants", side_effect=AssertionError):
+                second = mutants.load_mutants("problems.problem_reverse_string", tool="mutpy")
+            mutants._LOADED.clear()
+            from_file = mutants.load_mutant_set_file(second["path"], "problems.problem_reverse_string")
+        self.assertEqual(first["mutants"], second["mutants"])
+        self.assertEqual(second["reduction"]["kept"], 2)
+        self.assertEqual(from_file["key"], second["key"])
+        self.assertEqual(from_file["mutants"], second["mutants"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+import problems.problem_reverse_string as reverse_string
+from mutation import harness, mutpy_runner
+
+NAME = reverse_string.__name__
+
+
+def _run_harness(env):
+    return subprocess.run(
+        [sys.executable, "-m", "unittest", "-v", harness.MODULE_NAME],
+        env=env, capture_output=True, text=True, timeout=60,
+    )
+
+
+class TestStaticHarness(unittest.TestCase):
+    def test_payload_drives_generated_tests(self):
+        tests = [("abc",), ("",), (123,)]
+        expected = mutpy_runner._baseline_outputs(reverse_string, tests)
+        expected[1] = "wrong"
+        module_name, payload_path, env = mutpy_runner._write_temp_tests(NAME, tests, expected)
+        try:
+            proc = _run_harness(env)
+        finally:
+            os.remove(payload_path)
+        self.assertEqual(module_name, harness.MODULE_NAME)
+        self.assertIn("Ran 3 tests", proc.stderr)
+        self.assertIn("FAIL: test_case_1", proc.stderr)
+        self.assertIn("failures=1", proc.stderr)
+
+    def test_batch_failures_are_recorded_per_suite(self):
+        suites = [[("abc",)], [("ab",), ("x",)]]
+        expected = [mutpy_runner._baseline_outputs(reverse_string, tests) for tests in suites]
+        expected[1][0] = "ab"
+        record_path = harness.scratch_file("record_", ".jsonl")
+        _, payload_path, env = mutpy_runner._write_batch_tests(NAME, suites, expected, record_path)
+        try:
+            proc = _run_harness(env)
+            with open(record_path) as f:
+                records = [json.loads(line) for line in f]
+        finally:
+            os.remove(payload_path)
+            os.remove(record_path)
+        self.assertEqual(proc.returncode, 0, proc.stderr)
+        self.assertIn("Ran 3 tests", proc.stderr)
+        self.assertEqual([(suite, exc) for _, suite, exc in records], [(1, "AssertionError")])
+
+    def test_workspace_is_reused(self):
+        self.assertEqual(harness.workspace(), harness.workspace())
+        self.assertTrue(os.path.exists(os.path.join(harness.workspace(), f"{harness.MODULE_NAME}.py")))
+
+
+if __name__ == "__main__":
+    unittest.main()
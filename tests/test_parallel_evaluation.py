@@ -0,0 +1,31 @@
+import random
+import unittest
+
+import problems.problem_two_sum as two_sum
+from ga.evaluation import evaluate_population, evaluation_pool
+from ga.fitness_cache import FitnessCache
+
+
+class TestParallelEvaluation(unittest.TestCase):
+    def _population(self):
+        random.seed(11)
+        population = [two_sum.random_input() for _ in range(6)]
+        return population + population[:2]  # duplicated genomes within one batch
+
+    def _evaluate(self, pool):
+        population = self._population()
+        random.seed(5)
+        cache = FitnessCache(db_path=None)
+        fitnesses = evaluate_population(population, "problems.problem_two_sum", two_sum.decode_individual, cache, pool)
+        return fitnesses, cache.stats(), random.random()
+
+    def test_pool_matches_serial_path(self):
+        serial = self._evaluate(None)
+        with evaluation_pool(2) as pool:
+            parallel = self._evaluate(pool)
+        self.assertEqual(serial, parallel)
+        self.assertEqual(serial[1]["hits"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import os
+import subprocess
+import tempfile
+import unittest
+from unittest import mock
+
+import problems.problem_reverse_string as reverse_string
+from mutation import executor, kill_matrix, mutants, mutpy_runner
+from tests.test_mutant_cache import _handmade_mutants
+
+NAME = "problems.problem_reverse_string"
+
+
+class TestMutantStream(unittest.TestCase):
+    def test_stream_rebuilds_run_matrix_result(self):
+        mutant_set = {"key": "stream", "mutants": _handmade_mutants()}
+        tests = [("abc",), ("",)]
+        expected = [reverse_string.target_function(*t) for t in tests]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "stream.jsonl")
+            result = executor.run_matrix(NAME, mutant_set, tests, expected, stream_path=path)
+            with open(path, "a") as f:
+                f.write('{"id": 9, "kil')  # torn line from a killed child
+            streamed = executor.read_stream(path, len(tests))
+        self.assertEqual(streamed["rows"], result["rows"])
+        self.assertEqual(streamed["incompetent"], result["incompetent"])
+        self.assertEqual(streamed["completed"], [0, 1, 2, 3])
+        self.assertEqual(streamed["evaluated"], [[0, 1, 2, 3], [0, 1, 2, 3]])
+
+
+class TestPartialScoring(unittest.TestCase):
+    def test_timed_out_run_is_scored_over_finished_mutants(self):
+        def _dies_after_two_mutants(name, mutant_set, tests, expected, timeout, mutant_ids, coverage, plan):
+            first_two = sorted(mutant_set["mutants"][i]["id"] for i in range(2))
+            fd, path = tempfile.mkstemp(suffix=".jsonl")
+            os.close(fd)
+            try:
+                executor.run_matrix(name, mutant_set, tests, expected, first_two, coverage, plan, path)
+                mutpy_runner._raise_partial("timeout", path, len(tests), subprocess.TimeoutExpired("child", timeout))
+            finally:
+                os.remove(path)
+
+        with tempfile.TemporaryDirectory() as cache_dir, \
+                mock.patch.object(mutants, "MUTANTS_CACHE_DIR", cache_dir), \
+                mock.patch.object(mutants, "_LOADED", {}), \
+                mock.patch.object(mutants, "_mutpy_operators", return_value=[]), \
+                mock.patch.object(mutants, "_generate_with_mutpy", return_value=_handmade_mutants()), \
+                mock.patch.object(kill_matrix, "_MATRICES", {}):
+            with mock.patch.object(mutpy_runner, "_compute_rows_in_child", _dies_after_two_mutants):
+                partial = mutpy_runner.run_mutation_tests(NAME, [("abc",), ("",)], False)
+            # The finished mutants were kept: only the rest run on the retry.
+            full = mutpy_runner.run_mutation_tests(NAME, [("abc",), ("",)], False)
+
+        self.assertTrue(partial["partial"])
+        self.assertEqual(partial["error"], "timeout")
+        self.assertGreater(partial["unknown"], 0)
+        self.assertLess(partial["completed_fraction"], 1.0)
+        self.assertEqual(partial["total"] + partial["unknown"], full["total"])
+        self.assertTrue(set(partial["killed_ids"]) <= set(full["killed_ids"]))
+        self.assertNotIn("partial", full)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import random
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from ga import engine, islands
+from ga.rng import derive_seed
+from mutation import kill_matrix, mutants, mutpy_runner
+
+PROBLEMS = ["problems.problem_supersequence", "problems.problem_rotated_sort", "problems.problem_two_sum"]
+
+
+class TestDerivedSeeds(unittest.TestCase):
+    def test_child_seeds_depend_only_on_parent_and_path(self):
+        self.assertEqual(derive_seed(7, "p", "run", 1), derive_seed(7, "p", "run", 1))
+        self.assertNotEqual(derive_seed(7, "p", "run", 1), derive_seed(7, "p", "run", 2))
+        self.assertNotEqual(derive_seed(7, "p", "run", 1), derive_seed(8, "p", "run", 1))
+        self.assertEqual(islands.island_seeds(7, 2), [derive_seed(7, "island", 0), derive_seed(7, "island", 1)])
+
+
+class TestConcurrentRuns(unittest.TestCase):
+    def _run(self, problem, seed):
+        result = engine.run_ga_for_problem(problem, population_size=6, num_generations=3, seed=seed, stopping=[])
+        # mutant_execution counts the work of the whole process, so it is left out.
+        return result["best_individual"], result["best_fitness"], result["fitness_history"], result["evaluated_inputs"]
+
+    def _runs(self, jobs, threads):
+        # Every batch starts from empty kill matrices, so the threads really run mutants side by side.
+        with mock.patch.dict(kill_matrix._MATRICES, clear=True):
+            if threads <= 1:
+                return [self._run(*job) for job in jobs]
+            with ThreadPoolExecutor(max_workers=threads) as pool:
+                return list(pool.map(lambda job: self._run(*job), jobs))
+
+    def test_threaded_runs_match_sequential_runs(self):
+        jobs = [(problem, seed) for problem in PROBLEMS for seed in (1, 2)]
+        with mock.patch.object(mutpy_runner, "MUTATION_TOOL", "custom"), \
+                mock.patch.object(mutants, "MUTATION_TOOL", "custom"):
+            global_state = random.getstate()
+            threaded = self._runs(jobs, len(jobs))
+            sequential = self._runs(jobs, 1)
+            self.assertEqual(random.getstate(), global_state)
+        self.assertEqual(threaded, sequential)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import tempfile
+import unittest
+from unittest import mock
+
+import problems.problem_supersequence as supersequence
+from ga import sampling as ga_sampling
+from mutation import ast_engine, kill_matrix, mutants, mutpy_runner, reduction, sampling
+
+
+_MUTANTS = []
+
+
+def _mutant_set():
+    if not _MUTANTS:
+        _MUTANTS.extend(ast_engine.generate_mutants(supersequence))
+    return {"key": "sampling-test", "mutants": list(_MUTANTS)}
+
+
+class TestStratifiedSample(unittest.TestCase):
+    def test_samples_are_nested_and_cover_every_operator(self):
+        mutant_set = _mutant_set()
+        small = sampling.stratified_sample(mutant_set, 10)
+        large = sampling.stratified_sample(mutant_set, 30)
+        operators = {m["operator"] for m in mutant_set["mutants"]}
+        by_id = {m["id"]: m for m in mutant_set["mutants"]}
+
+        self.assertLessEqual(len(small), 10 + len(operators))
+        self.assertTrue(set(small) <= set(large))
+        self.assertEqual({by_id[i]["operator"] for i in small}, operators)
+
+    def test_full_sample_estimate_is_exact(self):
+        mutant_set = _mutant_set()
+        ids = [m["id"] for m in mutant_set["mutants"]]
+        stats = sampling.estimate(mutant_set, ids, ids[::3])
+        self.assertAlmostEqual(stats["estimate"], len(ids[::3]) / len(ids))
+        self.assertAlmostEqual(stats["ci"][0], stats["ci"][1])
+
+    def test_partial_sample_interval_brackets_estimate(self):
+        mutant_set = _mutant_set()
+        ids = sampling.stratified_sample(mutant_set, 20)
+        stats = sampling.estimate(mutant_set, ids, ids[:7])
+        self.assertLess(stats["ci"][0], stats["estimate"])
+        self.assertGreater(stats["ci"][1], stats["estimate"])
+
+
+class TestSampledScoring(unittest.TestCase):
+    def test_sampled_kills_are_a_subset_of_full_kills(self):
+        suite = [("abc", "abd"), ("", "x")]
+        with tempfile.TemporaryDirectory() as cache_dir, \
+                mock.patch.object(mutants, "MUTANTS_CACHE_DIR", cache_dir), \
+                mock.patch.object(mutants, "MUTATION_TOOL", "custom"), \
+                mock.patch.object(mutants, "_LOADED", {}), \
+                mock.patch.object(mutpy_runner, "MUTATION_TOOL", "custom"), \
+                mock.patch.object(reduction, "MUTANT_REDUCTION_CORPUS_SIZE", 20), \
+                mock.patch.object(kill_matrix, "_MATRICES", {}):
+            mutant_set = mutpy_runner._load_mutant_set("problems.problem_supersequence")
+            ids = sampling.stratified_sample(mutant_set, 15)
+            sampled = mutpy_runner.run_mutation_tests("problems.problem_supersequence", suite, False, ids)
+            batch = mutpy_runner.run_mutation_tests_batch("problems.problem_supersequence", [suite], False, ids)
+            full = mutpy_runner.run_mutation_tests("problems.problem_supersequence", suite, False)
+
+        self.assertTrue(sampled["sampled"])
+        self.assertEqual(sampled["total"], len(ids))
+        self.assertEqual(set(sampled["killed_ids"]), set(full["killed_ids"]) & set(ids))
+        self.assertLessEqual(sampled["ci"][0], sampled["mutation_score"])
+        self.assertEqual(batch, [sampled])
+
+
+class TestFitnessSampler(unittest.TestCase):
+    def _sampler(self):
+        with mock.patch.object(mutpy_runner, "_load_mutant_set", return_value=_mutant_set()):
+            return ga_sampling.FitnessSampler("problems.problem_supersequence", fraction=0.25)
+
+    def test_grows_when_population_converges(self):
+        sampler = self._sampler()
+        before = len(sampler.ids)
+        self.assertTrue(sampler.update(0, [0.5] * 10))
+        self.assertGreater(len(sampler.ids), before)
+        self.assertEqual(sampler.growth_generations, [0])
+
+    def test_keeps_sample_when_scores_are_well_separated(self):
+        sampler = self._sampler()
+        self.assertFalse(sampler.update(0, [0.0, 1.0]))
+
+    def test_reaches_full_set(self):
+        sampler = self._sampler()
+        for gen in range(10):
+            sampler.update(gen, [0.5] * 10)
+        self.assertFalse(sampler.active)
+        self.assertEqual(sampler.variant(), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+from unittest import mock
+
+from ga import engine, stopping
+from mutation import mutants, mutpy_runner
+
+
+def _state(best_history, evaluations=0, next_cost=0, exact=True, elapsed=0.0):
+    return stopping.SearchState(len(best_history) - 1, best_history, exact, elapsed, evaluations, next_cost)
+
+
+class TestRules(unittest.TestCase):
+    def test_each_rule_fires_on_its_condition(self):
+        self.assertTrue(stopping.MaxScore(1.0)(_state([0.5, 1.0])))
+        self.assertFalse(stopping.MaxScore(1.0)(_state([0.5, 1.0], exact=False)))
+        self.assertTrue(stopping.Stagnation(2)(_state([0.3, 0.5, 0.5, 0.5])))
+        self.assertFalse(stopping.Stagnation(2)(_state([0.3, 0.4, 0.5, 0.5])))
+        self.assertTrue(stopping.Deadline(5)(_state([0.1], elapsed=6.0)))
+        self.assertTrue(stopping.MaxEvaluations(50)(_state([0.1], evaluations=45, next_cost=10)))
+        self.assertFalse(stopping.MaxEvaluations(50)(_state([0.1], evaluations=40, next_cost=10)))
+
+    def test_first_rule_that_fires_is_the_reason(self):
+        rules = [stopping.MaxScore(1.0), stopping.Stagnation(1), stopping.Deadline(0)]
+        self.assertEqual(stopping.should_stop(rules, _state([0.5, 0.5])), "stagnation")
+        self.assertIsNone(stopping.should_stop([], _state([0.5, 0.5])))
+
+    def test_no_rule_is_on_by_default(self):
+        self.assertEqual(stopping.default_rules(), [])
+
+    def test_islands_share_an_evaluation_cap(self):
+        rules = stopping.split_rules([stopping.MaxEvaluations(10), stopping.Stagnation(3)], 3)
+        self.assertEqual(rules[0].cap, 4)
+        self.assertIsInstance(rules[1], stopping.Stagnation)
+
+
+class TestStoppingRun(unittest.TestCase):
+    def _run(self, rules, generations=8):
+        with mock.patch.object(mutpy_runner, "MUTATION_TOOL", "custom"), \
+                mock.patch.object(mutants, "MUTATION_TOOL", "custom"), \
+                mock.patch.object(engine, "FITNESS_CACHE_ENABLED", False):
+            return engine.run_ga_for_problem(
+                "problems.problem_dup_digits", population_size=6, num_generations=generations, seed=3, stopping=rules
+            )
+
+    def test_evaluation_cap_is_never_exceeded(self):
+        result = self._run([stopping.MaxEvaluations(15)])
+        self.assertEqual(result["stopping"]["reason"], "max_evaluations")
+        self.assertLessEqual(result["evaluations"], 15)
+        self.assertEqual(result["evaluations"], result["evaluation_budget"]["suites"])
+        self.assertEqual(len(result["fitness_history"]), result["stopping"]["generations"])
+
+    def test_unstopped_run_uses_every_generation(self):
+        result = self._run([], generations=3)
+        self.assertIsNone(result["stopping"]["reason"])
+        self.assertEqual(len(result["fitness_history"]), 3)
+        # Three populations, none bred after the last recorded generation.
+        self.assertEqual(result["fitness_reuse"]["individuals"], 6 * 3)
+        self.assertLessEqual(result["evaluations"], 6 * 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
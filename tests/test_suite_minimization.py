@@ -0,0 +1,41 @@
+import random
+import unittest
+from unittest import mock
+
+import problems.problem_rotated_sort as rotated_sort
+from mutation import minimization, mutants, mutpy_runner
+
+
+class TestSetCover(unittest.TestCase):
+    def test_exact_cover_beats_greedy(self):
+        rows = [
+            frozenset(range(1, 8)),
+            frozenset(range(8, 15)),
+            frozenset({1, 2, 3, 4, 8, 9, 10, 11}),
+            frozenset({5, 6, 12, 13}),
+            frozenset({7, 14}),
+        ]
+        greedy = minimization.greedy_cover(rows)
+        self.assertEqual(greedy, [2, 3, 4])
+        self.assertEqual(minimization.exact_cover(rows, greedy), ([0, 1], True))
+        # Out of nodes: the best cover so far is returned, not claimed optimal.
+        self.assertEqual(minimization.exact_cover(rows, greedy, node_limit=1), (greedy, False))
+
+
+class TestMinimizeSuite(unittest.TestCase):
+    def test_minimized_suite_keeps_the_kill_set(self):
+        random.seed(3)
+        inputs = [rotated_sort.random_input() for _ in range(40)]
+        with mock.patch.object(mutpy_runner, "MUTATION_TOOL", "custom"), \
+                mock.patch.object(mutants, "MUTATION_TOOL", "custom"):
+            result = minimization.minimize_suite(rotated_sort.__name__, inputs)
+            everything = mutpy_runner.run_mutation_tests(rotated_sort.__name__, inputs)
+            minimized = mutpy_runner.run_mutation_tests(rotated_sort.__name__, result["inputs"], False)
+        self.assertEqual(result["killed_ids"], everything["killed_ids"])
+        self.assertEqual(minimized["killed_ids"], everything["killed_ids"])
+        self.assertLessEqual(result["size"], result["greedy_size"])
+        self.assertLess(result["size"], result["candidates"])
+
+
+if __name__ == "__main__":
+    unittest.main()
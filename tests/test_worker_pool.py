@@ -0,0 +1,49 @@
+import inspect
+import os
+import pickle
+import tempfile
+import unittest
+
+import problems.problem_reverse_string as reverse_string
+from mutation.worker_pool import WorkerCrashed, WorkerPool
+
+
+class TestWorkerPool(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        source = inspect.getsource(reverse_string)
+        mutants = [
+            {"id": 0, "operator": "SIR", "lineno": 36, "source": source.replace("return s[::-1]", "return s")},
+            {"id": 1, "operator": "COI", "lineno": 36, "source": source.replace("return s[::-1]", "return s[::-1][::1]")},
+        ]
+        self.mutant_path = os.path.join(self.tmp.name, "problems_problem_reverse_string_abc123.pkl")
+        with open(self.mutant_path, "wb") as f:
+            pickle.dump(mutants, f)
+        self.pool = WorkerPool(size=1, max_tasks=2)
+
+    def tearDown(self):
+        self.pool.shutdown()
+        self.tmp.cleanup()
+
+    def _payload(self, text, mutant_path=None):
+        return {
+            "problem": "problems.problem_reverse_string",
+            "mutant_path": mutant_path or self.mutant_path,
+            "tests": [(text,)],
+            "expected": [text[::-1]],
+        }
+
+    def test_tasks_reuse_and_recycle_workers(self):
+        for text in ("ab", "cd", "ef"):
+            result = self.pool.run(self._payload(text), timeout=30)
+            self.assertEqual(result["rows"], [[0]])
+        self.assertEqual(self.pool.restarts, 1)  # recycled after max_tasks=2
+
+    def test_worker_error_is_reported_and_pool_keeps_serving(self):
+        with self.assertRaises(WorkerCrashed):
+            self.pool.run(self._payload("ab", mutant_path=os.path.join(self.tmp.name, "missing_x.pkl")), timeout=30)
+        self.assertEqual(self.pool.run(self._payload("ab"), timeout=30)["rows"], [[0]])
+
+
+if __name__ == "__main__":
+    unittest.main()